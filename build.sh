@@ -4,10 +4,12 @@ DO_TEST=false
 DO_LINT=false
 DO_RUN=false
 DO_CLEAN=false
+DO_BENCH=false
+SAVE_BASELINE=false
 EXCLUDE_COVERAGE=false
 
 usage() {
-    echo "Usage: $0 [--test|-t] [--lint|-l] [--run|-r] [--clean|-c] [--all|-a]"
+    echo "Usage: $0 [--test|-t] [--lint|-l] [--bench|-b] [--save-baseline] [--run|-r] [--clean|-c] [--all|-a]"
     exit 1
 }
 
@@ -17,6 +19,8 @@ while [[ "$#" -gt 0 ]]; do
         --lint|-l) DO_LINT=true ;;
         --run|-r) DO_RUN=true ;;
         --clean|-c) DO_CLEAN=true ;;
+        --bench|-b) DO_BENCH=true ;;
+        --save-baseline) DO_BENCH=true; SAVE_BASELINE=true ;;
         --no-coverage) EXCLUDE_COVERAGE=true ;;
         ## All skips clean so that the last output is the program output 
         --all|-a) DO_TEST=true; DO_LINT=true; DO_RUN=true ;;
@@ -43,6 +47,17 @@ execute_lint() {
     return $?
 }
 
+execute_bench() {
+    cd "$script_dir/src"
+    ## Fails on any benchmark slower than the stored baseline by more than the threshold
+    if $SAVE_BASELINE; then 
+        python3 -m benchmarks.suite --save
+    else 
+        python3 -m benchmarks.suite --compare
+    fi 
+    return $?
+}
+
 execute_run() {
     ## Ignoring arguments, no real value to passing them. Use config file instead. 
     python3 ${script_dir}/src/main.py ${script_dir}/config/main.ini
@@ -82,6 +97,13 @@ if $DO_TEST; then
     execute_test || fail_and_exit "[ERROR] Test Execution Failed"
 fi
 
+if $DO_BENCH; then
+    echo ""
+    echo "-- Running Benchmarks --" 
+    echo "" 
+    execute_bench || fail_and_exit "[ERROR] Benchmark Regression"
+fi
+
 if $DO_RUN; then
     echo ""
     echo "-- Running Program --" 
@@ -0,0 +1 @@
+"""Performance benchmarks, run from src: python -m benchmarks.<module>"""
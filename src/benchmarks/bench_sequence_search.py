@@ -0,0 +1,98 @@
+"""
+	Scaling of the scalar SequenceSearcher full search against the NumPy engine.
+
+	Boards are filled with a pattern that never holds 3 in a row so every
+	search has to scan the whole board (worst case).
+
+	Usage (from src): python -m benchmarks.bench_sequence_search [--sizes 10 100 1000]
+"""
+import argparse
+import time
+import numpy as np
+from game.sequence_searcher import SequenceSearcher
+from game.tictactoe import TicTacToeGB, TicTacToeMove
+from game.vectorized_searcher import NumpySequenceSearcher
+
+PLAYERS = ('X', 'O')
+SEQUENCE_NUM = 5
+DEFAULT_SIZES = (10, 30, 100, 300, 1000)
+DEFAULT_MAX_SCALAR_SIZE = 100
+
+
+def no_win_array(size: int) -> np.ndarray:
+	""" Fully occupied board where the longest run in any direction is 2 """
+	rows, columns = np.mgrid[0:size, 0:size]
+	return ((columns // 2 + rows) % 2 + 1).astype(np.int32)
+
+
+def no_win_board(size: int) -> TicTacToeGB:
+	# A sequence longer than the board so that filling it never ends the game
+	gb = TicTacToeGB(**{
+		TicTacToeGB.BOARD_SIZE_OVERRIDE: size,
+		TicTacToeGB.SEQUENCE_NUM: size + 1,
+	})
+	gb.initialize()
+	array = no_win_array(size)
+	for y in range(size):
+		for x in range(size):
+			gb.update_board_with_move(TicTacToeMove(x, y, PLAYERS[array[y, x] - 1]))
+	return gb
+
+
+def time_call(func, repeat: int) -> float:
+	""" Best of repeat wall times in seconds """
+	best = float('inf')
+	for _ in range(repeat):
+		start = time.perf_counter()
+		func()
+		best = min(best, time.perf_counter() - start)
+	return best
+
+
+def run(sizes, max_scalar_size: int, repeat: int) -> list:
+	scalar = SequenceSearcher(SEQUENCE_NUM)
+	vectorized = NumpySequenceSearcher(SEQUENCE_NUM)
+	results = []
+	for size in sizes:
+		array = no_win_array(size)
+		row = {
+			'size': size,
+			'numpy_array_s': time_call(lambda: vectorized.search(**{
+				NumpySequenceSearcher.SEARCH_ARRAY: array}), repeat),
+			'numpy_board_s': None,
+			'scalar_board_s': None,
+		}
+		if size <= max_scalar_size:
+			gb = no_win_board(size)
+			board_kwargs = {SequenceSearcher.SEARCH_GAME_BOARD: gb}
+			row['numpy_board_s'] = time_call(lambda: vectorized.search(**board_kwargs), repeat)
+			row['scalar_board_s'] = time_call(lambda: scalar.search(**board_kwargs), repeat)
+		results.append(row)
+	return results
+
+
+def format_results(results: list) -> str:
+	def fmt(value):
+		return f'{value * 1000:12.3f}' if value is not None else f'{"-":>12}'
+	lines = [f'{"size":>6} {"numpy arr ms":>12} {"numpy gb ms":>12} {"scalar gb ms":>12} {"speedup":>8}']
+	for row in results:
+		speedup = '-'
+		if row['scalar_board_s'] is not None:
+			speedup = f'{row["scalar_board_s"] / row["numpy_board_s"]:.1f}x'
+		lines.append(f'{row["size"]:>6} {fmt(row["numpy_array_s"])} '
+					 f'{fmt(row["numpy_board_s"])} {fmt(row["scalar_board_s"])} {speedup:>8}')
+	return '\n'.join(lines)
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+	parser.add_argument('--max-scalar-size', type=int, default=DEFAULT_MAX_SCALAR_SIZE,
+						help='largest board built and searched through TicTacToeGB')
+	parser.add_argument('--repeat', type=int, default=3)
+	args = parser.parse_args()
+	print(format_results(run(args.sizes, args.max_scalar_size, args.repeat)))
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,214 @@
+"""
+	Hot path benchmark suite: sequence search, board updates, ruleset checks
+	and complete games, at board sizes from 3x3 to 1000x1000.
+
+	Every result is the best of --repeat runs, in seconds per operation.
+	--save writes the results as a baseline, --compare checks them against
+	one and exits non zero if any benchmark is slower than the baseline by
+	more than --threshold (a fraction, 0.25 = 25%). Baselines are machine
+	specific, regenerate benchmarks/baseline.json when the hardware changes.
+
+	Usage (from src):
+		python -m benchmarks.suite [--sizes 3 10 100 1000] [--save [FILE] | --compare [FILE]]
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+from typing import Callable, Dict, List, Optional
+from game.interfaces import Player
+from game.sequence_searcher import SequenceSearcher
+from game.tictactoe import StupidAI, TicTacToe, TicTacToeGB, TicTacToeLocation, TicTacToeMove, \
+	TicTacToeRuleset
+
+DEFAULT_SIZES = (3, 10, 100, 1000)
+DEFAULT_MAX_FULL_SEARCH_SIZE = 100
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_BASELINE = 'benchmarks/baseline.json'
+PLAYERS = ('X', 'O')
+# Operations timed per run for the per call benchmarks
+UPDATE_MOVES = 5000
+RULESET_CHECKS = 20000
+LOCAL_SEARCHES = 2000
+SLOW_CALL_SECONDS = 1.0
+
+
+def sequence_for(size: int) -> int:
+	return 3 if size <= 3 else 5
+
+
+def build_board(size: int, seq_num: Optional[int] = None) -> TicTacToeGB:
+	gb = TicTacToeGB(**{
+		TicTacToeGB.BOARD_SIZE_OVERRIDE: size,
+		TicTacToeGB.SEQUENCE_NUM: seq_num or sequence_for(size),
+	})
+	gb.initialize()
+	return gb
+
+
+def no_win_moves(size: int, limit: Optional[int] = None) -> List[TicTacToeMove]:
+	""" Row major moves of a pattern whose longest run in any direction is 2 """
+	moves = []
+	for y in range(size):
+		for x in range(size):
+			if limit is not None and len(moves) >= limit:
+				return moves
+			moves.append(TicTacToeMove(x, y, PLAYERS[(x // 2 + y) % 2]))
+	return moves
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+	"""
+		Best of repeat runs, each long enough (timeit autorange, >= 0.2s) for
+		timer and scheduler noise not to matter. return seconds per call
+	"""
+	timer = timeit.Timer(func)
+	number, elapsed = timer.autorange()
+	if elapsed > SLOW_CALL_SECONDS * number:
+		# Calls this slow are timed once, their noise is already small
+		return elapsed / number
+	return min(timer.repeat(repeat, number)) / number
+
+
+def bench_update_board(size: int, repeat: int) -> float:
+	moves = no_win_moves(size, UPDATE_MOVES)
+	# Small boards are filled several times so every size times about UPDATE_MOVES moves
+	rounds = -(-UPDATE_MOVES // len(moves))
+	gb = build_board(size, size + 1)
+	def fill():
+		result = None
+		for _ in range(rounds):
+			gb.reset()
+			for move in moves:
+				result = gb.update_board_with_move(move, result)
+	return best_time(fill, repeat) / (rounds * len(moves))
+
+
+def bench_ruleset(size: int, repeat: int) -> float:
+	rules = TicTacToeRuleset(size)
+	moves = [TicTacToeMove(i % (size + 2) - 1, i % size, 'X') for i in range(RULESET_CHECKS)]
+	def check():
+		for move in moves:
+			rules.is_legal_move(move)
+	return best_time(check, repeat) / len(moves)
+
+
+def bench_local_search(size: int, repeat: int) -> float:
+	gb = build_board(size, size + 1)
+	moves = no_win_moves(size, LOCAL_SEARCHES)
+	for move in moves:
+		gb.update_board_with_move(move)
+	searcher = SequenceSearcher(sequence_for(size), **{SequenceSearcher.LOCAL_SEARCH_ONLY: True})
+	starts = [TicTacToeLocation(move.get_x(), move.get_y(), move.get_name()) for move in moves]
+	def search():
+		for start in starts:
+			searcher.search(**{SequenceSearcher.SEARCH_GAME_BOARD: gb,
+							   SequenceSearcher.SEARCH_START_LOCATION: start})
+	return best_time(search, repeat) / len(starts)
+
+
+def bench_full_search(size: int, repeat: int) -> float:
+	gb = build_board(size, size + 1)
+	for move in no_win_moves(size):
+		gb.update_board_with_move(move)
+	searcher = SequenceSearcher(sequence_for(size))
+	return best_time(lambda: searcher.search(**{SequenceSearcher.SEARCH_GAME_BOARD: gb}), repeat)
+
+
+def bench_full_game(size: int, repeat: int) -> float:
+	""" One seeded StupidAI game, so every run plays the same moves """
+	gb = build_board(size)
+	def play():
+		players = [StupidAI(**{Player.NAME: name, StupidAI.GAME_BOARD: gb, StupidAI.SEED: seat})
+				   for seat, name in enumerate(PLAYERS)]
+		# run_batch resets the board in place before the game
+		TicTacToe(players, gb).run_batch(1)
+	return best_time(play, repeat)
+
+
+BENCHMARKS: Dict[str, Callable[[int, int], float]] = {
+	'update_board_with_move': bench_update_board,
+	'ruleset_is_legal_move': bench_ruleset,
+	'sequence_search_local': bench_local_search,
+	'sequence_search_full': bench_full_search,
+	'full_game': bench_full_game,
+}
+
+
+def run(sizes: List[int], repeat: int, max_full_search_size: int, only: Optional[List[str]] = None) -> dict:
+	""" return {benchmark name: {size (str, for JSON): seconds per operation}} """
+	results = {}
+	for name, bench in BENCHMARKS.items():
+		if only and name not in only:
+			continue
+		results[name] = {}
+		for size in sizes:
+			if name == 'sequence_search_full' and size > max_full_search_size:
+				continue
+			results[name][str(size)] = bench(size, repeat)
+	return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+	""" return a line per benchmark slower than baseline * (1 + threshold) """
+	regressions = []
+	for name, sizes in results.items():
+		for size, seconds in sizes.items():
+			before = baseline.get(name, {}).get(size)
+			if before and seconds > before * (1 + threshold):
+				regressions.append(f'{name} @ {size}x{size}: {before * 1e6:.2f}us -> {seconds * 1e6:.2f}us '
+								   f'(+{(seconds / before - 1) * 100:.0f}%)')
+	return regressions
+
+
+def format_results(results: dict, baseline: Optional[dict] = None) -> str:
+	lines = [f'{"benchmark":<24} {"size":>6} {"us/op":>14} {"baseline":>14} {"change":>8}']
+	for name, sizes in results.items():
+		for size, seconds in sizes.items():
+			before = (baseline or {}).get(name, {}).get(size)
+			reference = f'{before * 1e6:14.2f}' if before else f'{"-":>14}'
+			change = f'{(seconds / before - 1) * 100:+7.0f}%' if before else f'{"-":>8}'
+			lines.append(f'{name:<24} {size:>6} {seconds * 1e6:14.2f} {reference} {change}')
+	return '\n'.join(lines)
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+	parser.add_argument('--repeat', type=int, default=5)
+	parser.add_argument('--max-full-search-size', type=int, default=DEFAULT_MAX_FULL_SEARCH_SIZE,
+						help='largest board for the O(N^2) scalar full search')
+	parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help='benchmarks to run')
+	group = parser.add_mutually_exclusive_group()
+	group.add_argument('--save', metavar='FILE', nargs='?', const=DEFAULT_BASELINE,
+					   help=f'write the results as a baseline (default {DEFAULT_BASELINE})')
+	group.add_argument('--compare', metavar='FILE', nargs='?', const=DEFAULT_BASELINE,
+					   help=f'flag regressions against a baseline (default {DEFAULT_BASELINE})')
+	parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+	args = parser.parse_args()
+
+	results = run(args.sizes, args.repeat, args.max_full_search_size, args.only)
+	baseline = None
+	if args.compare:
+		with open(args.compare, encoding='utf-8') as source:
+			baseline = json.load(source)['results']
+	print(format_results(results, baseline))
+
+	if args.save:
+		with open(args.save, 'w', encoding='utf-8') as out:
+			json.dump({'python': platform.python_version(), 'machine': platform.machine(),
+					   'results': results}, out, indent=2, sort_keys=True)
+			out.write('\n')
+		print(f'Baseline written to {args.save}')
+	if baseline is not None:
+		regressions = compare(results, baseline, args.threshold)
+		if regressions:
+			print(f'\n{len(regressions)} regression(s) over {args.threshold:.0%}:')
+			print('\n'.join(regressions))
+			sys.exit(1)
+		print(f'\nNo regressions over {args.threshold:.0%}')
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,154 @@
+import asyncio
+from abc import abstractmethod
+from typing import Iterable, List, Optional
+from .interfaces import GameRunner, Move, Player
+
+MAX_CONCURRENCY = 'Max Concurrency'
+
+
+class AsyncPlayer(Player):
+	"""
+		Class: Player whose moves arrive asynchronously (remote clients, web
+		humans). Only usable from an AsyncGameRunner.
+	"""
+	@abstractmethod
+	async def get_move_async(self) -> Move:
+		pass
+
+	def get_move(self) -> Move:
+		raise RuntimeError(f'{type(self).__name__} only supports get_move_async, '
+						   'drive it with AsyncGameRunner')
+
+
+async def request_move(player: Player) -> Move:
+	"""
+		Awaits a move from any kind of player. Blocking players are moved to
+		the loop's default thread pool so they cannot stall other games; a
+		timed out or cancelled blocking call keeps its thread until it returns.
+	"""
+	if isinstance(player, AsyncPlayer):
+		return await player.get_move_async()
+	if player.BLOCKING_GET_MOVE:
+		return await asyncio.get_running_loop().run_in_executor(None, player.get_move)
+	return player.get_move()
+
+
+class AsyncGameResult:
+	COMPLETED = 'Completed'
+	FORFEIT = 'Forfeit'
+	MOVE_TIMEOUT = 'Move Timeout'
+	GAME_TIMEOUT = 'Game Timeout'
+	CANCELLED = 'Cancelled'
+	ERROR = 'Error'
+
+	def __init__(self, status: str, runner: GameRunner, player: Optional[Player] = None,
+				 error: Optional[BaseException] = None):
+		"""
+			player: for FORFEIT and MOVE_TIMEOUT, the player at fault
+		"""
+		self.status = status
+		self.winner = runner.get_winner()
+		self.is_tie = status == self.COMPLETED and runner.is_tie()
+		self.turns = runner.get_turns_played()
+		self.player = player
+		self.error = error
+
+
+class AsyncGameRunner:
+	"""
+		Class: Drives a GameRunner from an event loop
+
+		One event loop can run thousands of these concurrently, each game only
+		holds the loop while it applies a move. Each game has its own optional
+		per move and whole game timeouts and can be cancelled on its own.
+	"""
+	MOVE_TIMEOUT = 'Move Timeout'
+	MOVE_TIMEOUT_DEFAULT = None
+	GAME_TIMEOUT = 'Game Timeout'
+	GAME_TIMEOUT_DEFAULT = None
+
+	def __init__(self, runner: GameRunner, **kwargs):
+		self.__runner = runner
+		self.__move_timeout = kwargs.get(self.MOVE_TIMEOUT, self.MOVE_TIMEOUT_DEFAULT)
+		self.__game_timeout = kwargs.get(self.GAME_TIMEOUT, self.GAME_TIMEOUT_DEFAULT)
+		self.__task: Optional[asyncio.Task] = None
+		self.__cancelled = False
+
+	def get_runner(self) -> GameRunner:
+		return self.__runner
+
+	def start(self) -> asyncio.Task:
+		""" Schedules the game on the running loop, returns its task """
+		if self.__task is None:
+			self.__task = asyncio.ensure_future(self.run())
+		return self.__task
+
+	def cancel(self) -> None:
+		if self.__task is not None:
+			self.__cancelled = True
+			self.__task.cancel()
+
+	async def result(self) -> AsyncGameResult:
+		return await self.start()
+
+	async def run(self, *args, **kwargs) -> AsyncGameResult:
+		""" Plays one game, the runner is expected to have been setup """
+		try:
+			return await asyncio.wait_for(self.__play(kwargs.get(GameRunner.STARTING_TURN,
+				GameRunner.STARTING_TURN_DEFAULT)), self.__game_timeout)
+		except asyncio.TimeoutError:
+			return AsyncGameResult(AsyncGameResult.GAME_TIMEOUT, self.__runner)
+		except asyncio.CancelledError:
+			if not self.__cancelled:
+				# Cancelled from outside (run_games, loop shutdown, an enclosing timeout), pass it on 
+				raise
+			# Cancelling one game through cancel() is an outcome for that game, not an error for the caller 
+			uncancel = getattr(asyncio.current_task(), 'uncancel', None)
+			if uncancel is not None:
+				uncancel()
+			return AsyncGameResult(AsyncGameResult.CANCELLED, self.__runner)
+
+	async def __play(self, turn: int) -> AsyncGameResult:
+		runner = self.__runner
+		rules = runner.get_game_board().get_board_ruleset()
+		next_player, turn = runner.next_player(turn)
+		while None is not next_player:
+			try:
+				applied = await self.__take_turn(next_player, rules)
+			except asyncio.TimeoutError:
+				return AsyncGameResult(AsyncGameResult.MOVE_TIMEOUT, runner, next_player)
+			except Exception as err:  # pylint: disable=broad-exception-caught
+				return AsyncGameResult(AsyncGameResult.ERROR, runner, next_player, err)
+			if not applied:
+				return AsyncGameResult(AsyncGameResult.FORFEIT, runner, next_player)
+			runner._update_game_state(next_player)  # pylint: disable=protected-access
+			next_player, turn = runner.next_player(turn)
+		return AsyncGameResult(AsyncGameResult.COMPLETED, runner)
+
+	async def __take_turn(self, player: Player, rules) -> bool:
+		for _ in range(self.__runner.get_legal_move_tenacity()):
+			turn_move = await asyncio.wait_for(request_move(player), self.__move_timeout)
+			checked_move = rules.validate(turn_move)
+			if checked_move is not None:
+				return self.__runner.apply_legal_move(player, checked_move)
+		return False
+
+
+async def run_games(runners: Iterable[GameRunner], **kwargs) -> List[AsyncGameResult]:
+	"""
+		Plays every runner's game concurrently on the running loop.
+		Accepts the AsyncGameRunner timeout settings, plus 'Max Concurrency'
+		(MAX_CONCURRENCY) to cap how many games are in progress at once.
+		return results in the order of runners
+	"""
+	limit = kwargs.pop(MAX_CONCURRENCY, None)
+	semaphore = asyncio.Semaphore(limit) if limit else None
+
+	async def play(runner: GameRunner) -> AsyncGameResult:
+		if semaphore is None:
+			return await AsyncGameRunner(runner, **kwargs).run()
+		async with semaphore:
+			return await AsyncGameRunner(runner, **kwargs).run()
+
+	return list(await asyncio.gather(*(play(runner) for runner in runners)))
+
@@ -0,0 +1,93 @@
+from functools import lru_cache
+from typing import List, Tuple
+
+
+class WinMaskTable:
+	"""
+		Class: Precomputed winning-line bitmasks for a square board
+
+		Cell (x, y) maps to bit (y * board_size + x). Every run of
+		seq_num cells along a horizontal, vertical or diagonal is stored
+		as a single integer mask so a win check is an AND and a compare.
+	"""
+	# (dx, dy) pairs, each line is only generated once in its forward direction
+	DIRECTIONS = ((1, 0), (0, 1), (1, 1), (1, -1))
+
+	def __init__(self, board_size: int, seq_num: int):
+		if seq_num < 1:
+			raise ValueError(f'Sequence length must be positive, got {seq_num}')
+		self.__board_size = board_size
+		self.__seq_num = seq_num
+		# A single cell line (seq_num == 1) is generated once per direction
+		self.__masks: Tuple[int, ...] = tuple(dict.fromkeys(self.__build_masks()))
+		masks_by_cell: List[List[int]] = [[] for _ in range(board_size * board_size)]
+		for mask in self.__masks:
+			cell = 0
+			remaining = mask
+			while remaining:
+				if remaining & 1:
+					masks_by_cell[cell].append(mask)
+				remaining >>= 1
+				cell += 1
+		self.__masks_by_cell: Tuple[Tuple[int, ...], ...] = tuple(tuple(m) for m in masks_by_cell)
+
+	@classmethod
+	def for_board(cls, board_size: int, seq_num: int) -> 'WinMaskTable':
+		"""
+			Returns a shared table for the board configuration. Tables are
+			immutable so every board of the same shape can use the same one.
+		"""
+		return _cached_table(board_size, seq_num)
+
+	def board_size(self) -> int:
+		return self.__board_size
+
+	def sequence_size(self) -> int:
+		return self.__seq_num
+
+	def cell_index(self, x: int, y: int) -> int:
+		return y * self.__board_size + x
+
+	def cell_bit(self, x: int, y: int) -> int:
+		return 1 << self.cell_index(x, y)
+
+	def get_masks(self) -> Tuple[int, ...]:
+		return self.__masks
+
+	def get_masks_through(self, cell: int) -> Tuple[int, ...]:
+		""" All winning lines that contain the given cell index """
+		return self.__masks_by_cell[cell]
+
+	def has_win(self, bits: int, cell: int = None) -> bool:
+		"""
+			/param: bits - the bitmask of a single player's pieces
+			/param: cell - optional index of the last placed piece, limits
+				the check to lines passing through that cell
+
+			/return: True if bits completely covers any winning line
+		"""
+		masks = self.__masks if cell is None else self.__masks_by_cell[cell]
+		for mask in masks:
+			if bits & mask == mask:
+				return True
+		return False
+
+	def __build_masks(self):
+		size = self.__board_size
+		seq = self.__seq_num
+		for y in range(size):
+			for x in range(size):
+				for dx, dy in self.DIRECTIONS:
+					end_x = x + dx * (seq - 1)
+					end_y = y + dy * (seq - 1)
+					if not (0 <= end_x < size and 0 <= end_y < size):
+						continue
+					mask = 0
+					for step in range(seq):
+						mask |= 1 << ((y + dy * step) * size + (x + dx * step))
+					yield mask
+
+
+@lru_cache(maxsize=None)
+def _cached_table(board_size: int, seq_num: int) -> WinMaskTable:
+	return WinMaskTable(board_size, seq_num)
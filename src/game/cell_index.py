@@ -0,0 +1,93 @@
+import random
+from array import array
+from typing import Iterator, List, Optional
+
+
+class IndexedCellSet:
+	"""
+		Class: Set of integer cell indices with O(1) add, remove, membership,
+		count and random sampling.
+
+		Members are packed into a list; removal swaps the last member into the
+		freed slot, and a position table maps each cell to its slot.
+	"""
+	ABSENT = -1
+
+	def __init__(self, capacity: int, full: bool = False):
+		"""
+			/param: capacity - cells are indices in range(capacity)
+			/param: full - start with every cell as a member
+		"""
+		self.__members: List[int] = list(range(capacity)) if full else []
+		# array rather than list so positions_view() can expose it without copying
+		self.__positions = array('i', range(capacity)) if full else array('i', [self.ABSENT]) * capacity
+
+	def fill(self) -> None:
+		""" Makes every cell in range(capacity) a member, reusing the existing storage """
+		capacity = len(self.__positions)
+		self.__members[:] = range(capacity)
+		self.__positions[:] = array('i', range(capacity))
+
+	def __len__(self) -> int:
+		return len(self.__members)
+
+	def __contains__(self, cell: int) -> bool:
+		return self.__positions[cell] != self.ABSENT
+
+	def __iter__(self) -> Iterator[int]:
+		return iter(self.__members)
+
+	def __getitem__(self, index: int) -> int:
+		""" Members are indexable in an arbitrary (but stable between updates) order """
+		return self.__members[index]
+
+	def positions_view(self) -> memoryview:
+		""" Read only view of each cell's slot, ABSENT for non members (e.g. for numpy.asarray) """
+		return memoryview(self.__positions).toreadonly()
+
+	def add(self, cell: int) -> None:
+		if self.__positions[cell] != self.ABSENT:
+			return
+		self.__positions[cell] = len(self.__members)
+		self.__members.append(cell)
+
+	def remove(self, cell: int) -> int:
+		"""
+			Removes the cell, the last member takes over its slot
+
+			/return: the slot the cell held, for restore()
+		"""
+		position = self.__positions[cell]
+		if position == self.ABSENT:
+			raise KeyError(cell)
+		last = self.__members.pop()
+		if last != cell:
+			self.__members[position] = last
+			self.__positions[last] = position
+		self.__positions[cell] = self.ABSENT
+		return position
+
+	def restore(self, cell: int, slot: int) -> None:
+		"""
+			Exact inverse of the remove() that returned slot: the member now in
+			slot goes back to the end and the cell back to its slot, so the
+			iteration order is as it was before the remove.
+		"""
+		if slot == len(self.__members):
+			self.add(cell)
+			return
+		moved = self.__members[slot]
+		self.__positions[moved] = len(self.__members)
+		self.__members.append(moved)
+		self.__members[slot] = cell
+		self.__positions[cell] = slot
+
+	def discard(self, cell: int) -> None:
+		if self.__positions[cell] != self.ABSENT:
+			self.remove(cell)
+
+	def sample(self, rng: random.Random = random) -> Optional[int]:
+		""" A uniformly random member, None if the set is empty """
+		if not self.__members:
+			return None
+		return self.__members[rng.randrange(len(self.__members))]
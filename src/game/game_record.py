@@ -0,0 +1,207 @@
+"""
+	Compact binary game log for TicTacToeGB games.
+
+	Layout, all little endian:
+		file header   magic, version, board size, sequence size, player count
+		player names  per player: u8 length + utf-8 bytes
+		games         per game: a fixed width game header (move count,
+		              outcome, winner index) followed by one u32 per move,
+		              (cell index << 8) | player index, cell = y * size + x
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+from .interfaces import Move
+from .tictactoe import TicTacToeGB, TicTacToeMove
+
+_MAGIC = b'TTTGAMES'
+_VERSION = 1
+_FILE_HEADER = struct.Struct('<8sHHHB')
+_NAME_LENGTH = struct.Struct('<B')
+_GAME_HEADER = struct.Struct('<IBB')
+_MOVE_CODE = 'I'
+_PLAYER_BITS = 8
+_MAX_PLAYERS = 1 << _PLAYER_BITS
+_MAX_NAME_BYTES = (1 << 8) - 1
+_MAX_CELLS = 1 << (32 - _PLAYER_BITS)
+
+WIN, TIE, FORFEIT = 0, 1, 2
+# Player indices stop at _MAX_PLAYERS - 2, so the top byte value is free
+NO_WINNER = 0xFF
+
+
+def _encode_header(board_size: int, seq_num: int, players: List[str]) -> bytes:
+	parts = [_FILE_HEADER.pack(_MAGIC, _VERSION, board_size, seq_num, len(players))]
+	for name in players:
+		encoded = name.encode('utf-8')
+		parts.append(_NAME_LENGTH.pack(len(encoded)))
+		parts.append(encoded)
+	return b''.join(parts)
+
+
+def _decode_header(buffer) -> Tuple[int, int, List[str], int]:
+	""" return (board size, sequence size, player names, offset of the first game) """
+	if len(buffer) < _FILE_HEADER.size:
+		raise ValueError('Not a game record file')
+	magic, version, board_size, seq_num, num_players = _FILE_HEADER.unpack_from(buffer, 0)
+	if magic != _MAGIC or version != _VERSION:
+		raise ValueError(f'Not a version {_VERSION} game record file')
+	offset = _FILE_HEADER.size
+	players = []
+	for _ in range(num_players):
+		(length,) = _NAME_LENGTH.unpack_from(buffer, offset)
+		offset += _NAME_LENGTH.size
+		players.append(bytes(buffer[offset:offset + length]).decode('utf-8'))
+		offset += length
+	return board_size, seq_num, players, offset
+
+
+class GameRecorder:
+	"""
+		Class: Appends finished games to a binary log
+
+		Give one to a GameRunner through GameRunner.RECORDER and every game it
+		plays is written. Moves are buffered in memory per game and written
+		as one block when the game ends, a game costs 6 bytes plus 4 per move.
+		Opening an existing log with the same configuration appends to it.
+	"""
+	def __init__(self, path: str, board: TicTacToeGB, player_names: List[str]):
+		# The player count and each name's length are stored in a byte 
+		if len(player_names) >= _MAX_PLAYERS or board.get_board_size() ** 2 > _MAX_CELLS:
+			raise ValueError('Too many players or cells for the record format')
+		if any(len(name.encode('utf-8')) > _MAX_NAME_BYTES for name in player_names):
+			raise ValueError(f'Player names are limited to {_MAX_NAME_BYTES} utf-8 bytes')
+		self.__board_size = board.get_board_size()
+		self.__players = {name: index for index, name in enumerate(player_names)}
+		self.__moves = array(_MOVE_CODE)
+		self.__games = 0
+		header = _encode_header(self.__board_size, board.get_sequence_size(), list(player_names))
+		if os.path.exists(path) and os.path.getsize(path) > 0:
+			with open(path, 'rb') as existing:
+				if existing.read(len(header)) != header:
+					raise ValueError(f'{path} was recorded with a different board or players')
+			self.__file: BinaryIO = open(path, 'ab')  # pylint: disable=consider-using-with
+		else:
+			self.__file = open(path, 'wb')  # pylint: disable=consider-using-with
+			self.__file.write(header)
+
+	def __enter__(self) -> 'GameRecorder':
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.close()
+
+	def close(self) -> None:
+		self.__file.close()
+
+	def games_recorded(self) -> int:
+		return self.__games
+
+	def begin_game(self) -> None:
+		""" Drops moves of a game that never ended """
+		del self.__moves[:]
+
+	def record_move(self, player_name: str, move: Move) -> None:
+		_move = TicTacToeMove.from_raw(move)
+		cell = _move.get_y() * self.__board_size + _move.get_x()
+		self.__moves.append(cell << _PLAYER_BITS | self.__players[player_name])
+
+	def end_game(self, winner_name: Optional[str], is_tie: bool) -> None:
+		if winner_name is not None:
+			outcome, winner = WIN, self.__players[winner_name]
+		else:
+			outcome, winner = (TIE if is_tie else FORFEIT), NO_WINNER
+		self.__file.write(_GAME_HEADER.pack(len(self.__moves), outcome, winner))
+		if sys.byteorder == 'big':
+			self.__moves.byteswap()
+		self.__file.write(self.__moves.tobytes())
+		del self.__moves[:]
+		self.__games += 1
+
+	def flush(self) -> None:
+		self.__file.flush()
+
+
+class RecordedGame:
+	"""
+		Class: One game read back from a log
+	"""
+	__slots__ = ('board_size', 'seq_num', 'players', 'outcome', 'winner', 'moves')
+
+	def __init__(self, board_size: int, seq_num: int, players: List[str], outcome: int,
+				 winner: Optional[str], moves: array):
+		self.board_size = board_size
+		self.seq_num = seq_num
+		self.players = players
+		self.outcome = outcome
+		self.winner = winner
+		self.moves = moves
+
+	def __len__(self) -> int:
+		return len(self.moves)
+
+	def iter_moves(self) -> Iterator[TicTacToeMove]:
+		for code in self.moves:
+			y, x = divmod(code >> _PLAYER_BITS, self.board_size)
+			yield TicTacToeMove(x, y, self.players[code & (_MAX_PLAYERS - 1)])
+
+	def replay(self, board: Optional[TicTacToeGB] = None) -> TicTacToeGB:
+		"""
+			Applies the game's moves to board (reset first), or to a new board
+			built from the recorded configuration.
+			return the board holding the final position
+		"""
+		if board is not None and (board.get_board_size() != self.board_size
+								  or board.get_sequence_size() != self.seq_num):
+			raise ValueError(f'Game was recorded on a {self.board_size}x{self.board_size} board with '
+							 f'{self.seq_num} in a row, not {board.get_board_size()}x{board.get_board_size()} '
+							 f'with {board.get_sequence_size()}')
+		if board is None:
+			board = TicTacToeGB(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: self.board_size,
+								   TicTacToeGB.SEQUENCE_NUM: self.seq_num})
+			board.initialize()
+		else:
+			board.reset()
+		result = None
+		for move in self.iter_moves():
+			result = board.update_board_with_move(move, result)
+		return board
+
+
+def read_header(path: str) -> Tuple[int, int, List[str]]:
+	""" return (board size, sequence size, player names) of a log """
+	with open(path, 'rb') as log:
+		board_size, seq_num, players, _ = _decode_header(log.read(_FILE_HEADER.size + 256 * _MAX_PLAYERS))
+	return board_size, seq_num, players
+
+
+def read_games(path: str) -> Iterator[RecordedGame]:
+	"""
+		Streams the games of a log in order. The file is memory mapped, only
+		the game being yielded is copied out of it, so logs far larger than
+		memory can be scanned. A trailing partial game (e.g. from a crash
+		mid write) ends the stream. An empty file holds no games.
+	"""
+	if os.path.getsize(path) == 0:
+		# mmap cannot map a zero length file
+		return
+	with open(path, 'rb') as log, mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+		board_size, seq_num, players, offset = _decode_header(buffer)
+		move_size = array(_MOVE_CODE).itemsize
+		end = len(buffer)
+		while offset + _GAME_HEADER.size <= end:
+			num_moves, outcome, winner = _GAME_HEADER.unpack_from(buffer, offset)
+			offset += _GAME_HEADER.size
+			moves_end = offset + num_moves * move_size
+			if moves_end > end:
+				return
+			moves = array(_MOVE_CODE)
+			moves.frombytes(buffer[offset:moves_end])
+			if sys.byteorder == 'big':
+				moves.byteswap()
+			offset = moves_end
+			yield RecordedGame(board_size, seq_num, players, outcome,
+							   None if winner == NO_WINNER else players[winner], moves)
@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from move_support import Move, MoveResult, LegalMoveChecker
+from typing import Iterator, List, Optional
+from .move_support import Move, MoveResult, LegalMoveChecker
 
 class BoardLocation(ABC):
+	# Keys used by grid boards for coordinates and metadata
+	X_POS = 'X Position'
+	Y_POS = 'Y Position'
+	OCCUPANT = 'Occupant'
 
 	@abstractmethod
 	def get_board_coordinates(self) -> dict:
@@ -18,12 +22,19 @@ class GameBoard(ABC):
 	def initialize(self, *args, **kwargs):
 		pass
 
+	def reset(self) -> None:
+		"""
+			Returns the board to its initialized state between games. 
+			Boards that can clear themselves in place should override this. 
+		"""
+		self.initialize()
+
 	@abstractmethod
 	def get_board_ruleset(self) -> LegalMoveChecker:
 		pass
 
 	@abstractmethod
-	def update_board_with_move(self, move: Move) -> MoveResult:
+	def update_board_with_move(self, move: Move, result: Optional[MoveResult] = None) -> MoveResult:
 		"""
 			Attempts to update the game board with the new move.
 			The move is expected to be Legal, if it's not legal
@@ -33,9 +44,32 @@ class GameBoard(ABC):
 			A valid move is one that can be made on the board
 			(e.g. a piece is not moved to an already occupied location)
 			or is deemed invalid due to a given game state
+
+			If result is given it is reset, filled in and returned instead 
+			of allocating a new MoveResult.
+		"""
+		pass
+
+	@abstractmethod
+	def iter_legal_moves(self, player_name: str) -> Iterator[Move]:
+		"""
+			Lazily yields every legal and valid move for the named player, 
+			nothing once the game is complete. Moves come from an index the 
+			board maintains, no list of candidates is built. The board must 
+			not be changed while the generator is in use. Boards with an 
+			unbounded move set never finish, see iter_candidate_moves. 
 		"""
 		pass
 
+	def iter_candidate_moves(self, player_name: str) -> Iterator[Move]:
+		"""
+			Lazily yields the moves worth considering for the named player, 
+			always a finite subset of iter_legal_moves. This default is every 
+			legal move; boards with an unbounded move set narrow it (e.g. to 
+			cells near existing pieces). 
+		"""
+		return self.iter_legal_moves(player_name)
+
 	@abstractmethod
 	def is_game_complete(self):
 		## Could Template Caching
@@ -45,29 +79,47 @@ class GameBoard(ABC):
 	def display(self) -> None:
 		pass
 
+	def set_profiler(self, profiler) -> None:
+		"""
+			Given a profiling.TurnProfiler (or None) to time the board's own 
+			phases with. Boards with nothing to time ignore it. 
+		"""
+		return None
+
+	def board_hash(self) -> int:
+		"""
+			A key for the current position, equal for boards holding the same 
+			pieces. This default walks the whole board, combining the cells 
+			without regard to the iteration order; boards that track a hash 
+			incrementally should override it. 
+		"""
+		return hash(frozenset(
+			(tuple(location.get_board_coordinates().items()), tuple(location.get_board_metadata().items()))
+			for location in self))
+
 	@abstractmethod
 	def _get_surrounding_locations(self, spot: BoardLocation) -> List[BoardLocation]:
 		"""
 			Board Searching Method: a list of locations all directly touching the passed in location
+			Bounded boards should answer from a neighbour index built once per 
+			shape (game.topology.Topology) rather than bounds checking each call 
 		"""
 		pass
 
 	@abstractmethod
-	def _reset_board_iteration(self) -> None:
-		""" Iterator reset """
+	def _get_location_at(self, x: int, y: int) -> Optional[BoardLocation]:
+		"""
+			Board Searching Method: the location at the given coordinates, None if off the board
+		"""
 		pass
 
 	@abstractmethod
-	def _next_board_location(self) -> Optional[BoardLocation]:
-		""" Iterator Next """
+	def _iter_board_locations(self) -> Iterator[BoardLocation]:
+		"""
+			Generator over every location of the board. Each call has its own 
+			state, so iterations can be nested or interleaved. 
+		"""
 		pass
 
-	def __iter__(self):
-		self._reset_board_iteration()
-		return self
-
-	def __next__(self) -> Optional[BoardLocation]:
-		nxt = self._next_board_location()
-		if nxt is None:
-			raise StopIteration
-		return nxt
\ No newline at end of file
+	def __iter__(self) -> Iterator[BoardLocation]:
+		return self._iter_board_locations()
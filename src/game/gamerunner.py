@@ -1,7 +1,64 @@
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from player import Player 
-from gameboard import GameBoard, LegalMoveChecker
+from typing import Dict, List, Optional
+from .player import Player
+from .gameboard import GameBoard, LegalMoveChecker
+from .move_support import Move, MoveResult
+from . import profiling
+
+
+class BatchResult:
+	"""
+		Class: Aggregated outcome of GameRunner.run_batch
+	"""
+	def __init__(self):
+		self.games = 0
+		self.wins: Dict[str, int] = {}
+		self.ties = 0
+		self.forfeits = 0
+		self.total_turns = 0
+		self.elapsed_seconds = 0.0
+
+	def record_game(self, winner: Optional[Player], is_tie: bool, turns: int) -> None:
+		"""
+			winner: the winning player, None for ties and forfeits 
+			is_tie: True if the board filled up without a winner, False for a forfeit 
+		"""
+		self.games += 1
+		self.total_turns += turns
+		if winner is not None:
+			self.wins[winner.get_name()] = self.wins.get(winner.get_name(), 0) + 1
+		elif is_tie:
+			self.ties += 1
+		else:
+			self.forfeits += 1
+
+	def merge(self, other: 'BatchResult') -> 'BatchResult':
+		""" Adds other's totals into self, returns self """
+		self.games += other.games
+		for name, count in other.wins.items():
+			self.wins[name] = self.wins.get(name, 0) + count
+		self.ties += other.ties
+		self.forfeits += other.forfeits
+		self.total_turns += other.total_turns
+		self.elapsed_seconds += other.elapsed_seconds
+		return self
+
+	def average_game_length(self) -> float:
+		return self.total_turns / self.games if self.games else 0.0
+
+	def games_per_second(self) -> float:
+		return self.games / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+	def as_dict(self) -> dict:
+		return {
+			'games': self.games,
+			'wins': dict(self.wins),
+			'ties': self.ties,
+			'forfeits': self.forfeits,
+			'average_game_length': self.average_game_length(),
+			'games_per_second': self.games_per_second(),
+		}
 
 
 class GameRunner(ABC):
@@ -15,12 +72,29 @@ class GameRunner(ABC):
 	GAME_NAME = 'Game Name'
 	GAME_NAME_DEFAULT = 'Unset' 
 
+	BATCH_RESULT = 'Batch Result'
+
+	# Optional game_record.GameRecorder, every game played is appended to it 
+	RECORDER = 'Game Recorder'
+	RECORDER_DEFAULT = None
+
+	# Optional profiling.TurnProfiler, times each phase of a turn 
+	PROFILER = 'Profiler'
+	PROFILER_DEFAULT = None
+
 	def __init__(self, players: List[Player], game_boad: GameBoard, **kwargs):
 		self.__players = players
 		self.__game_board = game_boad
 		self.__game_completed = False
 		self.__winner = None
+		self.__turns_played = 0
 		self.__game_name = kwargs.get(self.GAME_NAME, self.GAME_NAME_DEFAULT)
+		# Reused for every move, the board resets it before filling it in 
+		self.__move_result = MoveResult()
+		self.__recorder = kwargs.get(self.RECORDER, self.RECORDER_DEFAULT)
+		self.__profiler = kwargs.get(self.PROFILER, self.PROFILER_DEFAULT)
+		if self.__profiler is not None:
+			game_boad.set_profiler(self.__profiler)
 
 	@abstractmethod
 	def _update_game_state(self, p: Player) -> None:
@@ -36,6 +110,12 @@ class GameRunner(ABC):
 		"""
 		pass
 
+	def get_turns_played(self) -> int:
+		"""
+			Number of moves applied in the current game 
+		"""
+		return self.__turns_played
+
 	def get_winner(self) -> Optional[Player]:
 		return self.__winner
 
@@ -63,8 +143,16 @@ class GameRunner(ABC):
 	def game_name(self) -> str: 
 		return self.__game_name
 
+	def get_profiler(self) -> Optional[profiling.TurnProfiler]:
+		return self.__profiler
+
 	def display_board(self) -> None:
+		if self.__profiler is None:
+			self.get_game_board().display()
+			return
+		self.__profiler.begin(profiling.DISPLAY)
 		self.get_game_board().display()
+		self.__profiler.end(profiling.DISPLAY)
 
 	def announce_winner(self) -> str:
 		if self.is_tie():
@@ -113,7 +201,6 @@ class GameRunner(ABC):
 		"""
 		return 2
 
-	@abstractmethod
 	def __get_next_player_given(self, turn: int) -> tuple[Player, int]: 
 		""" 
 			Naieve implementation of turn number as an int. a Turn is considered 1 player making a play. 
@@ -126,12 +213,36 @@ class GameRunner(ABC):
 		return (self.get_players()[turn % len(self.get_players())], turn + 1)
 
 	def __pick_legal_move(self, gb: GameBoard, rs: LegalMoveChecker, p: Player):
+		if self.__profiler is not None:
+			return self.__pick_legal_move_profiled(rs, p)
+		for _ in range(self.get_legal_move_tenacity()):
+			# The ruleset may hand back a checked move the board will not re-check
+			checked_move = rs.validate(p.get_move())
+			if checked_move is not None:
+				return (True, checked_move)
+		return (False, None)
+
+	def __pick_legal_move_profiled(self, rs: LegalMoveChecker, p: Player):
+		profiler = self.__profiler
 		for _ in range(self.get_legal_move_tenacity()):
+			profiler.begin(profiling.GET_MOVE)
 			turn_move = p.get_move()
-			if rs.is_legal_move(turn_move):
-				return (True, turn_move)
+			profiler.end(profiling.GET_MOVE)
+			profiler.begin(profiling.IS_LEGAL_MOVE)
+			checked_move = rs.validate(turn_move)
+			profiler.end(profiling.IS_LEGAL_MOVE)
+			if checked_move is not None:
+				return (True, checked_move)
+			profiler.count(profiling.ILLEGAL_MOVES)
 		return (False, None)
 
+	def next_player(self, turn: int) -> tuple[Optional[Player], int]:
+		"""
+			Public access to the turn order for drivers outside of run (e.g. async runners) 
+			return (Player for this turn or None if the game is over, next turn number) 
+		"""
+		return self.__get_next_player_given(turn)
+
 	def progress_turn(self, player):
 		game_board = self.get_game_board()
 		rules = game_board.get_board_ruleset()
@@ -140,17 +251,82 @@ class GameRunner(ABC):
 			# Illegal moves do not contribute to non-applicable 
 			# moves. Being illegal too many times is a game over. 
 			return False
-		update_ctxt = game_board.update_board_with_move(turn_move)
+		return self.apply_legal_move(player, turn_move)
+
+	def apply_legal_move(self, player: Player, turn_move: Move) -> bool:
+		"""
+			Second half of progress_turn, for callers that obtained and 
+			checked the move themselves. 
+			return True if the move was applied 
+		"""
+		if self.__profiler is None:
+			update_ctxt = self.get_game_board().update_board_with_move(turn_move, self.__move_result)
+		else:
+			self.__profiler.begin(profiling.UPDATE_BOARD)
+			update_ctxt = self.get_game_board().update_board_with_move(turn_move, self.__move_result)
+			self.__profiler.end(profiling.UPDATE_BOARD)
 		if not update_ctxt.was_move_applied():
+			if self.__profiler is not None:
+				self.__profiler.count(profiling.REJECTED_MOVES)
 			return False
+		self.__turns_played += 1
+		if self.__recorder is not None:
+			self.__recorder.record_move(player.get_name(), turn_move)
 		if update_ctxt.did_move_end_game():
 			self.__game_completed = True
+			if update_ctxt.game_has_winner():
+				self.__winner = player
 		return True
 
 	def setup(self, *args, **kwargs) -> None:
 		for player in self.get_players():
 			player.initialize()
 		self.get_game_board().initialize()
+		if self.__recorder is not None:
+			self.__recorder.begin_game()
+
+	def reset(self) -> None:
+		"""
+			Prepares the runner, its players and its board for another game. 
+			The board is reset in place rather than reconstructed. 
+		"""
+		self.__game_completed = False
+		self.__winner = None
+		self.__turns_played = 0
+		for player in self.get_players():
+			player.initialize()
+		self.get_game_board().reset()
+		if self.__recorder is not None:
+			self.__recorder.begin_game()
+
+	def __record_game_end(self) -> None:
+		if self.__recorder is not None:
+			winner = None if self.__winner is None else self.__winner.get_name()
+			self.__recorder.end_game(winner, self.__game_completed)
+
+	def run_batch(self, num_games: int, *args, **kwargs) -> BatchResult:
+		"""
+			Headless mode: plays num_games back to back with no display and 
+			no string building. A turn that cannot progress forfeits that 
+			game instead of raising. 
+
+			return aggregated BatchResult over all games 
+		"""
+		result = kwargs.get(self.BATCH_RESULT) or BatchResult()
+		starting_turn = kwargs.get(self.STARTING_TURN, self.STARTING_TURN_DEFAULT)
+		start = time.perf_counter()
+		for _ in range(num_games):
+			self.reset()
+			next_player, turn = self.__get_next_player_given(starting_turn)
+			while None is not next_player:
+				if not self.progress_turn(next_player):
+					break
+				self._update_game_state(next_player)
+				next_player, turn = self.__get_next_player_given(turn)
+			result.record_game(self.__winner, self.__game_completed, self.__turns_played)
+			self.__record_game_end()
+		result.elapsed_seconds += time.perf_counter() - start
+		return result
 
 	def run(self, *args, **kwargs) -> None:
 		
@@ -166,5 +342,6 @@ class GameRunner(ABC):
 				self.display_board()
 			next_player, turn = self.__get_next_player_given(turn)
 
+		self.__record_game_end()
 		if display_board != self.DISPLAY_BOARD_NEVER:
 			self.display_board()
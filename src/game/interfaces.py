@@ -0,0 +1,5 @@
+""" Single import point for the abstract game interfaces """
+from .move_support import Move, MoveResult, LegalMoveChecker
+from .gameboard import BoardLocation, GameBoard
+from .player import Player
+from .gamerunner import GameRunner
@@ -0,0 +1,270 @@
+import math
+import random
+import time
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Tuple
+from .interfaces import Move, Player
+from .bitboard import WinMaskTable
+from .tictactoe import TicTacToeGB, TicTacToeMove
+
+
+def rollout(to_move: int, other: int, board_size: int, seq_num: int, num_rollouts: int, seed: int) -> float:
+	"""
+		Plays num_rollouts uniformly random games from the position.
+		Module level so it can be sent to a process pool.
+
+		/return: total score from to_move's view, 1 per win and 0.5 per tie
+	"""
+	masks = WinMaskTable.for_board(board_size, seq_num)
+	rng = random.Random(seed)
+	occupied = to_move | other
+	empty = [cell for cell in range(board_size * board_size) if not (occupied >> cell) & 1]
+	score = 0.0
+	for _ in range(num_rollouts):
+		rng.shuffle(empty)
+		pieces = [to_move, other]
+		turn = 0
+		for cell in empty:
+			pieces[turn] |= 1 << cell
+			if masks.has_win(pieces[turn], cell):
+				score += 1.0 if turn == 0 else 0.0
+				break
+			turn ^= 1
+		else:
+			score += 0.5
+	return score
+
+
+def rollout_batch(positions: List[Tuple[int, int]], board_size: int, seq_num: int, num_rollouts: int,
+				  seed: int) -> List[float]:
+	"""
+		rollout() for several (to_move, other) positions in one call, so one
+		executor round trip covers a whole batch of leaves.
+
+		/return: each position's total score, in order
+	"""
+	rng = random.Random(seed)
+	return [rollout(to_move, other, board_size, seq_num, num_rollouts, rng.getrandbits(32))
+			for to_move, other in positions]
+
+
+class _Node:
+	""" Search tree node, wins are counted for the player who moved into the node """
+	__slots__ = ('to_move', 'other', 'move', 'parent', 'children', 'untried', 'visits', 'wins', 'outcome')
+
+	WON, TIED = 1, 2
+
+	def __init__(self, to_move: int, other: int, move: int, parent: Optional['_Node'], outcome: int):
+		self.to_move = to_move
+		self.other = other
+		self.move = move
+		self.parent = parent
+		self.children: Dict[int, '_Node'] = {}
+		self.untried: Optional[List[int]] = None
+		self.visits = 0
+		self.wins = 0.0
+		self.outcome = outcome
+
+
+class MCTSAI(Player):
+	"""
+		Class: Monte Carlo Tree Search (UCT) player for TicTacToeGB
+
+		Each move searches for TIME_BUDGET seconds, so strength grows with the
+		CPU time given. The tree is kept between turns: on the next move the
+		node matching the current board (our previous move plus the
+		opponent's reply) becomes the new root with its statistics intact.
+
+		Leaf evaluations run ROLLOUTS_PER_LEAF random games, inline when no
+		ROLLOUT_EXECUTOR is given. With an executor (a ProcessPoolExecutor
+		sidesteps the GIL) LEAVES_PER_BATCH leaves are selected at a time,
+		each path taking a virtual loss so the selections spread out, and
+		the batch is sent as ROLLOUT_TASKS rollout_batch() calls. Round trips
+		are paid per batch rather than per leaf.
+	"""
+	TIME_BUDGET = 'Time Budget'
+	TIME_BUDGET_DEFAULT = 0.5
+	EXPLORATION = 'Exploration'
+	EXPLORATION_DEFAULT = math.sqrt(2)
+	ROLLOUT_EXECUTOR = 'Rollout Executor'
+	ROLLOUT_EXECUTOR_DEFAULT = None
+	ROLLOUTS_PER_LEAF = 'Rollouts Per Leaf'
+	ROLLOUTS_PER_LEAF_DEFAULT = 1
+	ROLLOUT_TASKS = 'Rollout Tasks'
+	ROLLOUT_TASKS_DEFAULT = 1
+	LEAVES_PER_BATCH = 'Leaves Per Batch'
+	LEAVES_PER_BATCH_DEFAULT = 16
+	SEED = 'Seed'
+	SEED_DEFAULT = None
+
+	def __init__(self, name: str, board: TicTacToeGB, **kwargs):
+		super().__init__(**{Player.NAME: name})
+		if not board.get_topology().is_rectangular():
+			raise ValueError('MCTSAI win masks only cover rectangular boards')
+		self.__board = board
+		self.__time_budget = kwargs.get(self.TIME_BUDGET, self.TIME_BUDGET_DEFAULT)
+		self.__exploration = kwargs.get(self.EXPLORATION, self.EXPLORATION_DEFAULT)
+		self.__executor: Optional[Executor] = kwargs.get(self.ROLLOUT_EXECUTOR, self.ROLLOUT_EXECUTOR_DEFAULT)
+		self.__rollouts_per_leaf = kwargs.get(self.ROLLOUTS_PER_LEAF, self.ROLLOUTS_PER_LEAF_DEFAULT)
+		self.__rollout_tasks = kwargs.get(self.ROLLOUT_TASKS, self.ROLLOUT_TASKS_DEFAULT)
+		self.__leaves_per_batch = kwargs.get(self.LEAVES_PER_BATCH, self.LEAVES_PER_BATCH_DEFAULT)
+		self.__rng = random.Random(kwargs.get(self.SEED, self.SEED_DEFAULT))
+		self.__root: Optional[_Node] = None
+		self.__masks: Optional[WinMaskTable] = None
+		self.__stats = {}
+
+	def initialize(self) -> None:
+		self.__root = None
+
+	def get_last_search_stats(self) -> dict:
+		""" iterations run, rollouts played and root visits carried over from the previous move """
+		return dict(self.__stats)
+
+	def get_move(self) -> Move:
+		size = self.__board.get_board_size()
+		self.__masks = WinMaskTable.for_board(size, self.__board.get_sequence_size())
+		me, opponent = self.__read_board(size)
+		root = self.__reroot(me, opponent)
+		self.__stats = {'reused_visits': root.visits, 'iterations': 0, 'rollouts': 0}
+		deadline = time.perf_counter() + self.__time_budget
+		iterate = self.__iterate if self.__executor is None else self.__iterate_batch
+		while True:
+			self.__stats['iterations'] += iterate(root)
+			if time.perf_counter() >= deadline:
+				break
+		best = max(root.children.values(), key=lambda child: child.visits)
+		# Keep our chosen move as the root, the opponent's reply is found under it next turn
+		self.__root = best
+		y, x = divmod(best.move, size)
+		return TicTacToeMove(x, y, self.get_name())
+
+	def __read_board(self, size: int) -> Tuple[int, int]:
+		me = opponent = 0
+		for y, row in enumerate(self.__board.get_cells()):
+			for x, occupant in enumerate(row):
+				if occupant is None:
+					continue
+				if occupant == self.get_name():
+					me |= 1 << (y * size + x)
+				else:
+					opponent |= 1 << (y * size + x)
+		return me, opponent
+
+	def __reroot(self, me: int, opponent: int) -> _Node:
+		previous = self.__root
+		if previous is not None:
+			for reply in previous.children.values():
+				if reply.to_move == me and reply.other == opponent:
+					reply.parent = None
+					return reply
+		return _Node(me, opponent, -1, None, 0)
+
+	def __iterate(self, root: _Node) -> int:
+		""" One serial iteration, return the number of leaves evaluated """
+		node = self.__descend(root)
+		# Simulation, score from the view of the side to move at node
+		visits, score = self.__terminal_result(node)
+		if visits == 0:
+			score = rollout(node.to_move, node.other, self.__board.get_board_size(), self.__masks.sequence_size(),
+							self.__rollouts_per_leaf, self.__rng.getrandbits(32))
+			visits = self.__rollouts_per_leaf
+			self.__stats['rollouts'] += visits
+		self.__backpropagate(node, visits, score)
+		return 1
+
+	def __iterate_batch(self, root: _Node) -> int:
+		""" Selects a batch of leaves under virtual loss and rolls them out on the executor together """
+		leaves = []
+		for _ in range(self.__leaves_per_batch):
+			node = self.__descend(root)
+			self.__add_visits(node, 1)
+			leaves.append(node)
+		pending = [node for node in leaves if node.outcome == 0]
+		scores = iter(self.__rollout_on_executor(pending))
+		for node in leaves:
+			self.__add_visits(node, -1)
+			visits, score = self.__terminal_result(node)
+			if visits == 0:
+				visits, score = self.__rollouts_per_leaf, next(scores)
+			self.__backpropagate(node, visits, score)
+		return len(leaves)
+
+	def __descend(self, root: _Node) -> _Node:
+		""" Selection then expansion, return the leaf to evaluate """
+		node = root
+		while node.outcome == 0 and node.untried is not None and not node.untried and node.children:
+			node = self.__select(node)
+		if node.outcome == 0:
+			if node.untried is None:
+				node.untried = self.__legal_moves(node)
+				self.__rng.shuffle(node.untried)
+			if node.untried:
+				node = self.__expand(node, node.untried.pop())
+		return node
+
+	@staticmethod
+	def __add_visits(node: _Node, visits: int) -> None:
+		""" Visits without wins along the path, a virtual loss while a rollout is in flight """
+		while node is not None:
+			node.visits += visits
+			node = node.parent
+
+	@staticmethod
+	def __backpropagate(node: _Node, visits: int, score: float) -> None:
+		while node is not None:
+			node.visits += visits
+			node.wins += visits - score
+			score = visits - score
+			node = node.parent
+
+	def __select(self, node: _Node) -> _Node:
+		log_visits = math.log(node.visits)
+		exploration = self.__exploration
+		return max(node.children.values(), key=lambda child:
+			child.wins / child.visits + exploration * math.sqrt(log_visits / child.visits))
+
+	def __legal_moves(self, node: _Node) -> List[int]:
+		occupied = node.to_move | node.other
+		return [cell for cell in range(self.__board.get_board_size() ** 2) if not (occupied >> cell) & 1]
+
+	def __expand(self, node: _Node, cell: int) -> _Node:
+		mover = node.to_move | (1 << cell)
+		outcome = 0
+		if self.__masks.has_win(mover, cell):
+			outcome = _Node.WON
+		elif (mover | node.other) == self.__full_mask():
+			outcome = _Node.TIED
+		child = _Node(node.other, mover, cell, node, outcome)
+		node.children[cell] = child
+		return child
+
+	def __full_mask(self) -> int:
+		return (1 << (self.__board.get_board_size() ** 2)) - 1
+
+	@staticmethod
+	def __terminal_result(node: _Node) -> Tuple[int, float]:
+		""" return (games counted, score for node.to_move), (0, 0.0) if the game goes on """
+		if node.outcome == _Node.WON:
+			return 1, 0.0
+		if node.outcome == _Node.TIED:
+			return 1, 0.5
+		return 0, 0.0
+
+	def __rollout_on_executor(self, leaves: List[_Node]) -> List[float]:
+		""" Each leaf's rollout score, the leaves split into ROLLOUT_TASKS contiguous submissions """
+		if not leaves:
+			return []
+		size = self.__board.get_board_size()
+		seq = self.__masks.sequence_size()
+		positions = [(node.to_move, node.other) for node in leaves]
+		tasks = max(1, min(self.__rollout_tasks, len(positions)))
+		per_task, extra = divmod(len(positions), tasks)
+		futures = []
+		start = 0
+		for task in range(tasks):
+			end = start + per_task + (1 if task < extra else 0)
+			futures.append(self.__executor.submit(rollout_batch, positions[start:end], size, seq,
+												  self.__rollouts_per_leaf, self.__rng.getrandbits(32)))
+			start = end
+		self.__stats['rollouts'] += self.__rollouts_per_leaf * len(positions)
+		return [score for future in futures for score in future.result()]
@@ -0,0 +1,209 @@
+import time
+from typing import List, Optional, Tuple
+from .interfaces import Move, Player
+from .bitboard import WinMaskTable
+from .tictactoe import TicTacToeGB, TicTacToeMove
+
+
+class _SearchTimeout(Exception):
+	pass
+
+
+class MinimaxAI(Player):
+	"""
+		Class: Iterative deepening alpha-beta (negamax) player for TicTacToeGB
+
+		Positions are searched as a pair of bitboards (side to move, other
+		side) using the board's WinMaskTable, so the search never touches the
+		GameBoard itself. Searched positions are kept in a bounded
+		transposition table that also supplies the first move to try.
+		Remaining moves are ordered by how many winning lines pass through
+		the cell. Wins score WIN_SCORE less the pieces on the board, so
+		faster wins and slower losses are preferred; scores depend only on
+		the position, which keeps table entries valid across paths. On
+		boards of at least NEIGHBOURHOOD_MIN_SIZE only cells next to
+		existing pieces are considered, keeping large boards tractable.
+	"""
+	MAX_DEPTH = 'Max Depth'
+	MAX_DEPTH_DEFAULT = None
+	TIME_BUDGET = 'Time Budget'
+	TIME_BUDGET_DEFAULT = 1.0
+	TABLE_SIZE = 'Transposition Table Size'
+	TABLE_SIZE_DEFAULT = 1 << 20
+	NEIGHBOURHOOD_MIN_SIZE = 'Neighbourhood Min Size'
+	NEIGHBOURHOOD_MIN_SIZE_DEFAULT = 5
+
+	WIN_SCORE = 1 << 40
+	EXACT, LOWER, UPPER = 0, 1, 2
+	TIME_CHECK_INTERVAL = 1024
+
+	def __init__(self, name: str, board: TicTacToeGB, **kwargs):
+		super().__init__(**{Player.NAME: name})
+		self.__board = board
+		self.__max_depth = kwargs.get(self.MAX_DEPTH, self.MAX_DEPTH_DEFAULT)
+		self.__time_budget = kwargs.get(self.TIME_BUDGET, self.TIME_BUDGET_DEFAULT)
+		self.__table_size = kwargs.get(self.TABLE_SIZE, self.TABLE_SIZE_DEFAULT)
+		self.__neighbourhood_min_size = kwargs.get(self.NEIGHBOURHOOD_MIN_SIZE,
+												   self.NEIGHBOURHOOD_MIN_SIZE_DEFAULT)
+		self.__table = {}
+		self.__masks: Optional[WinMaskTable] = None
+		self.__size = 0
+		self.__cell_order: Tuple[int, ...] = ()
+		self.__full = 0
+		self.__neighbour_masks: Tuple[int, ...] = ()
+		self.__deadline = 0.0
+		self.__nodes = 0
+		self.__last_depth = 0
+
+	def get_last_search_stats(self) -> dict:
+		return {'depth': self.__last_depth, 'nodes': self.__nodes, 'table_entries': len(self.__table)}
+
+	def get_move(self) -> Move:
+		me, opponent = self.__read_board()
+		cell = self.search(me, opponent)
+		y, x = divmod(cell, self.__size)
+		return TicTacToeMove(x, y, self.get_name())
+
+	def search(self, me: int, opponent: int) -> int:
+		"""
+			/param: me, opponent - bitboards, bit (y * size + x), me to move
+
+			/return: the chosen cell index
+		"""
+		self.__nodes = 0
+		self.__last_depth = 0
+		self.__deadline = time.perf_counter() + self.__time_budget
+		empty = bin(self.__full & ~(me | opponent)).count('1')
+		max_depth = empty if self.__max_depth is None else min(self.__max_depth, empty)
+		moves = self.__candidate_moves(me | opponent)
+		best = moves[0]
+		for depth in range(1, max_depth + 1):
+			try:
+				best, value = self.__search_root(me, opponent, depth, best)
+			except _SearchTimeout:
+				break
+			self.__last_depth = depth
+			if abs(value) >= self.WIN_SCORE - self.__size * self.__size:
+				# A forced result has been found, deeper searches cannot change it
+				break
+		return best
+
+	def __read_board(self) -> Tuple[int, int]:
+		size = self.__board.get_board_size()
+		if self.__masks is None or self.__size != size:
+			self.__configure(size, self.__board.get_sequence_size())
+		me = opponent = 0
+		for y, row in enumerate(self.__board.get_cells()):
+			for x, occupant in enumerate(row):
+				if occupant is None:
+					continue
+				if occupant == self.get_name():
+					me |= 1 << (y * size + x)
+				else:
+					opponent |= 1 << (y * size + x)
+		return me, opponent
+
+	def __configure(self, size: int, seq: int) -> None:
+		topology = self.__board.get_topology()
+		if not topology.is_rectangular():
+			raise ValueError('MinimaxAI win masks only cover rectangular boards')
+		self.__masks = WinMaskTable.for_board(size, seq)
+		self.__size = size
+		self.__full = (1 << (size * size)) - 1
+		self.__neighbour_masks = tuple(topology.neighbour_mask(cell) for cell in range(size * size))
+		cells = range(size * size)
+		self.__cell_order = tuple(sorted(cells, key=lambda c: -len(self.__masks.get_masks_through(c))))
+		self.__table.clear()
+
+	def __candidate_moves(self, occupied: int, first: int = -1) -> List[int]:
+		allowed = self.__full & ~occupied
+		if occupied and self.__size >= self.__neighbourhood_min_size:
+			# Union of the occupied cells' neighbourhoods from the board's neighbour index
+			near = 0
+			remaining = occupied
+			while remaining:
+				low = remaining & -remaining
+				near |= self.__neighbour_masks[low.bit_length() - 1]
+				remaining ^= low
+			allowed &= near
+		moves = [cell for cell in self.__cell_order if (allowed >> cell) & 1]
+		if first >= 0 and (allowed >> first) & 1:
+			moves.remove(first)
+			moves.insert(0, first)
+		return moves
+
+	def __search_root(self, me: int, opponent: int, depth: int, first: int) -> Tuple[int, int]:
+		alpha, beta = -self.WIN_SCORE - 1, self.WIN_SCORE + 1
+		best, best_value = first, -self.WIN_SCORE - 1
+		for cell in self.__candidate_moves(me | opponent, first):
+			value = -self.__negamax(opponent, me | (1 << cell), depth - 1, -beta, -alpha, cell)
+			if value > best_value:
+				best, best_value = cell, value
+			alpha = max(alpha, value)
+		return best, best_value
+
+	def __negamax(self, me: int, opponent: int, depth: int, alpha: int, beta: int,
+				  last_cell: int) -> int:
+		self.__nodes += 1
+		if self.__nodes % self.TIME_CHECK_INTERVAL == 0 and time.perf_counter() > self.__deadline:
+			raise _SearchTimeout()
+		occupied = me | opponent
+		if self.__masks.has_win(opponent, last_cell):
+			# Lost already, the fewer pieces played the worse for the side to move
+			return -(self.WIN_SCORE - bin(occupied).count('1'))
+		if occupied == self.__full:
+			return 0
+		if depth == 0:
+			return self.__evaluate(me, opponent)
+
+		key = (me, opponent)
+		entry = self.__table.get(key)
+		first = -1
+		if entry is not None:
+			entry_depth, entry_value, entry_flag, first = entry
+			if entry_depth >= depth:
+				if entry_flag == self.EXACT:
+					return entry_value
+				if entry_flag == self.LOWER:
+					alpha = max(alpha, entry_value)
+				else:
+					beta = min(beta, entry_value)
+				if alpha >= beta:
+					return entry_value
+
+		alpha_start = alpha
+		best, best_value = -1, -self.WIN_SCORE - 1
+		for cell in self.__candidate_moves(occupied, first):
+			value = -self.__negamax(opponent, me | (1 << cell), depth - 1, -beta, -alpha, cell)
+			if value > best_value:
+				best, best_value = cell, value
+			alpha = max(alpha, value)
+			if alpha >= beta:
+				break
+
+		if best_value <= alpha_start:
+			flag = self.UPPER
+		elif best_value >= beta:
+			flag = self.LOWER
+		else:
+			flag = self.EXACT
+		self.__store(key, (depth, best_value, flag, best))
+		return best_value
+
+	def __store(self, key: Tuple[int, int], entry: tuple) -> None:
+		if key not in self.__table and len(self.__table) >= self.__table_size:
+			# Dicts keep insertion order, evict the oldest entry
+			del self.__table[next(iter(self.__table))]
+		self.__table[key] = entry
+
+	def __evaluate(self, me: int, opponent: int) -> int:
+		""" Open lines weighted by how full they are, from the side to move's view """
+		score = 0
+		for mask in self.__masks.get_masks():
+			mine = mask & me
+			theirs = mask & opponent
+			if mine and not theirs:
+				score += 4 ** bin(mine).count('1')
+			elif theirs and not mine:
+				score -= 4 ** bin(theirs).count('1')
+		return score
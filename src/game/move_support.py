@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Type
+from typing import List, Optional, Type
 
 
 class Move(ABC):
 	""" Class: Effectively Dictionary Wrapper """ 
+	__slots__ = ('__move_contents',)
+
 	def __init__(self, *args, **kwargs):
 		self.__move_contents = kwargs
 
@@ -22,51 +24,70 @@ class MoveResult(ABC):
 		Class: Context Object for Post Move Processing communication 
 		Intent of this is to avoid passing the board around and instead 
 		pass around metatdata about the board 
+
+		State is a single int of bit flags. A result can be reset and handed 
+		back to the board so a runner needs only one instance for every move. 
 	"""
+	APPLIED = 0x1
+	RETRY = 0x2
+	GAME_ENDED = 0x4
+	HAS_WINNER = 0x8
+	DEFAULT_FLAGS = RETRY
+
+	__slots__ = ('__flags',)
+
 	def __init__(self, *args, **kwargs):
-		self.__applied = False
-		self.__retry = True
-		self.__game_ended_with_move = False
-		self.__game_has_winner = False
+		self.__flags = self.DEFAULT_FLAGS
+
+	def reset(self) -> 'MoveResult':
+		""" 
+			Return to the freshly constructed state, returns self for chaining 
+		"""
+		self.__flags = self.DEFAULT_FLAGS
+		return self
+
+	def flags(self) -> int:
+		""" 
+			All state in one read, test against APPLIED, RETRY, GAME_ENDED, HAS_WINNER 
+		"""
+		return self.__flags
 
 	def was_move_applied(self) -> bool:
 		""" 
 			Return True if there were no issues and was applied 
 		"""
-		return self.__applied
+		return bool(self.__flags & self.APPLIED)
 
 	def can_retry(self) -> bool:
 		""" 
 			Return True if there was an error but can retry. False in all other states 
 		"""
-		return self.__retry
+		return bool(self.__flags & self.RETRY)
 
 	def did_move_end_game(self) -> bool:
 		""" 
 			returns True if game board set this for the game ending from move application. 
 		"""
-		return self.__game_ended_with_move
+		return bool(self.__flags & self.GAME_ENDED)
 
 	def game_has_winner(self) -> bool:
 		""" 
 			return True if: Someone has won the game 
 			return False if: No valid moves remain OR game is incomplete 
 		"""
-		return self.__game_has_winner
+		return bool(self.__flags & self.HAS_WINNER)
 
 	def set_move_was_applied(self) -> None:
-		self.__applied = True
-		self.set_cannot_retry()
+		self.__flags = (self.__flags | self.APPLIED) & ~self.RETRY
 
 	def set_cannot_retry(self) -> None:
-		self.__retry = False
+		self.__flags &= ~self.RETRY
 
 	def set_game_ended_from_move(self) -> None:
-		self.__game_ended_with_move = True
-		self.set_cannot_retry()
+		self.__flags = (self.__flags | self.GAME_ENDED) & ~self.RETRY
 
 	def set_game_has_winner(self) -> None:
-		self.__game_has_winner = True
+		self.__flags |= self.HAS_WINNER
 
 
 class LegalMoveChecker(ABC):
@@ -78,3 +99,24 @@ class LegalMoveChecker(ABC):
 	@abstractmethod
 	def display_rules(self)-> bool:
 		pass
+
+	def validate(self, move: Move) -> Optional[Move]:
+		"""
+			Checks the move once for the whole turn. Rulesets may return a 
+			checked move that their board applies without checking it again. 
+
+			/return: the move to apply, None if the move is illegal 
+		"""
+		return move if self.is_legal_move(move) else None
+
+	def get_legal_moves(self, game_board, player_name: str) -> List[Move]:
+		"""
+			Every move the player can make on the board that is both legal 
+			and valid, the bulk form of is_legal_move over the board's moves. 
+			Only for boards with a finite move set, unbounded boards offer 
+			GameBoard.iter_candidate_moves instead. 
+
+			/param: game_board - GameBoard providing iter_legal_moves 
+			/return: list of moves, empty if there are none 
+		"""
+		return [move for move in game_board.iter_legal_moves(player_name) if self.is_legal_move(move)]
@@ -1,11 +1,14 @@
 from abc import ABC, abstractmethod
-from gameboard import Move
+from .gameboard import Move
 
 class Player(ABC):
 	NAME='NAME'
 	NAME_DEFAULT=None
+	# True if get_move may block for a long time (e.g. waits on a human), 
+	# async runners then call it from a worker thread 
+	BLOCKING_GET_MOVE=False
 	def __init__(self, *args, **kwargs):
-		self.__name = kwargs.get('name', None)
+		self.__name = kwargs.get(self.NAME, self.NAME_DEFAULT)
 
 	def get_name(self) -> str:
 		return self.__name
@@ -0,0 +1,140 @@
+import json
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+# Phases timed by GameRunner and TicTacToeGB
+GET_MOVE = 'get_move'
+IS_LEGAL_MOVE = 'is_legal_move'
+UPDATE_BOARD = 'update_board_with_move'
+SEQUENCE_SEARCH = 'sequence_search'
+DISPLAY = 'display'
+
+# Counters kept by GameRunner
+ILLEGAL_MOVES = 'illegal_moves'
+REJECTED_MOVES = 'rejected_moves'
+
+
+class PhaseStats:
+	"""
+		Class: Timings of one phase, with a histogram of power of two
+		microsecond buckets (bucket b holds times below 2 ** b us)
+	"""
+	__slots__ = ('count', 'total_ns', 'min_ns', 'max_ns', 'alloc_bytes', 'buckets')
+
+	def __init__(self):
+		self.count = 0
+		self.total_ns = 0
+		self.min_ns = None
+		self.max_ns = 0
+		self.alloc_bytes = 0
+		self.buckets: Dict[int, int] = {}
+
+	def add(self, elapsed_ns: int, alloc_bytes: int) -> None:
+		self.count += 1
+		self.total_ns += elapsed_ns
+		self.min_ns = elapsed_ns if self.min_ns is None else min(self.min_ns, elapsed_ns)
+		self.max_ns = max(self.max_ns, elapsed_ns)
+		self.alloc_bytes += alloc_bytes
+		bucket = (elapsed_ns // 1000).bit_length()
+		self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+	def as_dict(self) -> dict:
+		return {
+			'count': self.count,
+			'total_seconds': self.total_ns / 1e9,
+			'mean_us': self.total_ns / self.count / 1e3 if self.count else 0.0,
+			'min_us': (self.min_ns or 0) / 1e3,
+			'max_us': self.max_ns / 1e3,
+			'alloc_bytes': self.alloc_bytes,
+			'histogram_us': {f'<{1 << bucket}': n for bucket, n in sorted(self.buckets.items())},
+		}
+
+
+class TurnProfiler:
+	"""
+		Class: Per phase wall time, allocation and counter collection
+
+		Pass one to a GameRunner as GameRunner.PROFILER (the runner hands it
+		on to its board). Runners and boards without a profiler only pay a
+		None check per phase. With TRACK_ALLOCATIONS tracemalloc is started
+		and the net bytes still allocated at the end of each phase are
+		summed; tracing itself slows Python down considerably, so leave it
+		off when only times are wanted.
+	"""
+	TRACK_ALLOCATIONS = 'Track Allocations'
+	TRACK_ALLOCATIONS_DEFAULT = False
+
+	def __init__(self, **kwargs):
+		self.__track_allocations = kwargs.get(self.TRACK_ALLOCATIONS, self.TRACK_ALLOCATIONS_DEFAULT)
+		self.__started_tracing = False
+		if self.__track_allocations and not tracemalloc.is_tracing():
+			tracemalloc.start()
+			self.__started_tracing = True
+		self.__phases: Dict[str, PhaseStats] = {}
+		self.__open: Dict[str, tuple] = {}
+		self.__counters: Dict[str, int] = {}
+
+	def close(self) -> None:
+		""" Stops tracemalloc if this profiler started it """
+		if self.__started_tracing:
+			tracemalloc.stop()
+			self.__started_tracing = False
+
+	def begin(self, phase: str) -> None:
+		memory = tracemalloc.get_traced_memory()[0] if self.__track_allocations else 0
+		self.__open[phase] = (time.perf_counter_ns(), memory)
+
+	def end(self, phase: str) -> None:
+		now = time.perf_counter_ns()
+		started, memory = self.__open.pop(phase)
+		alloc = tracemalloc.get_traced_memory()[0] - memory if self.__track_allocations else 0
+		stats = self.__phases.get(phase)
+		if stats is None:
+			stats = self.__phases[phase] = PhaseStats()
+		stats.add(now - started, alloc)
+
+	def count(self, counter: str, amount: int = 1) -> None:
+		self.__counters[counter] = self.__counters.get(counter, 0) + amount
+
+	def get_phase(self, phase: str) -> Optional[PhaseStats]:
+		return self.__phases.get(phase)
+
+	def get_counter(self, counter: str) -> int:
+		return self.__counters.get(counter, 0)
+
+	def reset(self) -> None:
+		self.__phases.clear()
+		self.__open.clear()
+		self.__counters.clear()
+
+	def as_dict(self) -> dict:
+		return {
+			'phases': {phase: stats.as_dict() for phase, stats in self.__phases.items()},
+			'counters': dict(self.__counters),
+		}
+
+	def to_json(self, path: Optional[str] = None) -> str:
+		""" The JSON text of as_dict(), also written to path if given """
+		text = json.dumps(self.as_dict(), indent=2)
+		if path is not None:
+			with open(path, 'w', encoding='utf-8') as out:
+				out.write(text)
+		return text
+
+	def format_summary(self, bar_width: int = 40) -> str:
+		""" Text table of the phases, slowest total first, each with its histogram """
+		lines: List[str] = []
+		phases = sorted(self.__phases.items(), key=lambda item: -item[1].total_ns)
+		for phase, stats in phases:
+			summary = stats.as_dict()
+			lines.append(f'{phase}: {stats.count} calls, {summary["total_seconds"]:.4f}s total, '
+						 f'{summary["mean_us"]:.1f}us mean, {summary["max_us"]:.1f}us max, '
+						 f'{stats.alloc_bytes} bytes')
+			peak = max(stats.buckets.values())
+			for bucket, n in sorted(stats.buckets.items()):
+				bar = '#' * max(1, n * bar_width // peak)
+				lines.append(f'  <{1 << bucket:>8}us {n:>8} {bar}')
+		for counter, value in sorted(self.__counters.items()):
+			lines.append(f'{counter}: {value}')
+		return '\n'.join(lines)
@@ -0,0 +1,105 @@
+import sys
+import time
+from typing import List, Optional, TextIO
+
+
+class BoardRenderer:
+	"""
+		Class: Buffered renderer for square grid boards
+
+		The renderer keeps its own buffer of padded cell strings that the
+		board updates through cell_changed(), so a frame never re-reads or
+		re-formats the whole board. On an ANSI terminal only the cells that
+		changed since the last frame are redrawn, in place; otherwise each
+		frame is one write of the full board text. MAX_FPS drops frames that
+		come too quickly, their changes are drawn with the next frame.
+		render_to_string() gives the board text without any I/O.
+	"""
+	MAX_FPS = 'Max Frames Per Second'
+	MAX_FPS_DEFAULT = None
+	ANSI = 'ANSI'
+	ANSI_DEFAULT = None  # None: use ANSI when the stream is a terminal
+	STREAM = 'Stream'
+	STREAM_DEFAULT = None  # None: sys.stdout at draw time
+	EMPTY_CELL_VALUE = 'Empty Cell Value'
+	EMPTY_CELL_DEFAULT = ' '
+
+	CLEAR_SCREEN = '\x1b[H\x1b[2J'
+	SEPARATOR = ' | '
+
+	def __init__(self, **kwargs):
+		max_fps = kwargs.get(self.MAX_FPS, self.MAX_FPS_DEFAULT)
+		self.__frame_interval = 1.0 / max_fps if max_fps else 0.0
+		self.__ansi = kwargs.get(self.ANSI, self.ANSI_DEFAULT)
+		self.__stream: Optional[TextIO] = kwargs.get(self.STREAM, self.STREAM_DEFAULT)
+		self.__empty = kwargs.get(self.EMPTY_CELL_VALUE, self.EMPTY_CELL_DEFAULT)
+		self.__size = 0
+		self.__width = len(self.__empty)
+		self.__values: List[str] = []
+		self.__dirty = set()
+		self.__full_redraw = True
+		self.__last_frame = float('-inf')
+		self.__frames = 0
+
+	def attach(self, board_size: int) -> None:
+		""" Starts a new, empty board of board_size x board_size """
+		self.__size = board_size
+		self.__values = [self.__empty] * (board_size * board_size)
+		self.__dirty.clear()
+		self.__full_redraw = True
+
+	def cell_changed(self, x: int, y: int, occupant: Optional[str]) -> None:
+		value = self.__empty if occupant is None else str(occupant)
+		cell = y * self.__size + x
+		self.__values[cell] = value
+		if len(value) > self.__width:
+			# Every cell gets wider, positions on screen all move
+			self.__width = len(value)
+			self.__full_redraw = True
+		self.__dirty.add(cell)
+
+	def frames_drawn(self) -> int:
+		return self.__frames
+
+	def render_to_string(self) -> str:
+		width = self.__width
+		size = self.__size
+		rows = [self.SEPARATOR.join(value.ljust(width) for value in self.__values[row * size:(row + 1) * size])
+				for row in range(size)]
+		delim = '\n' + '-' * (size * (width + len(self.SEPARATOR)) - len(self.SEPARATOR)) + '\n'
+		return delim.join(rows)
+
+	def draw(self, force: bool = False) -> bool:
+		"""
+			Draws a frame unless one was drawn less than 1 / MAX_FPS ago.
+			/param: force - ignore the frame rate limit (e.g. the final position)
+			/return: True if a frame was written
+		"""
+		now = time.perf_counter()
+		if not force and now - self.__last_frame < self.__frame_interval:
+			return False
+		stream = self.__stream if self.__stream is not None else sys.stdout
+		ansi = self.__ansi if self.__ansi is not None else stream.isatty()
+		if not ansi:
+			stream.write(self.render_to_string() + '\n')
+		elif self.__full_redraw:
+			stream.write(self.CLEAR_SCREEN + self.render_to_string() + '\n')
+		elif self.__dirty:
+			stream.write(self.__render_changes())
+		self.__dirty.clear()
+		self.__full_redraw = False
+		stream.flush()
+		self.__last_frame = now
+		self.__frames += 1
+		return True
+
+	def __render_changes(self) -> str:
+		""" Cursor moves and text for the dirty cells, leaving the cursor below the board """
+		step = self.__width + len(self.SEPARATOR)
+		parts = []
+		for cell in self.__dirty:
+			row, column = divmod(cell, self.__size)
+			# Rows alternate with delimiter lines, ANSI positions are 1 based
+			parts.append(f'\x1b[{2 * row + 1};{column * step + 1}H{self.__values[cell].ljust(self.__width)}')
+		parts.append(f'\x1b[{2 * self.__size};1H')
+		return ''.join(parts)
@@ -1,6 +1,14 @@
 from abc import ABC, abstractmethod
 from .interfaces import GameBoard, BoardLocation
 
+def board_topology(gb: GameBoard): 
+	""" The board's neighbour index if it has one along with a cell id view, else None """
+	get_topology = getattr(gb, 'get_topology', None)
+	if get_topology is None or not hasattr(gb, 'cells_view'): 
+		return None
+	return get_topology()
+
+
 class SequenceSearchInterface(ABC): 
 
 	@abstractmethod
@@ -45,16 +53,59 @@ class SequenceSearcher(SequenceSearchInterface):
 		
 		self.__search_dir = { 
 			self.SETTING_HORIZONTAL: 
-			    self._search_h if self.__search_horizontal else self.no_search, 
+			    self._search_h if self.__search_horizontal else self._no_search, 
 			self.SETTING_VERTICALS:  
-			    self._search_v if self.__search_vertical  else self.no_search, 
+			    self._search_v if self.__search_vertical  else self._no_search, 
 			self.SETTING_DIAGONALS:  
-			    self._search_d if self.__search_diagonal else self.no_search
+			    self._search_d if self.__search_diagonal else self._no_search
 		}
+		# Enabled (direction, opposite direction) axes per neighbour index 
+		self.__topology_axes = {}
 
 	def sequence_size(self):
 		return self.__seq_num
 
+	@staticmethod
+	def _occupant(spot: BoardLocation):
+		return spot.get_board_metadata().get(BoardLocation.OCCUPANT)
+
+	def _count_run(self, starting_spot: BoardLocation, gb: GameBoard, 
+				   step: tuple, limit: int) -> int:
+		""" Walk from starting_spot along step = (dx, dy) 
+			/param: limit - the maximum number of spaces to walk 
+
+			/return: the number of consecutive spaces (excluding starting_spot) 
+				held by the same occupant as starting_spot 
+		"""
+		occupant = self._occupant(starting_spot)
+		coordinates = starting_spot.get_board_coordinates()
+		x = coordinates[BoardLocation.X_POS]
+		y = coordinates[BoardLocation.Y_POS]
+		dx, dy = step
+		count = 0
+		while count < limit:
+			x += dx
+			y += dy
+			spot = gb._get_location_at(x, y)
+			if spot is None or self._occupant(spot) != occupant:
+				break
+			count += 1
+		return count
+
+	def _search_line(self, starting_spot: BoardLocation, gb: GameBoard, 
+					 sqs: int, step: tuple) -> bool:
+		""" Search Method: Look for a sequence along the line through starting_spot 
+			Walks at most sqs - 1 spaces each way so the cost is O(sqs). 
+		"""
+		if sqs < 1 or self._occupant(starting_spot) is None:
+			return False
+		dx, dy = step
+		found = 1 + self._count_run(starting_spot, gb, (dx, dy), sqs - 1)
+		if found >= sqs:
+			return True
+		found += self._count_run(starting_spot, gb, (-dx, -dy), sqs - found)
+		return found >= sqs
+
 	def _no_search(self, starting_spot: BoardLocation, gb: GameBoard, sqs: int) -> bool:
 		""" Search Method: 
             /param: starting_spot - the location to start a search 
@@ -73,7 +124,7 @@ class SequenceSearcher(SequenceSearchInterface):
 			
 			/return: True if there is a sequence sqs long along a horizontal 
 		"""
-		pass
+		return self._search_line(starting_spot, gb, sqs, (1, 0))
 
 	def _search_v(self, starting_spot: BoardLocation, gb: GameBoard, sqs: int) -> bool:
 		""" Search Method: Look for a vertical sequence 
@@ -83,7 +134,7 @@ class SequenceSearcher(SequenceSearchInterface):
 			
 			/return: True if there is a sequence sqs long along a vertical 
 		"""
-		pass
+		return self._search_line(starting_spot, gb, sqs, (0, 1))
 
 	def _search_d(self, starting_spot: BoardLocation, gb: GameBoard, sqs: int) -> bool:
 		""" Search Method: Look for a diagonal sequence 
@@ -93,26 +144,95 @@ class SequenceSearcher(SequenceSearchInterface):
 			
 			/return: True if there is a sequence sqs long along a diagonal 
 		"""
-		pass
+		return self._search_line(starting_spot, gb, sqs, (1, 1)) or \
+			self._search_line(starting_spot, gb, sqs, (1, -1))
 	
 	def search(self, *args, **kwargs) -> bool:
 		if self.__local_search: 
-			return self._full_search(*args, **kwargs)
+			return self._spot_search(*args, **kwargs)
 		
-		return self._spot_search(*args, **kwargs)
+		return self._full_search(*args, **kwargs)
 	
 	def _full_search(self, *args, **kwargs) -> bool: 
 		gb = kwargs.get(self.SEARCH_GAME_BOARD)
+		topology = board_topology(gb)
+		if topology is not None and not topology.is_rectangular(): 
+			# Wrapped and hex lines are not grid line views, walk every occupied cell instead 
+			cell_ids = gb.cells_view()
+			return any(self._search_cell(topology, cell_ids, cell) for cell in range(len(cell_ids)))
+		iter_line_views = getattr(gb, 'iter_line_views', None)
+		if iter_line_views is not None: 
+			return self._scan_line_views(iter_line_views(self.sequence_size(), self.__search_horizontal, 
+				self.__search_vertical, self.__search_diagonal))
 		for spot in gb:
 			for _, search_method in self.__search_dir.items():
 				if search_method(spot, gb, self.sequence_size()):
 					return True
 		return False
 	
+	def _scan_line_views(self, views) -> bool: 
+		""" Run lengths over boards' zero copy line views of player ids (0 empty), no locations built """
+		sqs = self.sequence_size()
+		for view in views: 
+			run = 0
+			previous = 0
+			for player_id in view: 
+				if player_id and player_id == previous: 
+					run += 1
+				else: 
+					run = 1 if player_id else 0
+				if run >= sqs: 
+					return True
+				previous = player_id
+		return False
+
 	def _spot_search(self, *args, **kwargs) -> bool: 
 		gb = kwargs.get(self.SEARCH_GAME_BOARD)
 		start = kwargs.get(self.SEARCH_START_LOCATION, None)
 		if start is None: 
 			return self._full_search(*args, **kwargs)
 
-		raise NotImplementedError('Local Only Search not currently supported')
\ No newline at end of file
+		# Only the lines passing through the last placed piece can have changed 
+		topology = board_topology(gb)
+		if topology is not None: 
+			coordinates = start.get_board_coordinates()
+			cell = topology.cell_index(coordinates[BoardLocation.X_POS], coordinates[BoardLocation.Y_POS])
+			return self._search_cell(topology, gb.cells_view(), cell)
+		for _, search_method in self.__search_dir.items():
+			if search_method(start, gb, self.sequence_size()):
+				return True
+		return False
+
+	def _search_cell(self, topology, cell_ids, cell: int) -> bool: 
+		""" Search Method: Look for a sequence through cell with the neighbour index step tables 
+			/param: cell_ids - player id per cell index, 0 empty (a board's cells_view()) 
+
+			/return: True if there is a sequence sqs long on an enabled axis through cell 
+		"""
+		sqs = self.sequence_size()
+		if sqs < 1 or not cell_ids[cell]: 
+			return False
+		for forward, backward in self.__axes(topology): 
+			found = 1 + topology.count_run(cell_ids, cell, forward, sqs - 1)
+			if found < sqs: 
+				found += topology.count_run(cell_ids, cell, backward, sqs - found)
+			if found >= sqs: 
+				return True
+		return False
+
+	def __axes(self, topology) -> list: 
+		axes = self.__topology_axes.get(topology)
+		if axes is None: 
+			axes = []
+			for forward, backward in topology.axes(): 
+				dx, dy = topology.directions()[forward]
+				if dy == 0: 
+					enabled = self.__search_horizontal
+				elif dx == 0: 
+					enabled = self.__search_vertical
+				else: 
+					enabled = self.__search_diagonal
+				if enabled: 
+					axes.append((forward, backward))
+			axes = self.__topology_axes[topology] = axes
+		return axes
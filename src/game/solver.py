@@ -0,0 +1,264 @@
+"""
+	Retrograde solver for small m,n,k games and the memory mapped tables it writes.
+
+	Usage (from src):
+		python -m game.solver --size 3 --seq 3 --out output/3x3k3.ttt [--workers N]
+"""
+import argparse
+import mmap
+import os
+import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+from .interfaces import Move, Player
+from .bitboard import WinMaskTable
+from .tictactoe import TicTacToeGB, TicTacToeMove
+
+# Values are from the view of the side to move
+UNREACHABLE, WIN, LOSS, DRAW = 0, 1, 2, 3
+EMPTY, FIRST, SECOND = 0, 1, 2
+
+_MAGIC = b'TTTSOLVE'
+_HEADER = struct.Struct('<8sHHHH')  # magic, version, board size, sequence, reserved
+_VERSION = 1
+_VALUES_PER_BYTE = 4
+_CHUNK = 20000
+
+
+def _powers(board_size: int) -> List[int]:
+	return [3 ** cell for cell in range(board_size * board_size)]
+
+
+def _decode(index: int, board_size: int) -> Tuple[int, int, List[int]]:
+	""" return (first player bits, second player bits, empty cells) """
+	first = second = 0
+	empty = []
+	for cell in range(board_size * board_size):
+		index, digit = divmod(index, 3)
+		if digit == FIRST:
+			first |= 1 << cell
+		elif digit == SECOND:
+			second |= 1 << cell
+		else:
+			empty.append(cell)
+	return first, second, empty
+
+
+def _position(index: int, board_size: int, seq_num: int):
+	"""
+		return (is terminal, digit of the side to move, empty cells, previous
+			mover won). Only the previous mover can hold a line in a reachable position.
+	"""
+	first, second, empty = _decode(index, board_size)
+	masks = WinMaskTable.for_board(board_size, seq_num)
+	first_count = bin(first).count('1')
+	second_count = bin(second).count('1')
+	to_move = FIRST if first_count == second_count else SECOND
+	previous = second if to_move == FIRST else first
+	won = masks.has_win(previous)
+	return won or not empty, to_move, empty, won
+
+
+def _expand_chunk(args) -> array:
+	""" Worker: the sorted, unique successors of the non terminal positions given """
+	board_size, seq_num, indices = args
+	powers = _powers(board_size)
+	children = set()
+	for index in indices:
+		terminal, to_move, empty, _ = _position(index, board_size, seq_num)
+		if terminal:
+			continue
+		for cell in empty:
+			children.add(index + to_move * powers[cell])
+	return array('q', sorted(children))
+
+
+def _solve_chunk(args) -> bytes:
+	""" Worker: values for the given positions, reading successors from the table file """
+	board_size, seq_num, path, indices = args
+	powers = _powers(board_size)
+	values = bytearray(len(indices))
+	with SolvedTable(path) as table:
+		for slot, index in enumerate(indices):
+			terminal, to_move, empty, won = _position(index, board_size, seq_num)
+			if terminal:
+				values[slot] = LOSS if won else DRAW
+				continue
+			child_values = {table.value(index + to_move * powers[cell]) for cell in empty}
+			if LOSS in child_values:
+				values[slot] = WIN
+			elif DRAW in child_values:
+				values[slot] = DRAW
+			else:
+				values[slot] = LOSS
+	return bytes(values)
+
+
+def _chunks(indices: array, size: int):
+	for start in range(0, len(indices), size):
+		yield indices[start:start + size]
+
+
+def solve(board_size: int, seq_num: int, path: str, workers: Optional[int] = None) -> dict:
+	"""
+		Enumerates every reachable position layer by layer (pieces on the
+		board), then assigns values from the last layer back to the empty
+		board. Each layer is split into chunks across a process pool; the
+		backward pass workers read the successor layer from the table file.
+
+		return counts of positions per value
+	"""
+	cells = board_size * board_size
+	table_bytes = -(-(3 ** cells) // _VALUES_PER_BYTE)
+	directory = os.path.dirname(path)
+	if directory:
+		os.makedirs(directory, exist_ok=True)
+	with open(path, 'wb') as out:
+		out.write(_HEADER.pack(_MAGIC, _VERSION, board_size, seq_num, 0))
+		out.truncate(_HEADER.size + table_bytes)
+
+	counts = {WIN: 0, LOSS: 0, DRAW: 0}
+	with ProcessPoolExecutor(max_workers=workers) as pool:
+		layers = [array('q', [0])]
+		while len(layers[-1]):
+			jobs = [(board_size, seq_num, chunk) for chunk in _chunks(layers[-1], _CHUNK)]
+			merged = set()
+			for children in pool.map(_expand_chunk, jobs):
+				merged.update(children)
+			layers.append(array('q', sorted(merged)))
+
+		with open(path, 'r+b') as out, mmap.mmap(out.fileno(), 0) as table:
+			for layer in reversed(layers):
+				chunks = list(_chunks(layer, _CHUNK))
+				jobs = [(board_size, seq_num, path, chunk) for chunk in chunks]
+				for chunk, values in zip(chunks, pool.map(_solve_chunk, jobs)):
+					for index, value in zip(chunk, values):
+						offset = _HEADER.size + index // _VALUES_PER_BYTE
+						table[offset] |= value << (2 * (index % _VALUES_PER_BYTE))
+						counts[value] += 1
+				# Workers map the file themselves, make this layer visible to them
+				table.flush()
+	return counts
+
+
+class SolvedTable:
+	"""
+		Class: Read only, memory mapped view of a solver table
+
+		Values are packed 2 bits per position, indexed by the base 3 encoding
+		of the board (cell y * size + x is digit 3 ** cell; EMPTY, FIRST or
+		SECOND). Every process mapping the same file shares one copy in the
+		page cache, and a lookup is a single byte read.
+	"""
+	def __init__(self, path: str):
+		self.__file = open(path, 'rb')  # pylint: disable=consider-using-with
+		self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+		magic, version, board_size, seq_num, _ = _HEADER.unpack_from(self.__map, 0)
+		if magic != _MAGIC or version != _VERSION:
+			self.close()
+			raise ValueError(f'{path} is not a version {_VERSION} solver table')
+		self.__board_size = board_size
+		self.__seq_num = seq_num
+		self.__powers = _powers(board_size)
+
+	def __enter__(self) -> 'SolvedTable':
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.close()
+
+	def close(self) -> None:
+		self.__map.close()
+		self.__file.close()
+
+	def board_size(self) -> int:
+		return self.__board_size
+
+	def sequence_size(self) -> int:
+		return self.__seq_num
+
+	def value(self, index: int) -> int:
+		byte = self.__map[_HEADER.size + index // _VALUES_PER_BYTE]
+		return (byte >> (2 * (index % _VALUES_PER_BYTE))) & 3
+
+	def index_of(self, first: int, second: int) -> int:
+		""" Base 3 index of the position given each player's cell bitmask """
+		index = 0
+		for cell, power in enumerate(self.__powers):
+			if (first >> cell) & 1:
+				index += power
+			elif (second >> cell) & 1:
+				index += 2 * power
+		return index
+
+	def best_move(self, first: int, second: int) -> Optional[int]:
+		"""
+			return the cell of a value maximising move for the side to move,
+			None if the position is over or not in the table
+		"""
+		index = self.index_of(first, second)
+		if self.value(index) == UNREACHABLE:
+			return None
+		to_move = FIRST if bin(first).count('1') == bin(second).count('1') else SECOND
+		occupied = first | second
+		best, best_rank = None, -1
+		# Rank successor values from the mover's view: opponent loses > draw > opponent wins
+		rank = {LOSS: 2, DRAW: 1, WIN: 0}
+		for cell, power in enumerate(self.__powers):
+			if (occupied >> cell) & 1:
+				continue
+			child_rank = rank.get(self.value(index + to_move * power), -1)
+			if child_rank > best_rank:
+				best, best_rank = cell, child_rank
+		return best
+
+
+class TablePlayer(Player):
+	"""
+		Class: Perfect player backed by a SolvedTable lookup per move
+	"""
+	def __init__(self, name: str, board: TicTacToeGB, table: SolvedTable):
+		super().__init__(**{Player.NAME: name})
+		if table.board_size() != board.get_board_size() or table.sequence_size() != board.get_sequence_size():
+			raise ValueError('Solver table does not match the board configuration')
+		self.__board = board
+		self.__table = table
+
+	def get_move(self) -> Move:
+		size = self.__board.get_board_size()
+		mine = theirs = 0
+		for y, row in enumerate(self.__board.get_cells()):
+			for x, occupant in enumerate(row):
+				if occupant is None:
+					continue
+				if occupant == self.get_name():
+					mine |= 1 << (y * size + x)
+				else:
+					theirs |= 1 << (y * size + x)
+		# Equal piece counts means we are the first player
+		if bin(mine).count('1') == bin(theirs).count('1'):
+			cell = self.__table.best_move(mine, theirs)
+		else:
+			cell = self.__table.best_move(theirs, mine)
+		y, x = divmod(cell, size)
+		return TicTacToeMove(x, y, self.get_name())
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--size', type=int, default=TicTacToeGB.BOARD_SIZE_DEFAULT)
+	parser.add_argument('--seq', type=int, default=TicTacToeGB.SEQUENCE_NUM_DEFAULT)
+	parser.add_argument('--out', required=True, help='table file to write')
+	parser.add_argument('--workers', type=int, default=None)
+	args = parser.parse_args()
+	counts = solve(args.size, args.seq, args.out, args.workers)
+	with SolvedTable(args.out) as table:
+		names = {WIN: 'first player wins', LOSS: 'second player wins', DRAW: 'draw'}
+		print(f'{sum(counts.values())} reachable positions, '
+			  f'{counts[WIN]} won / {counts[LOSS]} lost / {counts[DRAW]} drawn for the side to move')
+		print(f'Game value: {names[table.value(0)]}')
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,182 @@
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from .interfaces import Move, MoveResult, LegalMoveChecker, GameBoard, BoardLocation
+from .sequence_searcher import SequenceSearcher
+from .tictactoe import TicTacToeMove, TicTacToeLocation, ValidatedMove
+
+
+class UnboundedRuleset(LegalMoveChecker):
+	def is_legal_move(self, move: Move) -> bool:
+		"""
+			A move is legal if it has integer coordinates and a valid name to place.
+			There are no bounds, any coordinate (including negative) is on the board.
+		"""
+		_move = TicTacToeMove.from_raw(move)
+		if not isinstance(_move.get_x(), int) or not isinstance(_move.get_y(), int):
+			return False
+		return _move.get_name() is not None and len(_move.get_name()) > 0
+
+	def validate(self, move: Move) -> Optional[Move]:
+		if not self.is_legal_move(move):
+			return None
+		return ValidatedMove.checked(move, self)
+
+	def display_rules(self) -> bool:
+		return True
+
+	def get_legal_moves(self, game_board, player_name: str) -> List[Move]:
+		raise ValueError('An open board has infinitely many legal moves, '
+						 'use iter_legal_moves lazily or iter_candidate_moves')
+
+
+class SparseGB(GameBoard):
+	"""
+		Class: Unbounded board for open board (infinite gomoku) variants
+
+		Only occupied cells are stored, keyed by (x, y). Memory and iteration
+		cost follow the number of pieces played rather than board area.
+		Iteration yields occupied cells only, so a full sequence search never
+		touches empty space.
+	"""
+	EMPTY_CELL_VALUE = "Empty Cell Value"
+	EMPTY_CELL_DEFAULT = "."
+	SEQUENCE_SEARCH_TOOL = "Sequence Search Tool"
+	SEQUENCE_NUM = "Number In A Row"
+	SEQUENCE_NUM_DEFAULT = 5
+
+	NEIGHBOUR_OFFSETS = tuple((dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy)
+
+	def __init__(self, *args, **kwargs):
+		self.__cells: Dict[Tuple[int, int], str] = {}
+		self.__frontier: Set[Tuple[int, int]] = set()
+		self.__empty_cell = kwargs.get(self.EMPTY_CELL_VALUE, self.EMPTY_CELL_DEFAULT)
+		self.__board_ruleset = UnboundedRuleset()
+		self.__game_completed = False
+		self.__seq_req = kwargs.get(self.SEQUENCE_NUM, self.SEQUENCE_NUM_DEFAULT)
+		self.__sequence_searcher = kwargs.get(self.SEQUENCE_SEARCH_TOOL,
+			SequenceSearcher(self.__seq_req, **{SequenceSearcher.LOCAL_SEARCH_ONLY: True}))
+
+	def initialize(self, *args, **kwargs):
+		self.__cells = {}
+		self.__frontier = set()
+		self.__game_completed = False
+
+	def get_board_ruleset(self) -> LegalMoveChecker:
+		return self.__board_ruleset
+
+	def update_board_with_move(self, move: Move, result: Optional[MoveResult] = None) -> MoveResult:
+		if not isinstance(move, TicTacToeMove) or move.get_checker() is not self.__board_ruleset:
+			assert self.get_board_ruleset().is_legal_move(move), "Illegal "\
+				"moved passed into update_board_with_move"
+
+		_move = TicTacToeMove.from_raw(move)
+		res = MoveResult() if result is None else result.reset()
+		cell = (_move.get_x(), _move.get_y())
+		if cell in self.__cells:
+			return res
+		self.__apply_move_to_cell(cell, _move.get_name())
+		res.set_move_was_applied()
+
+		if self.__sequence_searcher.search(**{
+			SequenceSearcher.SEARCH_GAME_BOARD: self,
+			SequenceSearcher.SEARCH_START_LOCATION: self.__location(cell)
+		}):
+			self.__game_completed = True
+			res.set_game_has_winner()
+			res.set_game_ended_from_move()
+		# An open board never runs out of moves, there is no tie
+		return res
+
+	def iter_legal_moves(self, player_name: str) -> Iterator[Move]:
+		"""
+			Every empty cell is legal on an open board, so this never ends: 
+			empty cells are yielded ring by ring outwards from the origin. 
+		"""
+		if self.__game_completed:
+			return
+		if (0, 0) not in self.__cells:
+			yield TicTacToeMove(0, 0, player_name)
+		ring = 0
+		while True:
+			ring += 1
+			for dx in range(-ring, ring + 1):
+				for dy in ((-ring, ring) if abs(dx) < ring else range(-ring, ring + 1)):
+					if (dx, dy) not in self.__cells:
+						yield TicTacToeMove(dx, dy, player_name)
+
+	def iter_candidate_moves(self, player_name: str) -> Iterator[Move]:
+		"""
+			The frontier (cells touching a piece), or the origin on an empty board 
+		"""
+		if self.__game_completed:
+			return
+		if not self.__cells:
+			yield TicTacToeMove(0, 0, player_name)
+			return
+		for x, y in self.__frontier:
+			yield TicTacToeMove(x, y, player_name)
+
+	def is_game_complete(self):
+		return self.__game_completed
+
+	def get_occupied_count(self) -> int:
+		return len(self.__cells)
+
+	def get_occupant(self, x: int, y: int) -> Optional[str]:
+		return self.__cells.get((x, y))
+
+	def get_bounds(self) -> Optional[Tuple[int, int, int, int]]:
+		"""
+			/return: (min_x, min_y, max_x, max_y) of the occupied cells, None if empty
+		"""
+		if not self.__cells:
+			return None
+		xs = [x for x, _ in self.__cells]
+		ys = [y for _, y in self.__cells]
+		return (min(xs), min(ys), max(xs), max(ys))
+
+	def get_frontier(self) -> Set[Tuple[int, int]]:
+		"""
+			Empty cells touching at least one piece. Maintained on every move,
+			these are the natural candidate moves on an open board.
+		"""
+		return set(self.__frontier)
+
+	def display(self) -> None:
+		bounds = self.get_bounds()
+		if bounds is None:
+			print(self.__empty_cell)
+			return
+		min_x, min_y, max_x, max_y = bounds
+		print_data = []
+		for y in range(min_y, max_y + 1):
+			row = [self.__cells.get((x, y), self.__empty_cell) for x in range(min_x, max_x + 1)]
+			print_data.append(" ".join(row))
+		print(f'x: {min_x}..{max_x}, y: {min_y}..{max_y}')
+		print('\n'.join(print_data))
+
+	def _get_surrounding_locations(self, spot: BoardLocation) -> List[BoardLocation]:
+		coordinates = spot.get_board_coordinates()
+		x = coordinates[BoardLocation.X_POS]
+		y = coordinates[BoardLocation.Y_POS]
+		return [self.__location((x + dx, y + dy)) for dx, dy in self.NEIGHBOUR_OFFSETS]
+
+	def _get_location_at(self, x: int, y: int) -> Optional[BoardLocation]:
+		# Every coordinate is on an unbounded board
+		return self.__location((x, y))
+
+	def _iter_board_locations(self) -> Iterator[BoardLocation]:
+		# Snapshot, so moves made while iterating do not break the iteration
+		for cell in list(self.__cells):
+			yield self.__location(cell)
+
+	def __location(self, cell: Tuple[int, int]) -> TicTacToeLocation:
+		return TicTacToeLocation(cell[0], cell[1], self.__cells.get(cell))
+
+	def __apply_move_to_cell(self, cell: Tuple[int, int], name: str):
+		self.__cells[cell] = name
+		self.__frontier.discard(cell)
+		x, y = cell
+		for dx, dy in self.NEIGHBOUR_OFFSETS:
+			neighbour = (x + dx, y + dy)
+			if neighbour not in self.__cells:
+				self.__frontier.add(neighbour)
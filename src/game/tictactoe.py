@@ -1,32 +1,97 @@
 import random
 import string
+from array import array
+from typing import Iterator, List, Optional, Tuple
 from .interfaces import Move, MoveResult, Player, LegalMoveChecker, \
-	GameBoard, GameRunner, SequenceSearcher
+	GameBoard, GameRunner, BoardLocation
+from .sequence_searcher import SequenceSearcher
+from .bitboard import WinMaskTable
+from .cell_index import IndexedCellSet
+from .topology import Topology
+from . import profiling
 
 class TicTacToeMove(Move): 
+	"""
+		Slot based move, fields are held directly rather than in a dict. 
+		raw() builds the dict form on request, and from_raw hands back 
+		TicTacToeMoves as is so the hot path never re-wraps a move. 
+		A LegalMoveChecker that validated the move marks it as checked in 
+		place, changing any field with add() clears the mark. 
+	"""
 	X_POS = 'X Position'
 	Y_POS = 'Y Position'
 	NAME = 'Name'
-	def __init__(self, x_pos, y_pos, name):
-		super().__init__(**{
-			self.X_POS: x_pos, 
-			self.Y_POS: y_pos, 
-			self.NAME: name
-		})
+	__slots__ = ('__x', '__y', '__name', '__checker')
+
+	def __init__(self, x_pos, y_pos, name):  # pylint: disable=super-init-not-called
+		self.__x = x_pos
+		self.__y = y_pos
+		self.__name = name
+		self.__checker = None
 	def get_x(self): 
-		return self.raw()[self.X_POS]
+		return self.__x
 	def get_y(self): 
-		return self.raw()[self.Y_POS]
+		return self.__y
 	def get_name(self): 
-		return self.raw()[self.NAME]
+		return self.__name
+
+	def get_checker(self) -> Optional[LegalMoveChecker]: 
+		""" The checker that validated the move as it is now, None if unchecked """
+		return self.__checker
+
+	def mark_checked(self, checker: LegalMoveChecker) -> None: 
+		self.__checker = checker
+
+	def raw(self) -> dict: 
+		return {self.X_POS: self.__x, self.Y_POS: self.__y, self.NAME: self.__name}
+
+	def add(self, key, val): 
+		self.__checker = None
+		if key == self.X_POS: 
+			self.__x = val
+		elif key == self.Y_POS: 
+			self.__y = val
+		elif key == self.NAME: 
+			self.__name = val
+		else: 
+			raise KeyError(f'{key} is not a {type(self).__name__} field')
 		
 	@classmethod
 	def from_raw(cls, m: Move): 
+		if isinstance(m, TicTacToeMove): 
+			return m
 		raw = m.raw()
 		return TicTacToeMove(raw[cls.X_POS], raw[cls.Y_POS], raw[cls.NAME])
+
+
+class ValidatedMove(TicTacToeMove): 
+	""" 
+		Immutable checked copy of a move that was not a TicTacToeMove, see 
+		LegalMoveChecker.validate. TicTacToeMoves are marked in place instead, 
+		so the usual turn allocates nothing. 
+	"""
+	__slots__ = ()
+
+	def __init__(self, x_pos, y_pos, name, checker: LegalMoveChecker): 
+		super().__init__(x_pos, y_pos, name)
+		self.mark_checked(checker)
+
+	def add(self, key, val): 
+		raise TypeError(f'{type(self).__name__} cannot be changed once checked')
+
+	@classmethod
+	def checked(cls, move: Move, checker: LegalMoveChecker) -> TicTacToeMove: 
+		""" Marks a TicTacToeMove as checked in place, copies any other move """
+		if isinstance(move, TicTacToeMove): 
+			move.mark_checked(checker)
+			return move
+		raw = move.raw()
+		return cls(raw[cls.X_POS], raw[cls.Y_POS], raw[cls.NAME], checker)
 		
 			
 class HumanInputPlayer(Player): 
+	BLOCKING_GET_MOVE = True
+
 	def __init__(self, name: str):
 		super().__init__(**{Player.NAME:name})
 	
@@ -39,39 +104,61 @@ class HumanInputPlayer(Player):
 		return int(input(f'please insert {p} of type [int]'))
 
 class StupidAI(Player):
-	TIC_TAC_TOE_MOVES = { 
-		0: (0,0), 1: (0,1), 2: (0,2),
-		3: (1,0), 4: (1,1), 5: (1,2),
-		6: (2,0), 7: (2,1), 8: (2,2),
-	}
-
-	def __init__(self):
-		super().__init__(**{Player.NAME:self.__generate_random_name()})
-		self.__attempted_moves = {}
-
-	def __pick_unique_move(self): 
-		m = self.__get_unique()
-		self.__attempted_moves[m] = self.TIC_TAC_TOE_MOVES[m]
-		return self.TIC_TAC_TOE_MOVES[m]
-	
+	"""
+		Class: Plays a uniformly random empty cell, O(1) per move
+
+		Given the game board it samples the board's own free cell index, so 
+		cells taken by either player are never picked. Without a board it 
+		walks a lazily shuffled permutation of a BOARD_SIZE board instead 
+		(one Fisher-Yates step per move), which only knows its own moves. 
+	"""
+	GAME_BOARD = 'Game Board'
+	GAME_BOARD_DEFAULT = None
+	BOARD_SIZE = 'Board Size'
+	BOARD_SIZE_DEFAULT = 3
+	SEED = 'Seed'
+	SEED_DEFAULT = None
+
+	def __init__(self, **kwargs):
+		if kwargs.get(Player.NAME) is None: 
+			kwargs[Player.NAME] = self.__generate_random_name()
+		super().__init__(**kwargs)
+		self.__board = kwargs.get(self.GAME_BOARD, self.GAME_BOARD_DEFAULT)
+		self.__board_size = kwargs.get(self.BOARD_SIZE, self.BOARD_SIZE_DEFAULT)
+		self.__rng = random.Random(kwargs.get(self.SEED, self.SEED_DEFAULT))
+		self.__cells = []
+		self.__next = 0
+		self.initialize()
+
+	def initialize(self) -> None: 
+		self.__cells = list(range(self.__board_size * self.__board_size))
+		self.__next = 0
+
 	def get_move(self) -> Move: 
 		_column, _row = self.__pick_unique_move()
 		return TicTacToeMove(_column, _row, self.get_name())
+
+	def __pick_unique_move(self) -> Tuple[int, int]: 
+		if self.__board is not None: 
+			free_cell = self.__board.sample_free_cell(self.__rng)
+			if free_cell is None: 
+				raise RuntimeError(f'{self.get_name()} has no moves left, the board is full')
+			return free_cell
+		cells = self.__cells
+		if self.__next >= len(cells): 
+			raise RuntimeError(f'{self.get_name()} has no moves left, initialize() starts a new game')
+		pick = self.__rng.randrange(self.__next, len(cells))
+		cells[self.__next], cells[pick] = cells[pick], cells[self.__next]
+		self.__next += 1
+		_row, _column = divmod(cells[self.__next - 1], self.__board_size)
+		return _column, _row
 	
 	def __generate_random_name(self): 
 		l = string.ascii_lowercase
 		result_str = ''.join(random.choice(l) for i in range(10))
 		return f'Ai-Player-{result_str}'
 
-	def __get_unique(self): 
-		m = random.choice(self.TIC_TAC_TOE_MOVES.keys())
-		while m in self.__attempted_moves: 
-			m = random.choice(self.TIC_TAC_TOE_MOVES.keys())
-		return m
-
 
-
-			
 class TicTacToeRuleset(LegalMoveChecker):
 	def __init__(self, board_size): 
 		self.__board_size = board_size
@@ -82,20 +169,74 @@ class TicTacToeRuleset(LegalMoveChecker):
 		"""
 			A move is legal if it's in bounds and has a valid name to place
 		"""
-		_move = TicTacToeMove.from_raw(move)
-		def is_out_of_bounds(to_check): 
-			return self.__min_row_col < to_check or to_check > self.__max_row_col 
-		if is_out_of_bounds(_move.get_x()): 
-			return False 
-		if is_out_of_bounds(_move.get_y()): 
-			return False 
-		return _move.get_name() is not None and len(_move.get_name()) > 0
+		x, y, name = self.__fields(move)
+		return self.__is_legal(x, y, name)
+
+	def validate(self, move: Move) -> Optional[Move]: 
+		""" return the move marked as checked, the board applies it without checking again, None if illegal """
+		x, y, name = self.__fields(move)
+		if not self.__is_legal(x, y, name): 
+			return None
+		return ValidatedMove.checked(move, self)
+
+	def is_legal_batch(self, xs, ys, game_board: Optional[GameBoard] = None) -> 'numpy.ndarray': 
+		"""
+			Vectorized bounds check, for filtering AI candidate moves in bulk. 
+
+			/param: xs, ys - equal length array likes of coordinates 
+			/param: game_board - if given, occupied cells are rejected too 
+			/return: bool array, True where the move can be played 
+		"""
+		import numpy as np  # pylint: disable=import-outside-toplevel
+		xs = np.asarray(xs)
+		ys = np.asarray(ys)
+		legal = (xs >= self.__min_row_col) & (xs <= self.__max_row_col) \
+			& (ys >= self.__min_row_col) & (ys <= self.__max_row_col)
+		if game_board is not None: 
+			legal[legal] = game_board.are_cells_free(xs[legal], ys[legal])
+		return legal
 		
 	def display_rules(self)-> bool: 
 		return True
 
+	@staticmethod
+	def __fields(move: Move) -> Tuple: 
+		""" (x, y, name) without converting the move """
+		if isinstance(move, TicTacToeMove): 
+			return move.get_x(), move.get_y(), move.get_name()
+		raw = move.raw()
+		return raw[TicTacToeMove.X_POS], raw[TicTacToeMove.Y_POS], raw[TicTacToeMove.NAME]
+
+	def __is_legal(self, x, y, name) -> bool: 
+		return self.__min_row_col <= x <= self.__max_row_col \
+			and self.__min_row_col <= y <= self.__max_row_col \
+			and name is not None and len(name) > 0
+
+	def get_legal_moves(self, game_board: GameBoard, player_name: str) -> List[Move]: 
+		""" Board generated moves are always in bounds, only the name needs checking """
+		if player_name is None or len(player_name) == 0: 
+			return []
+		return list(game_board.iter_legal_moves(player_name))
+
 		 
 				 	 	 
+class TicTacToeLocation(BoardLocation): 
+	def __init__(self, x_pos, y_pos, occupant): 
+		self.__x = x_pos
+		self.__y = y_pos
+		self.__occupant = occupant
+	def get_x(self): 
+		return self.__x
+	def get_y(self): 
+		return self.__y
+	def get_occupant(self): 
+		return self.__occupant
+	def get_board_coordinates(self) -> dict: 
+		return {self.X_POS: self.__x, self.Y_POS: self.__y}
+	def get_board_metadata(self) -> dict: 
+		return {self.OCCUPANT: self.__occupant}
+
+
 class TicTacToeGB(GameBoard):  
 	BOARD_SIZE_OVERRIDE = "Board Size Override"
 	BOARD_SIZE_DEFAULT = 3
@@ -104,6 +245,18 @@ class TicTacToeGB(GameBoard):
 	SEQUENCE_SEARCH_TOOL = "Sequence Search Tool"
 	SEQUENCE_NUM = "Number In A Row" 
 	SEQUENCE_NUM_DEFAULT = 3
+	BITBOARD_MODE = "Bitboard Mode"
+	BITBOARD_MODE_DEFAULT = False
+	ZOBRIST_SEED = "Zobrist Seed"
+	ZOBRIST_SEED_DEFAULT = 0
+	ZOBRIST_BITS = 64
+	RENDERER = "Renderer"
+	RENDERER_DEFAULT = None
+	TOPOLOGY = "Board Topology"
+	TOPOLOGY_DEFAULT = Topology.RECTANGULAR
+	# Undo entries pack (slot << 32) | (cell << 1) | game completed 
+	UNDO_SLOT_SHIFT = 32
+	UNDO_CELL_MASK = (1 << 31) - 1
 	
 	def __init__(self, *args, **kwargs): 
 		self.__board = None
@@ -112,26 +265,243 @@ class TicTacToeGB(GameBoard):
 		self.__board_ruleset = TicTacToeRuleset(board_size=self.__board_size)
 		self.__game_completed = False 
 		self.__seq_req = kwargs.get(self.SEQUENCE_NUM, self.SEQUENCE_NUM_DEFAULT)
-		self.__sequence_searcher = kwargs.get(self.SEQUENCE_SEARCH_TOOL, SequenceSearcher(self.__seq_req))
+		self.__sequence_searcher = kwargs.get(self.SEQUENCE_SEARCH_TOOL, 
+			SequenceSearcher(self.__seq_req, **{SequenceSearcher.LOCAL_SEARCH_ONLY: True}))
+		self.__use_bitboard = kwargs.get(self.BITBOARD_MODE, self.BITBOARD_MODE_DEFAULT)
+		self.__topology = Topology.for_shape(kwargs.get(self.TOPOLOGY, self.TOPOLOGY_DEFAULT), 
+			self.__board_size, self.__board_size)
+		if self.__use_bitboard and not self.__topology.is_rectangular(): 
+			raise ValueError('Bitboard mode win masks only cover rectangular boards')
+		if self.__topology.kind() == Topology.TOROIDAL and self.__seq_req > self.__board_size: 
+			# Longer runs would wrap onto themselves and count cells twice 
+			raise ValueError('Toroidal boards need a sequence no longer than the board size')
+		self.__win_masks = None
+		self.__bitboards = {}
+		self.__free_cells = IndexedCellSet(0)
+		self.__empty_row = ()
+		# Flat player id per cell (0 empty), the buffer behind the line views 
+		self.__cell_ids = array('i')
+		self.__empty_ids = array('i')
+		self.__player_ids = {}
+		self.__player_names = [None]
+		self.__zobrist_seed = kwargs.get(self.ZOBRIST_SEED, self.ZOBRIST_SEED_DEFAULT)
+		self.__zobrist_keys = {}
+		self.__hash = 0
+		self.__undo_stack = array('q')
+		self.__renderer = kwargs.get(self.RENDERER, self.RENDERER_DEFAULT)
+		self.__profiler = None
 	
 	def initialize(self, *args, **kwargs): 
 		self.__board = [[None for j in range(self.__board_size)] for i in range(self.__board_size)]
+		self.__empty_row = (None,) * self.__board_size
+		self.__empty_ids = array('i', [0]) * (self.__board_size * self.__board_size)
+		self.__cell_ids = array('i', self.__empty_ids)
+		self.__player_ids = {}
+		self.__player_names = [None]
+		self.__game_completed = False 
+		self.__bitboards = {}
+		self.__free_cells = IndexedCellSet(self.__board_size * self.__board_size, full=True)
+		self.__hash = 0
+		self.__undo_stack = array('q')
+		if self.__renderer is not None: 
+			self.__renderer.attach(self.__board_size)
+		if self.__use_bitboard: 
+			self.__win_masks = WinMaskTable.for_board(self.__board_size, self.__seq_req)
+		
+	def reset(self) -> None: 
+		""" Clears the board in place, no new board storage is allocated """
+		if self.__board is None: 
+			self.initialize()
+			return
+		for row in self.__board: 
+			row[:] = self.__empty_row
+		# Same length slice assignment, views handed out stay valid 
+		self.__cell_ids[:] = self.__empty_ids
+		self.__game_completed = False 
+		self.__bitboards.clear()
+		self.__free_cells.fill()
+		self.__hash = 0
+		del self.__undo_stack[:]
+		if self.__renderer is not None: 
+			self.__renderer.attach(self.__board_size)
 		
 	def get_board_ruleset(self) -> LegalMoveChecker: 
 		return self.__board_ruleset
 	
-	def update_board_with_move(self, move: Move) -> MoveResult: 
-		# We check again for safety, though canonically not required. 
-		assert self.get_board_ruleset().is_legal_move(move), "Illegal "\
-			"moved passed into update_board_with_move"
+	def update_board_with_move(self, move: Move, result: Optional[MoveResult] = None) -> MoveResult: 
+		# Moves validated by our ruleset were checked this turn already 
+		if not isinstance(move, TicTacToeMove) or move.get_checker() is not self.__board_ruleset: 
+			# We check again for safety, though canonically not required. 
+			assert self.get_board_ruleset().is_legal_move(move), "Illegal "\
+				"moved passed into update_board_with_move"
 		
-		gbuc = self.__process_move(TicTacToeMove.from_raw(move))
-		return self.__update_board_state(gbuc)
+		_move = TicTacToeMove.from_raw(move)
+		gbuc = self.__process_move(_move, MoveResult() if result is None else result.reset())
+		return self.__update_board_state(gbuc, _move)
 		
+	def apply(self, move: Move, result: Optional[MoveResult] = None) -> MoveResult: 
+		""" 
+			Make: update_board_with_move, named for pairing with undo(). 
+			Every applied move is pushed on the undo stack. 
+		"""
+		return self.update_board_with_move(move, result)
+
+	def undo(self) -> None: 
+		""" 
+			Unmake: takes back the last applied move, restoring the cell, free 
+			cell index, bitboards, hash and whether the game was complete. 
+			Lets a search explore moves on one board instead of copying it. 
+
+			/raise: IndexError if there is no move to undo 
+		"""
+		if not self.__undo_stack: 
+			raise IndexError('No move to undo')
+		entry = self.__undo_stack.pop()
+		row, column = divmod((entry >> 1) & self.UNDO_CELL_MASK, self.__board_size)
+		self.__clear_cell(row, column, entry >> self.UNDO_SLOT_SHIFT)
+		self.__game_completed = bool(entry & 1)
+
+	def undo_depth(self) -> int: 
+		""" Number of moves undo() can take back """
+		return len(self.__undo_stack)
+
 	def is_game_complete(self): 
 		return self.__game_completed
+
+	def get_board_size(self) -> int: 
+		return self.__board_size
+
+	def get_sequence_size(self) -> int: 
+		return self.__seq_req
+
+	def get_topology(self) -> Topology: 
+		""" Shared neighbour index of the board shape, cells indexed as in cells_view() """
+		return self.__topology
+
+	def get_cells(self) -> List[List[Optional[str]]]: 
+		""" A copy of the board contents indexed [row][column], None for an empty cell """
+		return [list(row) for row in self.__board]
+
+	def free_cell_count(self) -> int: 
+		return len(self.__free_cells)
+
+	def are_cells_free(self, xs, ys) -> 'numpy.ndarray': 
+		""" Vectorized emptiness check of in bounds coordinates, read from the free cell index """
+		import numpy as np  # pylint: disable=import-outside-toplevel
+		positions = np.asarray(self.__free_cells.positions_view())
+		return positions[np.asarray(ys) * self.__board_size + np.asarray(xs)] != IndexedCellSet.ABSENT
+
+	def get_player_id(self, name) -> int: 
+		""" Id of the named player in the cell views, 0 if they have not played """
+		return self.__player_ids.get(name, 0)
+
+	def get_player_name(self, player_id: int) -> Optional[str]: 
+		return self.__player_names[player_id]
+
+	def cells_view(self) -> memoryview: 
+		""" 
+			Read only, zero copy view of the player id of every cell, index 
+			y * size + x, 0 for empty. Views follow later moves and reset(), 
+			initialize() allocates a new buffer so older views go stale. 
+		"""
+		return memoryview(self.__cell_ids).toreadonly()
+
+	def row_view(self, y: int) -> memoryview: 
+		return self.cells_view()[y * self.__board_size:(y + 1) * self.__board_size]
+
+	def column_view(self, x: int) -> memoryview: 
+		return self.cells_view()[x::self.__board_size]
+
+	def diagonal_view(self, x: int, y: int) -> memoryview: 
+		""" The down right diagonal through (x, y), from its top left end """
+		size = self.__board_size
+		shift = min(x, y)
+		start = (y - shift) * size + (x - shift)
+		length = size - abs(x - y)
+		return self.cells_view()[start:start + (length - 1) * (size + 1) + 1:size + 1]
+
+	def anti_diagonal_view(self, x: int, y: int) -> memoryview: 
+		""" The down left diagonal through (x, y), from its top right end """
+		size = self.__board_size
+		shift = min(size - 1 - x, y)
+		start = (y - shift) * size + (x + shift)
+		length = min(x + y, 2 * (size - 1) - x - y) + 1
+		if length == 1: 
+			return self.cells_view()[start:start + 1]
+		return self.cells_view()[start:start + (length - 1) * (size - 1) + 1:size - 1]
+
+	def iter_line_views(self, min_length: int = 1, rows: bool = True, columns: bool = True, 
+						diagonals: bool = True) -> Iterator[memoryview]: 
+		""" 
+			Every row, column and diagonal (both ways) at least min_length long. 
+			These are the lines of the square grid, non rectangular topologies 
+			walk get_topology() instead. 
+		"""
+		size = self.__board_size
+		if size < min_length: 
+			return
+		for index in range(size): 
+			if rows: 
+				yield self.row_view(index)
+			if columns: 
+				yield self.column_view(index)
+		if not diagonals: 
+			return
+		# Diagonals are identified by where they touch the top row or the side 
+		for offset in range(size - min_length + 1): 
+			yield self.diagonal_view(offset, 0)
+			yield self.anti_diagonal_view(size - 1 - offset, 0)
+			if offset > 0: 
+				yield self.diagonal_view(0, offset)
+				yield self.anti_diagonal_view(size - 1, offset)
+
+	def iter_legal_moves(self, player_name: str) -> Iterator[Move]: 
+		if self.__game_completed: 
+			return
+		for cell in self.__free_cells: 
+			y, x = divmod(cell, self.__board_size)
+			yield TicTacToeMove(x, y, player_name)
+
+	def iter_free_cells(self) -> Iterator[Tuple[int, int]]: 
+		""" Yields (x, y) of every empty cell, in no particular order """
+		for cell in self.__free_cells: 
+			y, x = divmod(cell, self.__board_size)
+			yield (x, y)
+
+	def sample_free_cell(self, rng: random.Random = random) -> Optional[Tuple[int, int]]: 
+		""" (x, y) of a uniformly random empty cell in O(1), None if the board is full """
+		cell = self.__free_cells.sample(rng)
+		if cell is None: 
+			return None
+		y, x = divmod(cell, self.__board_size)
+		return (x, y)
+
+	def set_profiler(self, profiler) -> None: 
+		self.__profiler = profiler
+
+	def board_hash(self) -> int: 
+		""" 
+			Zobrist hash of the position, updated in O(1) as cells change. 
+			Keys are derived from the seed and player name, so boards with the 
+			same seed agree on the hash of a position, even across processes. 
+		"""
+		return self.__hash
+
+	def is_bitboard_mode(self) -> bool: 
+		return self.__use_bitboard
+
+	def get_player_bitboard(self, name) -> int: 
+		""" 
+			Bitmask of the cells held by the named player, bit (y * size + x). 
+			Only maintained in bitboard mode. 
+		"""
+		return self.__bitboards.get(name, 0)
 		
 	def display(self) -> None: 
+		if self.__renderer is not None: 
+			# The final position is always shown, whatever the frame rate 
+			self.__renderer.draw(force=self.__game_completed)
+			return
 		def clean_data(inp): 
 			return inp if inp is not None else self.__empty_cell
 		print_data = [[clean_data(r) for r in row] for row in self.__board]
@@ -139,15 +509,74 @@ class TicTacToeGB(GameBoard):
 		delim = '\n'+('-' * len(max(print_data, key=len)))+'\n'
 		print_data = delim.join(print_data)
 		print(print_data)
+
+	def _get_surrounding_locations(self, spot: BoardLocation) -> List[BoardLocation]: 
+		coordinates = spot.get_board_coordinates()
+		cell = self.__topology.cell_index(coordinates[TicTacToeLocation.X_POS], 
+										  coordinates[TicTacToeLocation.Y_POS])
+		# Neighbours come from the shape's precomputed index, no bounds checks 
+		return [self.__location(*divmod(neighbour, self.__board_size)) 
+				for neighbour in self.__topology.neighbours(cell)]
+
+	def _get_location_at(self, x: int, y: int) -> Optional[BoardLocation]: 
+		if not (0 <= x < self.__board_size and 0 <= y < self.__board_size): 
+			return None
+		return self.__location(y, x)
+
+	def _iter_board_locations(self) -> Iterator[BoardLocation]: 
+		for row in range(self.__board_size): 
+			for column in range(self.__board_size): 
+				yield self.__location(row, column)
+
+	def __location(self, row, column) -> TicTacToeLocation: 
+		return TicTacToeLocation(column, row, self.__board[row][column])
 	
 	def __is_cell_empty(self, row, column): 
-		return self.__board[row][column] is not None 
+		return self.__board[row][column] is None 
 		
+	def __player_id(self, name) -> int: 
+		player_id = self.__player_ids.get(name)
+		if player_id is None: 
+			player_id = self.__player_ids[name] = len(self.__player_names)
+			self.__player_names.append(name)
+		return player_id
+
+	def __zobrist_key(self, cell, name) -> int: 
+		keys = self.__zobrist_keys.get(name)
+		if keys is None: 
+			rng = random.Random(f'{self.__zobrist_seed}/{name}')
+			keys = [rng.getrandbits(self.ZOBRIST_BITS) for _ in range(self.__board_size * self.__board_size)]
+			self.__zobrist_keys[name] = keys
+		return keys[cell]
+
 	def __apply_move_to_cell(self, row, column, name): 
+		cell = row * self.__board_size + column
 		self.__board[row][column] = name
+		self.__cell_ids[cell] = self.__player_id(name)
+		slot = self.__free_cells.remove(cell)
+		self.__hash ^= self.__zobrist_key(cell, name)
+		# One int per move: the free cell slot, the cell and whether the game was already over 
+		self.__undo_stack.append(slot << self.UNDO_SLOT_SHIFT | cell << 1 | self.__game_completed)
+		if self.__renderer is not None: 
+			self.__renderer.cell_changed(column, row, name)
+		if self.__use_bitboard: 
+			bit = self.__win_masks.cell_bit(column, row)
+			self.__bitboards[name] = self.__bitboards.get(name, 0) | bit
+	
+	def __clear_cell(self, row, column, slot): 
+		""" Exact inverse of __apply_move_to_cell, the cell goes back to its free cell slot """
+		cell = row * self.__board_size + column
+		name = self.__board[row][column]
+		self.__board[row][column] = None
+		self.__cell_ids[cell] = 0
+		self.__free_cells.restore(cell, slot)
+		self.__hash ^= self.__zobrist_key(cell, name)
+		if self.__renderer is not None: 
+			self.__renderer.cell_changed(column, row, None)
+		if self.__use_bitboard: 
+			self.__bitboards[name] &= ~self.__win_masks.cell_bit(column, row)
 	
-	def __process_move(self, move: TicTacToeMove) -> MoveResult: 
-		res = MoveResult()
+	def __process_move(self, move: TicTacToeMove, res: MoveResult) -> MoveResult: 
 		x = move.get_x()
 		y = move.get_y()
 		if not self.__is_cell_empty(y, x): 
@@ -157,14 +586,29 @@ class TicTacToeGB(GameBoard):
 		return res
 	
 	def __no_moves_left(self): 
-		pass 
+		return len(self.__free_cells) == 0
+
+	def __has_sequence(self, move: TicTacToeMove) -> bool: 
+		if self.__use_bitboard: 
+			cell = self.__win_masks.cell_index(move.get_x(), move.get_y())
+			return self.__win_masks.has_win(self.__bitboards[move.get_name()], cell)
+		return self.__sequence_searcher.search(**{
+			SequenceSearcher.SEARCH_GAME_BOARD: self, 
+			SequenceSearcher.SEARCH_START_LOCATION: self.__location(move.get_y(), move.get_x())
+		})
 		
-	def __update_board_state(self, res: MoveResult) -> MoveResult: 
+	def __update_board_state(self, res: MoveResult, move: TicTacToeMove) -> MoveResult: 
 		if not res.was_move_applied(): 
 			return res
 			
 		# Game ends with a winner 
-		if self.__sequence_searcher.search(self): 
+		if self.__profiler is None: 
+			has_sequence = self.__has_sequence(move)
+		else: 
+			self.__profiler.begin(profiling.SEQUENCE_SEARCH)
+			has_sequence = self.__has_sequence(move)
+			self.__profiler.end(profiling.SEQUENCE_SEARCH)
+		if has_sequence: 
 			self.__game_completed = True 
 			res.set_game_has_winner()
 			res.set_game_ended_from_move()
@@ -180,4 +624,15 @@ class TicTacToeGB(GameBoard):
 		return res
 	
 class TicTacToe(GameRunner): 
-	pass 
+	def _update_game_state(self, p: Player) -> None: 
+		# Completion and the winner are recorded from the board's MoveResult 
+		return None
+
+	def debug_log(self, *args, **kwargs): 
+		return None
+
+	def get_legal_move_tenacity(self) -> int: 
+		return 1
+
+	def get_move_tenacity(self) -> int: 
+		return 2 
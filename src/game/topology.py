@@ -0,0 +1,178 @@
+from array import array
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# Shapes whose index is kept between boards, least recently used dropped first
+_CACHED_SHAPES = 16
+
+
+class Topology:
+	"""
+		Class: Neighbour index of a board shape, built lazily and shared
+
+		Cells are indexed y * width + x. Two flat integer structures are kept:
+		 - one step table per direction, the cell one step away in that
+		   direction or NO_CELL off the edge, so a line walk is a table lookup
+		   per step with no bounds checks
+		 - a CSR adjacency (index pointer + neighbour list) of every cell's
+		   distinct neighbours
+		Each is built the first time it is used.
+
+		RECTANGULAR boards stop at the edges, TOROIDAL boards wrap around
+		both ways, HEX boards use axial coordinates (x = q, y = r) on a
+		rhombus with six neighbours and three line axes. Direction i and
+		i + len(directions) / 2 are always opposite.
+	"""
+	RECTANGULAR = 'Rectangular'
+	TOROIDAL = 'Toroidal'
+	HEX = 'Hex'
+	KINDS = (RECTANGULAR, TOROIDAL, HEX)
+
+	NO_CELL = -1
+	GRID_DIRECTIONS = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+	HEX_DIRECTIONS = ((1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1), (1, -1))
+
+	def __init__(self, kind: str, width: int, height: int):
+		if kind not in self.KINDS:
+			raise ValueError(f'Unknown topology {kind}, expected one of {self.KINDS}')
+		if width < 1 or height < 1:
+			raise ValueError('Topology dimensions must be positive')
+		self.__kind = kind
+		self.__width = width
+		self.__height = height
+		self.__directions = self.HEX_DIRECTIONS if kind == self.HEX else self.GRID_DIRECTIONS
+		# Tables are built on first use, a board that never walks its lines
+		# or asks for neighbours costs nothing beyond these fields
+		self.__steps: Optional[List[array]] = None
+		self.__indptr: Optional[array] = None
+		self.__neighbours: Optional[array] = None
+		self.__neighbour_masks: Optional[Tuple[int, ...]] = None
+
+	@classmethod
+	def for_shape(cls, kind: str, width: int, height: int) -> 'Topology':
+		"""
+			Returns a shared index for the board shape. The tables never change
+			once built so every board of the shape can use it. Only the most
+			recently used shapes are kept.
+		"""
+		return _cached_topology(kind, width, height)
+
+	def kind(self) -> str:
+		return self.__kind
+
+	def is_rectangular(self) -> bool:
+		return self.__kind == self.RECTANGULAR
+
+	def width(self) -> int:
+		return self.__width
+
+	def height(self) -> int:
+		return self.__height
+
+	def cell_count(self) -> int:
+		return self.__width * self.__height
+
+	def cell_index(self, x: int, y: int) -> int:
+		return y * self.__width + x
+
+	def coordinates(self, cell: int) -> Tuple[int, int]:
+		""" return (x, y) """
+		y, x = divmod(cell, self.__width)
+		return x, y
+
+	def directions(self) -> Tuple[Tuple[int, int], ...]:
+		return self.__directions
+
+	def axes(self) -> List[Tuple[int, int]]:
+		""" (direction, opposite direction) index pairs, one per line axis """
+		half = len(self.__directions) // 2
+		return [(direction, direction + half) for direction in range(half)]
+
+	def step_table(self, direction: int) -> array:
+		return self.__step_tables()[direction]
+
+	def neighbours(self, cell: int) -> memoryview:
+		""" Zero copy slice of the cell's distinct neighbours """
+		if self.__neighbours is None:
+			self.__build_neighbours()
+		return memoryview(self.__neighbours)[self.__indptr[cell]:self.__indptr[cell + 1]]
+
+	def neighbour_count(self, cell: int) -> int:
+		if self.__indptr is None:
+			self.__build_neighbours()
+		return self.__indptr[cell + 1] - self.__indptr[cell]
+
+	def neighbour_mask(self, cell: int) -> int:
+		""" Bitmask (bit per cell index) of the cell's neighbours, built on first use """
+		if self.__neighbour_masks is None:
+			masks = []
+			for index in range(self.cell_count()):
+				mask = 0
+				for neighbour in self.neighbours(index):
+					mask |= 1 << neighbour
+				masks.append(mask)
+			self.__neighbour_masks = tuple(masks)
+		return self.__neighbour_masks[cell]
+
+	def count_run(self, cell_ids, cell: int, direction: int, limit: int) -> int:
+		"""
+			Cells after cell in direction holding the same id as cell, up to limit
+
+			/param: cell_ids - indexable of player ids per cell, e.g. a board's cells_view()
+		"""
+		table = (self.__steps or self.__step_tables())[direction]
+		player_id = cell_ids[cell]
+		count = 0
+		cell = table[cell]
+		while count < limit and cell != self.NO_CELL and cell_ids[cell] == player_id:
+			count += 1
+			cell = table[cell]
+		return count
+
+	def __step_tables(self) -> List[array]:
+		if self.__steps is None:
+			self.__build_step_tables()
+		return self.__steps
+
+	def __build_step_tables(self) -> None:
+		""" Whole table at a time in numpy, copied into the arrays as raw bytes """
+		import numpy as np  # pylint: disable=import-outside-toplevel
+		width, height = self.__width, self.__height
+		y, x = np.divmod(np.arange(width * height), width)
+		steps = []
+		for dx, dy in self.__directions:
+			nx, ny = x + dx, y + dy
+			if self.__kind == self.TOROIDAL:
+				table = (ny % height) * width + nx % width
+			else:
+				on_board = (nx >= 0) & (nx < width) & (ny >= 0) & (ny < height)
+				table = np.where(on_board, ny * width + nx, self.NO_CELL)
+			steps.append(_to_array(table))
+		self.__steps = steps
+
+	def __build_neighbours(self) -> None:
+		import numpy as np  # pylint: disable=import-outside-toplevel
+		# One row per cell, one column per direction
+		around = np.column_stack([np.frombuffer(table, dtype=np.intc) for table in self.__step_tables()])
+		on_board = around != self.NO_CELL
+		if self.__kind == self.TOROIDAL and (self.__width < 3 or self.__height < 3):
+			# Small tori can reach the same cell (or the cell itself) twice
+			for cell, row in enumerate(around):
+				seen = {cell}
+				for direction, neighbour in enumerate(row.tolist()):
+					on_board[cell, direction] = neighbour not in seen
+					seen.add(neighbour)
+		self.__neighbours = _to_array(around[on_board])
+		self.__indptr = _to_array(np.concatenate(([0], np.cumsum(on_board.sum(axis=1)))))
+
+
+def _to_array(values) -> array:
+	""" int array of a numpy vector, a single copy of its bytes """
+	import numpy as np  # pylint: disable=import-outside-toplevel
+	table = array('i')
+	table.frombytes(np.ascontiguousarray(values, dtype=np.intc).tobytes())
+	return table
+
+@lru_cache(maxsize=_CACHED_SHAPES)
+def _cached_topology(kind: str, width: int, height: int) -> Topology:
+	return Topology(kind, width, height)
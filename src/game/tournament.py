@@ -0,0 +1,223 @@
+import os
+import random
+import traceback
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import permutations
+from typing import Callable, Dict, List, Optional, Tuple
+from .interfaces import GameBoard, GameRunner, Player
+from .gamerunner import BatchResult
+from .tictactoe import TicTacToe, TicTacToeGB
+
+
+class PlayerSpec:
+	"""
+		Class: Picklable recipe for a tournament entrant
+
+		factory(name, game_board, seed) must return a Player using the given
+		name. It is called inside the worker process, so it has to be a
+		module level callable (or class) that pickle can find.
+	"""
+	def __init__(self, label: str, factory: Callable[[str, GameBoard, int], Player]):
+		self.label = label
+		self.factory = factory
+
+	def build(self, name: str, gb: GameBoard, seed: int) -> Player:
+		return self.factory(name, gb, seed)
+
+
+class BoardConfig:
+	"""
+		Class: Picklable board (and runner) configuration for a tournament
+	"""
+	def __init__(self, label: str, board_kwargs: Optional[dict] = None,
+				 board_class: type = TicTacToeGB, runner_class: type = TicTacToe):
+		self.label = label
+		self.board_kwargs = dict(board_kwargs or {})
+		self.board_class = board_class
+		self.runner_class = runner_class
+
+	def build(self, players_for_board: Callable[[GameBoard], List[Player]]) -> GameRunner:
+		gb = self.board_class(**self.board_kwargs)
+		runner = self.runner_class(players_for_board(gb), gb)
+		runner.setup()
+		return runner
+
+
+class TournamentTask:
+	"""
+		Class: One chunk of games for a single pairing, seat order and board
+	"""
+	def __init__(self, task_id: int, seats: List[PlayerSpec], board: BoardConfig,
+				 num_games: int, seed: int):
+		self.task_id = task_id
+		self.seats = seats
+		self.board = board
+		self.num_games = num_games
+		self.seed = seed
+
+	def seat_name(self, seat: int) -> str:
+		""" In game player name, unique even when a label plays itself """
+		return f'{self.seats[seat].label}@{seat}'
+
+
+class TaskResult:
+	def __init__(self, task: TournamentTask, result: Optional[BatchResult] = None,
+				 error: Optional[str] = None):
+		self.task = task
+		self.result = result
+		self.error = error
+
+
+def play_task(task: TournamentTask) -> TaskResult:
+	"""
+		Worker entry point. Any exception raised while building or playing
+		is returned as the task's error so one bad entrant cannot take
+		down the rest of the chunk.
+	"""
+	try:
+		random.seed(task.seed)
+		def players_for_board(gb):
+			return [spec.build(task.seat_name(seat), gb, task.seed + seat)
+					for seat, spec in enumerate(task.seats)]
+		runner = task.board.build(players_for_board)
+		return TaskResult(task, result=runner.run_batch(task.num_games))
+	except Exception:  # pylint: disable=broad-exception-caught
+		return TaskResult(task, error=traceback.format_exc())
+
+
+class Standings:
+	"""
+		Class: Merged tournament results, one row per entrant label
+	"""
+	WIN_POINTS = 1.0
+	TIE_POINTS = 0.5
+
+	def __init__(self, labels: List[str]):
+		self.__rows: Dict[str, dict] = {label: {
+			'games': 0, 'wins': 0, 'losses': 0, 'ties': 0, 'forfeits': 0, 'points': 0.0
+		} for label in labels}
+		self.errors: List[TaskResult] = []
+
+	def record(self, task_result: TaskResult) -> None:
+		if task_result.error is not None:
+			self.errors.append(task_result)
+			return
+		task = task_result.task
+		result = task_result.result
+		for seat, spec in enumerate(task.seats):
+			row = self.__rows[spec.label]
+			wins = result.wins.get(task.seat_name(seat), 0)
+			row['games'] += result.games
+			row['wins'] += wins
+			row['losses'] += sum(result.wins.values()) - wins
+			row['ties'] += result.ties
+			row['forfeits'] += result.forfeits
+			row['points'] += wins * self.WIN_POINTS + result.ties * self.TIE_POINTS
+
+	def rows(self) -> List[dict]:
+		""" Rows sorted by points, then wins """
+		rows = [dict(label=label, **row) for label, row in self.__rows.items()]
+		return sorted(rows, key=lambda r: (-r['points'], -r['wins'], r['label']))
+
+	def format_table(self) -> str:
+		lines = [f'{"player":<20} {"games":>7} {"wins":>7} {"losses":>7} {"ties":>7} {"forfeits":>8} {"points":>8}']
+		for r in self.rows():
+			lines.append(f'{r["label"]:<20} {r["games"]:>7} {r["wins"]:>7} {r["losses"]:>7} '
+						 f'{r["ties"]:>7} {r["forfeits"]:>8} {r["points"]:>8.1f}')
+		return '\n'.join(lines)
+
+
+class Tournament:
+	"""
+		Class: Round robin over every pairing of entrants, in every seat order,
+		on every board configuration, spread across a process pool.
+
+		Games for a pairing are split into tasks of at most chunk_size games,
+		each with its own deterministic seed derived from the tournament
+		seed, so a rerun with the same seed schedules identical games.
+	"""
+	CHUNK_SIZE = 'Chunk Size'
+	CHUNK_SIZE_DEFAULT = 1000
+	MAX_WORKERS = 'Max Workers'
+	MAX_WORKERS_DEFAULT = None
+	SEED = 'Seed'
+	SEED_DEFAULT = 0
+	EXECUTOR_FACTORY = 'Executor Factory'
+	EXECUTOR_FACTORY_DEFAULT = ProcessPoolExecutor
+
+	def __init__(self, players: List[PlayerSpec], boards: List[BoardConfig], games_per_pairing: int,
+				 **kwargs):
+		labels = [spec.label for spec in players]
+		if len(set(labels)) != len(labels):
+			raise ValueError(f'Player labels must be unique: {labels}')
+		self.__players = players
+		self.__boards = boards
+		self.__games_per_pairing = games_per_pairing
+		self.__chunk_size = kwargs.get(self.CHUNK_SIZE, self.CHUNK_SIZE_DEFAULT)
+		self.__max_workers = kwargs.get(self.MAX_WORKERS, self.MAX_WORKERS_DEFAULT) or os.cpu_count() or 1
+		self.__seed = kwargs.get(self.SEED, self.SEED_DEFAULT)
+		self.__executor_factory = kwargs.get(self.EXECUTOR_FACTORY, self.EXECUTOR_FACTORY_DEFAULT)
+
+	def tasks(self) -> List[TournamentTask]:
+		tasks = []
+		for board_index, board in enumerate(self.__boards):
+			for seats in permutations(self.__players, 2):
+				remaining = self.__games_per_pairing
+				chunk = 0
+				while remaining > 0:
+					num_games = min(remaining, self.__chunk_size)
+					key = f'{self.__seed}/{board_index}/{seats[0].label}/{seats[1].label}/{chunk}'
+					seed = random.Random(key).getrandbits(32)
+					tasks.append(TournamentTask(len(tasks), list(seats), board, num_games, seed))
+					remaining -= num_games
+					chunk += 1
+		return tasks
+
+	def run(self) -> Standings:
+		"""
+			Runs every task and merges the results. Entrant exceptions are 
+			caught in the worker. A worker process that dies breaks the whole 
+			pool, so the pool is replaced and each task that was in flight is 
+			rerun alone; only a task that breaks its own pool again is recorded 
+			in Standings.errors. 
+		"""
+		standings = Standings([spec.label for spec in self.__players])
+		pending = self.tasks()
+		pending.reverse()
+		while pending:
+			pending, suspects = self.__run_pool(pending, standings, 2 * self.__max_workers)
+			for task in suspects:
+				_, crashed = self.__run_pool([task], standings, 1)
+				for crashed_task in crashed:
+					standings.record(TaskResult(crashed_task, error='Worker process terminated abruptly'))
+		return standings
+
+	def __run_pool(self, pending: List[TournamentTask], standings: Standings,
+				   max_in_flight: int) -> Tuple[List[TournamentTask], List[TournamentTask]]:
+		""" 
+			Runs tasks with at most max_in_flight submitted at once, bounding 
+			memory for very large schedules. Stops submitting if the pool breaks. 
+
+			return (tasks never submitted, tasks lost to a broken pool) 
+		"""
+		broken = []
+		with self.__executor_factory(max_workers=min(self.__max_workers, max_in_flight)) as executor:
+			in_flight = {}
+			while pending or in_flight:
+				while pending and len(in_flight) < max_in_flight and not broken:
+					task = pending.pop()
+					try:
+						in_flight[executor.submit(play_task, task)] = task
+					except BrokenProcessPool:
+						broken.append(task)
+				if not in_flight:
+					break
+				done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+				for future in done:
+					task = in_flight.pop(future)
+					try:
+						standings.record(future.result())
+					except BrokenProcessPool:
+						broken.append(task)
+		return pending, broken
@@ -0,0 +1,225 @@
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+from .interfaces import GameBoard, BoardLocation
+from .sequence_searcher import SequenceSearchInterface, SequenceSearcher, board_topology
+
+EMPTY_ID = 0
+
+# (dy, dx) steps along the last two array axes
+STEP_HORIZONTAL = (0, 1)
+STEP_VERTICAL = (1, 0)
+STEP_DIAGONAL = (1, 1)
+STEP_ANTI_DIAGONAL = (1, -1)
+ALL_STEPS = (STEP_HORIZONTAL, STEP_VERTICAL, STEP_DIAGONAL, STEP_ANTI_DIAGONAL)
+
+
+def board_to_array(rows: List[List[Optional[str]]],
+				   player_ids: Optional[dict] = None) -> Tuple[np.ndarray, dict]:
+	"""
+		Converts a list-of-lists board of occupant names into an int ndarray.
+		/param: rows - board contents, None for an empty cell
+		/param: player_ids - optional name => id map (ids must be non zero),
+			names not in the map are assigned the next free id
+
+		/return: (array, name => id map used)
+	"""
+	cells = np.array(rows, dtype=object)
+	ids = dict(player_ids or {})
+	array = np.zeros(cells.shape, dtype=np.int32)
+	occupied = cells != None  # pylint: disable=singleton-comparison
+	for name in set(cells[occupied].tolist()):
+		if name not in ids:
+			ids[name] = max(ids.values(), default=EMPTY_ID) + 1
+		array[cells == name] = ids[name]
+	return array, ids
+
+
+def _shifted(array: np.ndarray, offset_y: int, offset_x: int, fill) -> np.ndarray:
+	""" out[..., y, x] = array[..., y + offset_y, x + offset_x], fill where that is off the board """
+	height, width = array.shape[-2:]
+	out = np.full_like(array, fill)
+	if abs(offset_y) >= height or abs(offset_x) >= width:
+		return out
+	dst_y = slice(max(0, -offset_y), height - max(0, offset_y))
+	src_y = slice(max(0, offset_y), height - max(0, -offset_y))
+	dst_x = slice(max(0, -offset_x), width - max(0, offset_x))
+	src_x = slice(max(0, offset_x), width - max(0, -offset_x))
+	out[..., dst_y, dst_x] = array[..., src_y, src_x]
+	return out
+
+
+def _rolled(array: np.ndarray, offset_y: int, offset_x: int, fill) -> np.ndarray:
+	""" _shifted on a toroidal board, cells off one edge come back on the other """
+	return np.roll(array, (-offset_y, -offset_x), axis=(-2, -1))
+
+
+def sequence_starts(array: np.ndarray, sqs: int, step: Tuple[int, int], wrap: bool = False) -> np.ndarray:
+	"""
+		/param: array - int board(s), shape (..., H, W), EMPTY_ID for empty cells
+		/param: sqs - the sequence length to look for
+		/param: step - (dy, dx) direction of the sequence
+		/param: wrap - sequences continue across the edges (toroidal boards)
+
+		/return: bool array of the same shape, True where a sequence of sqs
+			equal, non empty cells starts
+
+		Runs are grown by doubling, so each direction costs O(log sqs) whole
+		array operations and no Python work per cell.
+	"""
+	if sqs < 1:
+		return np.zeros(array.shape, dtype=bool)
+	step_y, step_x = step
+	shifted = _rolled if wrap else _shifted
+	runs = array != EMPTY_ID
+	length = 1
+	while length < sqs:
+		grow = min(length, sqs - length)
+		offset_y, offset_x = step_y * grow, step_x * grow
+		runs = runs & shifted(runs, offset_y, offset_x, False) \
+			& (array == shifted(array, offset_y, offset_x, EMPTY_ID))
+		length += grow
+	return runs
+
+
+def winning_ids(array: np.ndarray, sqs: int, steps: Iterable[Tuple[int, int]]) -> set:
+	""" The ids of every player holding a sequence of sqs in any of the given directions """
+	found = set()
+	for step in steps:
+		found.update(np.unique(array[sequence_starts(array, sqs, step)]).tolist())
+	return found
+
+
+def stack_boards(boards: Iterable[GameBoard], player_ids: Optional[dict] = None) -> Tuple[np.ndarray, dict]:
+	"""
+		Converts same sized boards into one (B, N, N) array sharing a single
+		name => id map, ready for batch_find_winners.
+	"""
+	ids = dict(player_ids or {})
+	arrays = []
+	for gb in boards:
+		array, ids = board_to_array(gb.get_cells(), ids)
+		arrays.append(array)
+	return np.stack(arrays), ids
+
+
+def batch_find_winners(boards: np.ndarray, sqs: int,
+					   steps: Iterable[Tuple[int, int]] = ALL_STEPS) -> Tuple[np.ndarray, np.ndarray]:
+	"""
+		Checks a stack of boards in one vectorized pass.
+		/param: boards - int array of shape (B, N, M), EMPTY_ID for empty cells
+		/param: sqs - the sequence length required to win
+
+		/return: (winners, ties) both of shape (B,). winners holds the winning
+			player id or EMPTY_ID, if a board has more than one player holding a
+			sequence the highest id is reported. ties is True for full boards
+			without a winner.
+	"""
+	boards = np.asarray(boards)
+	winners = np.full(boards.shape[0], EMPTY_ID, dtype=boards.dtype)
+	for step in steps:
+		starts = sequence_starts(boards, sqs, step)
+		found = np.where(starts, boards, EMPTY_ID).max(axis=(-2, -1))
+		np.maximum(winners, found, out=winners)
+	full = (boards != EMPTY_ID).all(axis=(-2, -1))
+	ties = full & (winners == EMPTY_ID)
+	return winners, ties
+
+
+class NumpySequenceSearcher(SequenceSearchInterface):
+	"""
+		Full board search on an integer ndarray. Intended for large boards
+		(analysis, validation) where SequenceSearcher's per cell walk is too slow.
+		Accepts the same direction settings as SequenceSearcher. Boards with 
+		a toroidal or hex topology are searched along their own line axes, 
+		wrapping across the edges on toroidal boards. 
+	"""
+	SEARCH_ARRAY = "Array"
+
+	def __init__(self, num_in_sequence: int, **kwargs):
+		self.__seq_num: int = num_in_sequence
+		self.__horizontal = kwargs.get(SequenceSearcher.SETTING_HORIZONTAL, SequenceSearcher.SETTING_HORIZONTAL_DEFAULT)
+		self.__vertical = kwargs.get(SequenceSearcher.SETTING_VERTICALS, SequenceSearcher.SETTING_VERTICALS_DEFAULT)
+		self.__diagonal = kwargs.get(SequenceSearcher.SETTING_DIAGONALS, SequenceSearcher.SETTING_DIAGONALS_DEFAULT)
+		self.__steps = self.__enabled_steps(ALL_STEPS)
+		# Enabled (dy, dx) steps per neighbour index 
+		self.__topology_steps = {}
+
+	def sequence_size(self):
+		return self.__seq_num
+
+	def search_steps(self) -> List[Tuple[int, int]]:
+		return list(self.__steps)
+
+	def search(self, *args, **kwargs) -> bool:
+		"""
+			Searches SEARCH_ARRAY if given, otherwise converts SEARCH_GAME_BOARD.
+			SEARCH_START_LOCATION is ignored, the whole board is always searched.
+		"""
+		array = kwargs.get(self.SEARCH_ARRAY)
+		steps, wrap = self.__steps, False
+		if array is None:
+			gb = kwargs.get(self.SEARCH_GAME_BOARD)
+			topology = board_topology(gb)
+			if topology is not None and not topology.is_rectangular():
+				steps, wrap = self.__steps_for(topology), topology.kind() == topology.TOROIDAL
+			array = self.to_array(gb)
+		for step in steps:
+			if sequence_starts(array, self.sequence_size(), step, wrap).any():
+				return True
+		return False
+
+	def __enabled_steps(self, steps: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+		enabled = []
+		for step_y, step_x in steps:
+			if step_y == 0:
+				use = self.__horizontal
+			elif step_x == 0:
+				use = self.__vertical
+			else:
+				use = self.__diagonal
+			if use:
+				enabled.append((step_y, step_x))
+		return enabled
+
+	def __steps_for(self, topology) -> List[Tuple[int, int]]:
+		""" (dy, dx) array steps of the topology's line axes """
+		steps = self.__topology_steps.get(topology)
+		if steps is None:
+			directions = topology.directions()
+			steps = self.__enabled_steps((directions[forward][1], directions[forward][0])
+										 for forward, _ in topology.axes())
+			self.__topology_steps[topology] = steps
+		return steps
+
+	def find_winners(self, array: np.ndarray) -> set:
+		return winning_ids(array, self.sequence_size(), self.__steps)
+
+	def find_batch_winners(self, boards: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+		""" (winners, ties) per board of a (B, N, N) stack, see batch_find_winners """
+		return batch_find_winners(boards, self.sequence_size(), self.__steps)
+
+	@staticmethod
+	def to_array(gb: GameBoard) -> np.ndarray:
+		"""
+			Boards exposing cells_view() are wrapped without a copy, boards 
+			exposing get_cells() are converted with array operations,
+			any other GameBoard falls back to iterating its locations.
+		"""
+		cells_view = getattr(gb, 'cells_view', None)
+		if cells_view is not None:
+			# Player ids are already small ints, wrap the board's buffer without copying
+			return np.asarray(cells_view()).reshape(gb.get_board_size(), gb.get_board_size())
+		get_cells = getattr(gb, 'get_cells', None)
+		if get_cells is not None:
+			return board_to_array(get_cells())[0]
+		coordinates = []
+		for spot in gb:
+			location = spot.get_board_coordinates()
+			coordinates.append((location[BoardLocation.X_POS], location[BoardLocation.Y_POS],
+								spot.get_board_metadata().get(BoardLocation.OCCUPANT)))
+		width = 1 + max((x for x, _, _ in coordinates), default=-1)
+		height = 1 + max((y for _, y, _ in coordinates), default=-1)
+		rows = [[None] * width for _ in range(height)]
+		for x, y, occupant in coordinates:
+			rows[y][x] = occupant
+		return board_to_array(rows)[0]
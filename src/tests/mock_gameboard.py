@@ -1,7 +1,8 @@
+from abc import abstractmethod
 from game.gameboard import BoardLocation, GameBoard
 from game.move_support import LegalMoveChecker, Move, MoveResult
-from mock_move_support import MockLegalMoveChecker, MockMove, MockMoveResult
-from typing import Optional, List
+from .mock_move_support import MockLegalMoveChecker, MockMove, MockMoveResult
+from typing import Iterator, Optional, List
 
 class MockBoardLocation(BoardLocation):
 	def __init__(self, *args, **kwargs): 
@@ -40,6 +41,11 @@ class MockGameBoard(GameBoard):
 		"""
 		pass
 
+	@abstractmethod
+	def iter_legal_moves(self, player_name: str) -> Iterator[Move]:
+		""" Generator, every legal and valid move """
+		pass
+
 	@abstractmethod
 	def is_game_complete(self):
 		## Could Template Caching
@@ -57,21 +63,9 @@ class MockGameBoard(GameBoard):
 		pass
 
 	@abstractmethod
-	def _reset_board_iteration(self) -> None:
-		""" Iterator reset """
+	def _iter_board_locations(self) -> Iterator[BoardLocation]:
+		""" Iterator, reentrant """
 		pass
 
-	@abstractmethod
-	def _next_board_location(self) -> Optional[BoardLocation]:
-		""" Iterator Next """
-		pass
-
-	def __iter__(self):
-		self._reset_board_iteration()
-		return self
-
-	def __next__(self) -> Optional[BoardLocation]:
-		nxt = self._next_board_location()
-		if nxt is None:
-			raise StopIteration
-		return nxt
\ No newline at end of file
+	def __iter__(self) -> Iterator[BoardLocation]:
+		return self._iter_board_locations()
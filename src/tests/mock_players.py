@@ -0,0 +1,6 @@
+from game.interfaces import Player
+from game.tictactoe import StupidAI, TicTacToeGB
+
+def free_cell_player(name: str, gb: TicTacToeGB, seed: int = 0) -> StupidAI:
+	""" Seeded random player over the board's free cells, also a tournament PlayerSpec factory """
+	return StupidAI(**{Player.NAME: name, StupidAI.GAME_BOARD: gb, StupidAI.SEED: seed})
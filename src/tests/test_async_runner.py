@@ -0,0 +1,92 @@
+import asyncio
+import random
+import threading
+import pytest
+from game.async_runner import AsyncPlayer, AsyncGameRunner, AsyncGameResult, run_games, MAX_CONCURRENCY
+from game.interfaces import Player
+from game.tictactoe import TicTacToe, TicTacToeGB, TicTacToeMove
+# pylint: disable=unused-variable
+
+class RemotePlayer(AsyncPlayer): 
+	def __init__(self, name, gb, delay=0.0): 
+		super().__init__(**{Player.NAME: name})
+		self.gb = gb
+		self.delay = delay
+		self.rng = random.Random(name)
+
+	async def get_move_async(self): 
+		await asyncio.sleep(self.delay)
+		x, y = self.gb.sample_free_cell(self.rng)
+		return TicTacToeMove(x, y, self.get_name())
+
+class BlockingPlayer(Player): 
+	BLOCKING_GET_MOVE = True
+
+	def __init__(self, name, gb, rendezvous=None): 
+		super().__init__(**{Player.NAME: name})
+		self.gb = gb
+		self.rendezvous = rendezvous
+
+	def get_move(self): 
+		if self.rendezvous is not None: 
+			# Blocks until every game is inside a get_move call at the same time 
+			self.rendezvous.wait()
+			self.rendezvous = None
+		x, y = next(self.gb.iter_free_cells())
+		return TicTacToeMove(x, y, self.get_name())
+
+def i_build(player_class, **kwargs): 
+	gb = TicTacToeGB()
+	runner = TicTacToe([player_class('A', gb, **kwargs), player_class('B', gb, **kwargs)], gb)
+	runner.setup()
+	return runner
+
+def test_thousands_of_concurrent_games(): 
+	runners = [i_build(RemotePlayer, delay=0.001) for _ in range(2000)]
+	results = asyncio.run(run_games(runners, **{MAX_CONCURRENCY: 1000}))
+	assert all(r.status == AsyncGameResult.COMPLETED for r in results)
+	assert all(r.winner is not None or r.is_tie for r in results)
+
+def test_move_timeout(): 
+	runner = i_build(RemotePlayer, delay=10)
+	result = asyncio.run(AsyncGameRunner(runner, **{AsyncGameRunner.MOVE_TIMEOUT: 0.01}).run())
+	assert result.status == AsyncGameResult.MOVE_TIMEOUT and result.player.get_name() == 'A'
+
+def test_game_timeout(): 
+	runner = i_build(RemotePlayer, delay=0.01)
+	result = asyncio.run(AsyncGameRunner(runner, **{AsyncGameRunner.GAME_TIMEOUT: 0.025}).run())
+	assert result.status == AsyncGameResult.GAME_TIMEOUT and 0 < result.turns < 5
+
+def test_cancel_single_game(): 
+	async def scenario(): 
+		slow = AsyncGameRunner(i_build(RemotePlayer, delay=10))
+		fast = AsyncGameRunner(i_build(RemotePlayer))
+		slow.start()
+		fast.start()
+		await asyncio.sleep(0.01)
+		slow.cancel()
+		return await slow.result(), await fast.result()
+	slow_result, fast_result = asyncio.run(scenario())
+	assert slow_result.status == AsyncGameResult.CANCELLED
+	assert fast_result.status == AsyncGameResult.COMPLETED
+
+def test_outside_cancellation_is_not_swallowed(): 
+	async def scenario(): 
+		task = asyncio.ensure_future(run_games([i_build(RemotePlayer, delay=10)]))
+		await asyncio.sleep(0.01)
+		task.cancel()
+		await task
+	with pytest.raises(asyncio.CancelledError): 
+		asyncio.run(scenario())
+
+def test_blocking_players_do_not_stall_the_loop(): 
+	# Run on the loop thread, the first blocking call would wait for the others forever 
+	rendezvous = threading.Barrier(4, timeout=10)
+	runners = []
+	for _ in range(4): 
+		gb = TicTacToeGB()
+		runner = TicTacToe([BlockingPlayer('A', gb, rendezvous), BlockingPlayer('B', gb)], gb)
+		runner.setup()
+		runners.append(runner)
+	results = asyncio.run(run_games(runners))
+	assert all(r.status == AsyncGameResult.COMPLETED for r in results)
@@ -0,0 +1,17 @@
+from benchmarks.suite import BENCHMARKS, compare, run
+# pylint: disable=unused-variable
+
+def test_compare_flags_only_regressions_over_threshold(): 
+	baseline = {'full_game': {'3': 1.0, '10': 1.0}, 'ruleset_is_legal_move': {'3': 1.0}}
+	results = {'full_game': {'3': 1.2, '10': 1.3, '100': 9.0}, 'ruleset_is_legal_move': {'3': 0.5}}
+	regressions = compare(results, baseline, 0.25)
+	assert len(regressions) == 1 and regressions[0].startswith('full_game @ 10x10'), \
+		"Only 10x10 is over 25% slower, sizes missing from the baseline are skipped"
+
+def test_run_covers_requested_sizes(): 
+	results = run([3], 1, 3, only=['update_board_with_move', 'sequence_search_full'])
+	assert set(results) == {'update_board_with_move', 'sequence_search_full'}
+	assert all(results[name]['3'] > 0 for name in results)
+	assert not run([10], 1, 3, only=['sequence_search_full'])['sequence_search_full'], \
+		"Full search is skipped above the max size"
+	assert 'full_game' in BENCHMARKS
@@ -0,0 +1,46 @@
+from game.bitboard import WinMaskTable
+from game.tictactoe import TicTacToeGB, TicTacToeMove
+# pylint: disable=unused-variable
+
+def i_build_board(size, seq, **kwargs) -> TicTacToeGB: 
+	gb = TicTacToeGB(**{
+		TicTacToeGB.BOARD_SIZE_OVERRIDE: size, 
+		TicTacToeGB.SEQUENCE_NUM: seq, 
+		TicTacToeGB.BITBOARD_MODE: True, 
+	}, **kwargs)
+	gb.initialize()
+	return gb
+
+def test_win_mask_count(): 
+	assert len(WinMaskTable(3, 3).get_masks()) == 8, "Incorrect 3x3 line count"
+	assert len(WinMaskTable(4, 3).get_masks()) == 24, "Incorrect 4x4 k=3 line count"
+	assert len(WinMaskTable(2, 3).get_masks()) == 0, "Sequence cannot fit on board"
+
+def test_win_mask_table_shared(): 
+	assert WinMaskTable.for_board(5, 4) is WinMaskTable.for_board(5, 4), "Tables should be cached"
+
+def test_win_mask_has_win(): 
+	t = WinMaskTable(3, 3)
+	diagonal = t.cell_bit(0, 0) | t.cell_bit(1, 1) | t.cell_bit(2, 2)
+	assert t.has_win(diagonal), "Diagonal not detected"
+	assert t.has_win(diagonal, t.cell_index(1, 1)), "Diagonal not detected through cell"
+	assert not t.has_win(diagonal, t.cell_index(0, 1)), "No line through cell"
+	assert not t.has_win(diagonal ^ t.cell_bit(1, 1)), "Broken diagonal detected"
+
+def test_bitboard_board_detects_win(): 
+	gb = i_build_board(4, 3)
+	moves = [(0, 0, 'X'), (0, 1, 'O'), (1, 1, 'X'), (1, 2, 'O')]
+	for x, y, name in moves: 
+		res = gb.update_board_with_move(TicTacToeMove(x, y, name))
+		assert res.was_move_applied(), "Move should apply"
+		assert not res.did_move_end_game(), "Game ended early"
+	res = gb.update_board_with_move(TicTacToeMove(2, 2, 'X'))
+	assert res.game_has_winner(), "Winner not detected"
+	assert gb.is_game_complete(), "Game should be complete"
+	assert gb.get_player_bitboard('O') == (1 << 4) | (1 << 9), "Incorrect bitboard"
+
+def test_bitboard_rejects_occupied_cell(): 
+	gb = i_build_board(3, 3)
+	assert gb.update_board_with_move(TicTacToeMove(1, 1, 'X')).was_move_applied()
+	assert not gb.update_board_with_move(TicTacToeMove(1, 1, 'O')).was_move_applied()
+	assert gb.get_player_bitboard('O') == 0, "Rejected move changed bitboard"
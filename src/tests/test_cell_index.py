@@ -0,0 +1,46 @@
+import random
+from game.cell_index import IndexedCellSet
+from game.tictactoe import TicTacToeGB, TicTacToeMove
+# pylint: disable=unused-variable
+
+def test_indexed_cell_set(): 
+	cells = IndexedCellSet(6, full=True)
+	cells.remove(0)
+	cells.remove(4)
+	cells.discard(4)
+	assert len(cells) == 4 and sorted(cells) == [1, 2, 3, 5], "Incorrect members"
+	assert 4 not in cells and 5 in cells
+	cells.add(4)
+	cells.add(4)
+	assert len(cells) == 5 and sorted(cells[i] for i in range(len(cells))) == [1, 2, 3, 4, 5]
+
+def test_indexed_cell_set_restore(): 
+	cells = IndexedCellSet(6, full=True)
+	order = list(cells)
+	for cell in (1, 5, 0): 
+		slot = cells.remove(cell)
+		cells.restore(cell, slot)
+		assert list(cells) == order, "Restore should undo the remove exactly"
+	slots = [(cell, cells.remove(cell)) for cell in (2, 3)]
+	for cell, slot in reversed(slots): 
+		cells.restore(cell, slot)
+	assert list(cells) == order
+
+def test_indexed_cell_set_sample(): 
+	cells = IndexedCellSet(10)
+	assert cells.sample() is None, "Empty set has nothing to sample"
+	cells.add(7)
+	assert cells.sample(random.Random(1)) == 7
+
+def test_tie_detected(): 
+	gb = TicTacToeGB()
+	gb.initialize()
+	draw = [(0, 0, 'X'), (1, 0, 'O'), (2, 0, 'X'), (1, 1, 'O'), (0, 1, 'X'), 
+			(0, 2, 'O'), (2, 1, 'X'), (2, 2, 'O')]
+	for x, y, name in draw: 
+		assert not gb.update_board_with_move(TicTacToeMove(x, y, name)).did_move_end_game()
+	assert gb.free_cell_count() == 1 and list(gb.iter_free_cells()) == [(1, 2)]
+	assert gb.sample_free_cell() == (1, 2)
+	res = gb.update_board_with_move(TicTacToeMove(1, 2, 'X'))
+	assert res.did_move_end_game() and not res.game_has_winner(), "Tie not detected"
+	assert gb.is_game_complete() and gb.sample_free_cell() is None
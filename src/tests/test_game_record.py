@@ -0,0 +1,68 @@
+import pytest
+from game.interfaces import GameRunner, Player
+from game.game_record import FORFEIT, TIE, WIN, GameRecorder, read_games, read_header
+from game.tictactoe import StupidAI, TicTacToe, TicTacToeGB
+# pylint: disable=unused-variable
+
+def i_build(path, games, size=4, seq=3): 
+	gb = TicTacToeGB(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: size, TicTacToeGB.SEQUENCE_NUM: seq})
+	gb.initialize()
+	players = [StupidAI(**{Player.NAME: name, StupidAI.GAME_BOARD: gb, StupidAI.SEED: seed}) 
+		for seed, name in enumerate(['X', 'O'])]
+	with GameRecorder(path, gb, ['X', 'O']) as recorder: 
+		runner = TicTacToe(players, gb, **{GameRunner.RECORDER: recorder})
+		runner.setup()
+		result = runner.run_batch(games)
+		assert recorder.games_recorded() == games
+	return result
+
+def test_games_round_trip(tmp_path): 
+	path = str(tmp_path / 'games.ttt')
+	result = i_build(path, 30)
+	assert read_header(path) == (4, 3, ['X', 'O'])
+	games = list(read_games(path))
+	assert len(games) == 30
+	assert sum(len(game) for game in games) == result.total_turns
+	assert sum(1 for game in games if game.outcome == TIE) == result.ties
+	assert not any(game.outcome == FORFEIT for game in games)
+	gb = TicTacToeGB(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: 4})
+	for game in games: 
+		final = game.replay(gb)
+		assert final.is_game_complete(), "Replay should reach the recorded ending"
+		if game.outcome == WIN: 
+			assert result.wins[game.winner] > 0
+			assert list(game.iter_moves())[-1].get_name() == game.winner
+
+def test_append_and_partial_tail(tmp_path): 
+	path = str(tmp_path / 'games.ttt')
+	i_build(path, 5)
+	i_build(path, 5)
+	assert len(list(read_games(path))) == 10, "Second recorder should append"
+	with open(path, 'ab') as log: 
+		log.write(b'\x09\x00\x00\x00\x00')
+	assert len(list(read_games(path))) == 10, "Truncated trailing game is ignored"
+
+def test_rejects_mismatched_log(tmp_path): 
+	path = str(tmp_path / 'games.ttt')
+	i_build(path, 1)
+	with pytest.raises(ValueError): 
+		i_build(path, 1, size=5)
+
+def test_format_limits(tmp_path): 
+	path = str(tmp_path / 'games.ttt')
+	gb = TicTacToeGB()
+	with pytest.raises(ValueError): 
+		GameRecorder(path, gb, [f'P{i}' for i in range(256)])
+	with pytest.raises(ValueError): 
+		GameRecorder(path, gb, ['X', 'é' * 128])
+	players = [f'P{i}' for i in range(255)]
+	with GameRecorder(path, gb, players) as recorder: 
+		recorder.end_game('P254', False)
+		recorder.end_game(None, True)
+	assert [game.winner for game in read_games(path)] == ['P254', None], "High winner indices should round trip"
+	open(path, 'wb').close()
+	assert not list(read_games(path)), "An empty log holds no games"
+	i_build(path, 1)
+	with pytest.raises(ValueError): 
+		next(read_games(path)).replay(TicTacToeGB(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: 4, 
+													  TicTacToeGB.SEQUENCE_NUM: 4}))
@@ -0,0 +1,45 @@
+from game.gamerunner import GameRunner, BatchResult
+from game.interfaces import Player
+from game.tictactoe import TicTacToe, TicTacToeGB, TicTacToeMove
+from tests.mock_players import free_cell_player
+# pylint: disable=unused-variable
+
+class CornerPlayer(Player): 
+	def get_move(self): 
+		return TicTacToeMove(0, 0, self.get_name())
+
+def i_build(players_for_board, size=3): 
+	gb = TicTacToeGB(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: size})
+	runner = TicTacToe(players_for_board(gb), gb)
+	runner.setup()
+	return runner
+
+def test_run_batch_aggregates(): 
+	runner = i_build(lambda gb: [free_cell_player('A', gb, 1), free_cell_player('B', gb, 2)])
+	res = runner.run_batch(200)
+	assert res.games == 200 and res.forfeits == 0
+	assert sum(res.wins.values()) + res.ties == 200, "Every game needs an outcome"
+	assert 5 <= res.average_game_length() <= 9, "3x3 games last 5 to 9 turns"
+	assert res.games_per_second() > 0
+	assert res.wins['A'] > res.wins['B'], "First player should win more often"
+
+def test_run_batch_resets_board_in_place(): 
+	runner = i_build(lambda gb: [free_cell_player('A', gb), free_cell_player('B', gb)])
+	runner.run_batch(1)
+	runner.reset()
+	assert runner.get_game_board().free_cell_count() == 9, "Board not cleared"
+	assert not runner.is_game_finished() and runner.get_winner() is None
+	assert runner.get_turns_played() == 0
+
+def test_run_batch_records_forfeit(): 
+	runner = i_build(lambda gb: [CornerPlayer(**{Player.NAME: 'A'}), CornerPlayer(**{Player.NAME: 'B'})])
+	res = runner.run_batch(3, **{GameRunner.BATCH_RESULT: BatchResult()})
+	assert res.forfeits == 3 and res.total_turns == 3, "Occupied cell should forfeit"
+
+def test_batch_result_merge(): 
+	first, second = BatchResult(), BatchResult()
+	winner = CornerPlayer(**{Player.NAME: 'A'})
+	first.record_game(winner, False, 5)
+	second.record_game(None, True, 9)
+	first.merge(second)
+	assert first.as_dict()['wins'] == {'A': 1} and first.ties == 1 and first.average_game_length() == 7
@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+from game.mcts_player import MCTSAI, rollout
+from game.tictactoe import TicTacToe, TicTacToeGB, TicTacToeMove
+from tests.mock_players import free_cell_player
+# pylint: disable=unused-variable
+
+def i_build_board(size=3, seq=3): 
+	gb = TicTacToeGB(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: size, TicTacToeGB.SEQUENCE_NUM: seq})
+	gb.initialize()
+	return gb
+
+def i_build(gb, **kwargs): 
+	return MCTSAI('AI', gb, **{MCTSAI.TIME_BUDGET: 0.05, MCTSAI.SEED: 1, **kwargs})
+
+def test_rollout_scores(): 
+	# Only cell 2 is empty, to_move completes the top row with it 
+	to_move = 0b001_100_011
+	other = 0b110_011_000
+	assert rollout(to_move, other, 3, 3, 10, 0) == 10, "Forced win"
+	# Swapping sides, the last piece completes nothing 
+	assert rollout(other, to_move, 3, 3, 10, 0) == 5, "Forced tie"
+
+def test_takes_the_win(): 
+	gb = i_build_board()
+	for x, y, name in [(0, 0, 'AI'), (1, 0, 'O'), (0, 1, 'AI'), (1, 1, 'O')]: 
+		gb.update_board_with_move(TicTacToeMove(x, y, name))
+	m = i_build(gb).get_move()
+	assert (m.get_x(), m.get_y()) == (0, 2), "Missed the immediate win"
+
+def test_tree_is_reused_between_turns(): 
+	gb = i_build_board()
+	ai = i_build(gb)
+	m = ai.get_move()
+	gb.update_board_with_move(m)
+	first_iterations = ai.get_last_search_stats()['iterations']
+	free = next(gb.iter_free_cells())
+	gb.update_board_with_move(TicTacToeMove(free[0], free[1], 'O'))
+	ai.get_move()
+	reused = ai.get_last_search_stats()['reused_visits']
+	assert 0 < reused < first_iterations, "Subtree statistics should carry over"
+
+def test_parallel_rollouts_beat_random(): 
+	gb = TicTacToeGB()
+	with ThreadPoolExecutor(max_workers=2) as pool: 
+		ai = MCTSAI('AI', gb, **{MCTSAI.TIME_BUDGET: 0.02, MCTSAI.SEED: 4, MCTSAI.ROLLOUT_EXECUTOR: pool, 
+								 MCTSAI.ROLLOUTS_PER_LEAF: 4, MCTSAI.ROLLOUT_TASKS: 2})
+		gb.initialize()
+		ai.get_move()
+		# The last search of a game can have no leaves left to roll out, check an opening search 
+		assert ai.get_last_search_stats()['rollouts'] > 0
+		runner = TicTacToe([ai, free_cell_player('R', gb, 2)], gb)
+		runner.setup()
+		res = runner.run_batch(10)
+	assert res.wins.get('AI', 0) >= 7 and res.wins.get('R', 0) <= 1
+
+class CountingExecutor(ThreadPoolExecutor): 
+	def __init__(self): 
+		super().__init__(max_workers=2)
+		self.submitted = 0
+
+	def submit(self, *args, **kwargs): 
+		self.submitted += 1
+		return super().submit(*args, **kwargs)
+
+def test_rollouts_are_batched_per_submission(): 
+	gb = TicTacToeGB(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: 5, TicTacToeGB.SEQUENCE_NUM: 4})
+	gb.initialize()
+	with CountingExecutor() as pool: 
+		ai = MCTSAI('AI', gb, **{MCTSAI.TIME_BUDGET: 0.02, MCTSAI.SEED: 1, MCTSAI.ROLLOUT_EXECUTOR: pool, 
+								 MCTSAI.ROLLOUT_TASKS: 2, MCTSAI.LEAVES_PER_BATCH: 8})
+		ai.get_move()
+	stats = ai.get_last_search_stats()
+	assert stats['iterations'] % 8 == 0 and stats['rollouts'] == stats['iterations']
+	assert pool.submitted == 2 * stats['iterations'] // 8, "One submission per task per batch"
@@ -0,0 +1,58 @@
+from game.minimax_player import MinimaxAI
+from game.tictactoe import TicTacToe, TicTacToeGB, TicTacToeMove
+from tests.mock_players import free_cell_player
+# pylint: disable=unused-variable
+
+def i_build_board(size=3, seq=3): 
+	gb = TicTacToeGB(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: size, TicTacToeGB.SEQUENCE_NUM: seq})
+	gb.initialize()
+	return gb
+
+def i_play(gb, moves): 
+	for x, y, name in moves: 
+		gb.update_board_with_move(TicTacToeMove(x, y, name))
+
+def test_takes_the_win(): 
+	gb = i_build_board()
+	i_play(gb, [(0, 0, 'AI'), (1, 0, 'O'), (0, 1, 'AI'), (1, 1, 'O')])
+	m = MinimaxAI('AI', gb).get_move()
+	assert (m.get_x(), m.get_y()) == (0, 2), "Missed the immediate win"
+
+def test_blocks_the_threat(): 
+	gb = i_build_board()
+	i_play(gb, [(0, 0, 'O'), (1, 1, 'AI'), (0, 1, 'O')])
+	m = MinimaxAI('AI', gb).get_move()
+	assert (m.get_x(), m.get_y()) == (0, 2), "Did not block"
+
+def test_delays_a_forced_loss(): 
+	gb = i_build_board(4, 3)
+	i_play(gb, [(2, 0, 'O'), (1, 0, 'AI'), (3, 0, 'O'), (3, 3, 'AI'), (3, 2, 'O')])
+	ai = MinimaxAI('AI', gb)
+	m = ai.get_move()
+	# Every move loses, only (3, 1) stops O winning on the very next move 
+	assert (m.get_x(), m.get_y()) == (3, 1), "Gave up instead of taking the slower loss"
+	assert ai.get_last_search_stats()['depth'] >= 1
+
+def test_perfect_play_draws_itself(): 
+	gb = TicTacToeGB()
+	runner = TicTacToe([MinimaxAI('A', gb), MinimaxAI('B', gb)], gb)
+	runner.setup()
+	assert runner.run_batch(3).ties == 3, "Perfect players always draw"
+
+def test_never_loses_to_random(): 
+	gb = TicTacToeGB()
+	for seats in (('AI', 'R'), ('R', 'AI')): 
+		players = [MinimaxAI(n, gb) if n == 'AI' else free_cell_player(n, gb, 3) for n in seats]
+		runner = TicTacToe(players, gb)
+		runner.setup()
+		res = runner.run_batch(30)
+		assert res.wins.get('R', 0) == 0, "Perfect player lost a game"
+
+def test_bounded_table_and_budget_on_large_board(): 
+	gb = i_build_board(15, 5)
+	i_play(gb, [(7, 7, 'O'), (8, 8, 'AI'), (7, 8, 'O'), (6, 6, 'AI'), (7, 9, 'O')])
+	ai = MinimaxAI('AI', gb, **{MinimaxAI.TIME_BUDGET: 0.3, MinimaxAI.TABLE_SIZE: 500})
+	m = ai.get_move()
+	stats = ai.get_last_search_stats()
+	assert stats['table_entries'] <= 500 and stats['depth'] >= 2
+	assert (m.get_x(), m.get_y()) in [(7, 6), (7, 10)], "Did not answer the open three"
@@ -0,0 +1,28 @@
+from game.move_support import MoveResult
+from game.tictactoe import TicTacToeGB, TicTacToeMove
+# pylint: disable=unused-variable
+
+def test_move_result_flags(): 
+	res = MoveResult()
+	assert not hasattr(res, '__dict__'), "MoveResult should be slot based"
+	assert res.flags() == MoveResult.RETRY and res.can_retry()
+	res.set_move_was_applied()
+	assert res.was_move_applied() and not res.can_retry()
+	res.set_game_has_winner()
+	res.set_game_ended_from_move()
+	assert res.flags() == MoveResult.APPLIED | MoveResult.GAME_ENDED | MoveResult.HAS_WINNER
+
+def test_move_result_reset(): 
+	res = MoveResult()
+	res.set_game_ended_from_move()
+	assert res.reset() is res, "reset should return the same instance"
+	assert res.flags() == MoveResult.DEFAULT_FLAGS
+
+def test_board_reuses_result(): 
+	gb = TicTacToeGB()
+	gb.initialize()
+	res = MoveResult()
+	assert gb.update_board_with_move(TicTacToeMove(0, 0, 'X'), res) is res
+	assert res.was_move_applied()
+	assert gb.update_board_with_move(TicTacToeMove(0, 0, 'O'), res) is res
+	assert not res.was_move_applied() and res.can_retry(), "Stale flags left on reused result"
@@ -0,0 +1,60 @@
+import io
+import json
+from game import profiling
+from game.interfaces import GameRunner, Player
+from game.profiling import TurnProfiler
+from game.renderer import BoardRenderer
+from game.tictactoe import StupidAI, TicTacToe, TicTacToeGB, TicTacToeMove
+# pylint: disable=unused-variable
+
+class OffBoardFirstPlayer(Player): 
+	""" Plays off the board once, then a free cell """
+	def __init__(self, name, gb): 
+		super().__init__(**{Player.NAME: name})
+		self.gb = gb
+		self.misses = 0
+
+	def get_move(self): 
+		if self.misses == 0: 
+			self.misses += 1
+			return TicTacToeMove(-1, 0, self.get_name())
+		x, y = self.gb.sample_free_cell()
+		return TicTacToeMove(x, y, self.get_name())
+
+class Tenacious(TicTacToe): 
+	def get_legal_move_tenacity(self) -> int: 
+		return 2
+
+def i_build(profiler, **board_kwargs): 
+	gb = TicTacToeGB(**board_kwargs)
+	players = [OffBoardFirstPlayer('X', gb), StupidAI(**{Player.NAME: 'O', StupidAI.GAME_BOARD: gb})]
+	runner = Tenacious(players, gb, **{GameRunner.PROFILER: profiler})
+	runner.setup()
+	return runner
+
+def test_phases_and_counters(): 
+	profiler = TurnProfiler()
+	renderer = BoardRenderer(**{BoardRenderer.STREAM: io.StringIO()})
+	runner = i_build(profiler, **{TicTacToeGB.RENDERER: renderer})
+	runner.run(**{GameRunner.DISPLAY_BOARD: GameRunner.DISPLAY_BOARD_EACH_TURN})
+	turns = runner.get_turns_played()
+	assert profiler.get_counter(profiling.ILLEGAL_MOVES) == 1
+	assert profiler.get_phase(profiling.GET_MOVE).count == turns + 1
+	assert profiler.get_phase(profiling.IS_LEGAL_MOVE).count == turns + 1
+	assert profiler.get_phase(profiling.UPDATE_BOARD).count == turns
+	assert profiler.get_phase(profiling.SEQUENCE_SEARCH).count == turns
+	assert profiler.get_phase(profiling.DISPLAY).count == turns + 1
+	exported = json.loads(profiler.to_json())
+	assert exported['counters'] == {profiling.ILLEGAL_MOVES: 1}
+	assert sum(exported['phases'][profiling.GET_MOVE]['histogram_us'].values()) == turns + 1
+	assert profiling.UPDATE_BOARD in profiler.format_summary()
+
+def test_allocation_tracking(): 
+	profiler = TurnProfiler(**{TurnProfiler.TRACK_ALLOCATIONS: True})
+	try: 
+		runner = i_build(profiler)
+		runner.run_batch(3)
+		assert profiler.get_phase(profiling.UPDATE_BOARD).count > 0
+		assert isinstance(profiler.as_dict()['phases'][profiling.GET_MOVE]['alloc_bytes'], int)
+	finally: 
+		profiler.close()
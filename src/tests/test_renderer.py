@@ -0,0 +1,49 @@
+import io
+from game.interfaces import GameRunner, Player
+from game.renderer import BoardRenderer
+from game.tictactoe import StupidAI, TicTacToe, TicTacToeGB, TicTacToeMove
+# pylint: disable=unused-variable
+
+def i_build(**kwargs): 
+	stream = io.StringIO()
+	renderer = BoardRenderer(**{BoardRenderer.STREAM: stream, **kwargs})
+	gb = TicTacToeGB(**{TicTacToeGB.RENDERER: renderer})
+	gb.initialize()
+	return gb, renderer, stream
+
+def test_render_to_string(): 
+	gb, renderer, stream = i_build()
+	gb.update_board_with_move(TicTacToeMove(1, 0, 'X'))
+	gb.update_board_with_move(TicTacToeMove(2, 2, 'O'))
+	assert renderer.render_to_string() == '  | X |  \n---------\n  |   |  \n---------\n  |   | O'
+	assert stream.getvalue() == '', "Rendering to a string does no I/O"
+
+def test_ansi_redraws_only_changed_cells(): 
+	gb, renderer, stream = i_build(**{BoardRenderer.ANSI: True})
+	gb.display()
+	assert stream.getvalue().startswith(BoardRenderer.CLEAR_SCREEN), "First frame is a full draw"
+	stream.seek(0)
+	stream.truncate()
+	gb.update_board_with_move(TicTacToeMove(2, 1, 'X'))
+	gb.display()
+	assert stream.getvalue() == '\x1b[3;9HX\x1b[6;1H', "Only the new piece is drawn"
+
+def test_undo_and_wider_names(): 
+	gb, renderer, stream = i_build(**{BoardRenderer.ANSI: True})
+	gb.display()
+	gb.update_board_with_move(TicTacToeMove(0, 0, 'X'))
+	gb.undo()
+	gb.update_board_with_move(TicTacToeMove(1, 1, 'Bob'))
+	stream.seek(0)
+	stream.truncate()
+	gb.display()
+	assert stream.getvalue().startswith(BoardRenderer.CLEAR_SCREEN), "Wider cells need a full redraw"
+	assert renderer.render_to_string().splitlines()[0] == '    |     |    '
+
+def test_frame_rate_limit_keeps_final_frame(): 
+	gb, renderer, stream = i_build(**{BoardRenderer.MAX_FPS: 0.001})
+	players = [StupidAI(**{Player.NAME: name, StupidAI.GAME_BOARD: gb, StupidAI.SEED: 5}) for name in 'XO']
+	runner = TicTacToe(players, gb)
+	runner.setup()
+	runner.run(**{GameRunner.DISPLAY_BOARD: GameRunner.DISPLAY_BOARD_EACH_TURN})
+	assert renderer.frames_drawn() == 3, "First frame, the forced final frame and the closing display"
@@ -1,4 +1,5 @@
 from game.sequence_searcher import SequenceSearchInterface, SequenceSearcher
+from game.tictactoe import TicTacToeGB, TicTacToeMove
 # pylint: disable=unused-variable
 
 def i_build(size, **kwargs) -> SequenceSearchInterface: 
@@ -7,3 +8,68 @@ def i_build(size, **kwargs) -> SequenceSearchInterface:
 def test_sequence_searcher_size(): 
 	assert i_build(0).sequence_size() == 0, "Incorrect Sequence Size"
 	assert i_build(100).sequence_size() == 100, "Incorrect Sequence Size" 
+
+def i_build_board(size, seq, searcher=None):
+	kwargs = {TicTacToeGB.BOARD_SIZE_OVERRIDE: size, TicTacToeGB.SEQUENCE_NUM: seq}
+	if searcher is not None:
+		kwargs[TicTacToeGB.SEQUENCE_SEARCH_TOOL] = searcher
+	gb = TicTacToeGB(**kwargs)
+	gb.initialize()
+	return gb
+
+def i_play(gb, moves):
+	res = None
+	for x, y, name in moves:
+		res = gb.update_board_with_move(TicTacToeMove(x, y, name))
+	return res
+
+def test_local_search_finds_lines_through_last_move():
+	lines = {
+		'horizontal': [(2, 4, 'X'), (4, 4, 'X'), (5, 4, 'X'), (3, 4, 'X')],
+		'vertical': [(1, 0, 'X'), (1, 2, 'X'), (1, 3, 'X'), (1, 1, 'X')],
+		'diagonal': [(0, 0, 'X'), (2, 2, 'X'), (3, 3, 'X'), (1, 1, 'X')],
+		'anti-diagonal': [(6, 0, 'X'), (4, 2, 'X'), (3, 3, 'X'), (5, 1, 'X')],
+	}
+	for direction, moves in lines.items():
+		gb = i_build_board(7, 4)
+		assert not i_play(gb, moves[:-1]).game_has_winner(), f'Early {direction} win'
+		assert i_play(gb, moves[-1:]).game_has_winner(), f'Missed {direction} win'
+
+def test_local_search_ignores_other_players():
+	gb = i_build_board(5, 3)
+	res = i_play(gb, [(0, 0, 'X'), (1, 0, 'O'), (2, 0, 'X'), (1, 1, 'X')])
+	assert not res.game_has_winner(), 'Mixed line counted as a win'
+
+def test_full_search_matches_local_search():
+	full = i_build(3, **{SequenceSearcher.LOCAL_SEARCH_ONLY: False})
+	gb = i_build_board(5, 3, searcher=full)
+	assert not i_play(gb, [(4, 0, 'X'), (3, 1, 'X')]).game_has_winner()
+	assert i_play(gb, [(2, 2, 'X')]).game_has_winner(), 'Full search missed win'
+
+def test_disabled_directions_are_skipped():
+	searcher = i_build(3, **{SequenceSearcher.SETTING_HORIZONTAL: False,
+							 SequenceSearcher.LOCAL_SEARCH_ONLY: True})
+	gb = i_build_board(3, 3, searcher=searcher)
+	assert not i_play(gb, [(0, 0, 'X'), (1, 0, 'X'), (2, 0, 'X')]).game_has_winner()
+
+def test_full_search_over_line_views_every_direction():
+	full = i_build(4)
+	lines = {
+		'horizontal': [(2, 4, 'X'), (4, 4, 'X'), (5, 4, 'X'), (3, 4, 'X')],
+		'vertical': [(1, 0, 'X'), (1, 2, 'X'), (1, 3, 'X'), (1, 1, 'X')],
+		'diagonal': [(3, 2, 'X'), (4, 3, 'X'), (5, 4, 'X'), (6, 5, 'X')],
+		'anti-diagonal': [(6, 3, 'X'), (5, 4, 'X'), (4, 5, 'X'), (3, 6, 'X')],
+	}
+	for direction, moves in lines.items():
+		gb = i_build_board(7, 8)
+		i_play(gb, moves[:-1] + [(0, 6, 'O')])
+		assert not full.search(**{SequenceSearcher.SEARCH_GAME_BOARD: gb}), f'Early {direction} win'
+		i_play(gb, moves[-1:])
+		assert full.search(**{SequenceSearcher.SEARCH_GAME_BOARD: gb}), f'Missed {direction} win'
+
+def test_full_search_respects_disabled_directions():
+	no_rows = i_build(3, **{SequenceSearcher.SETTING_HORIZONTAL: False})
+	gb = i_build_board(4, 5)
+	i_play(gb, [(0, 1, 'X'), (1, 1, 'X'), (2, 1, 'X')])
+	assert not no_rows.search(**{SequenceSearcher.SEARCH_GAME_BOARD: gb})
+	assert i_build(3).search(**{SequenceSearcher.SEARCH_GAME_BOARD: gb})
@@ -0,0 +1,43 @@
+import pytest
+from game.solver import DRAW, LOSS, WIN, SolvedTable, TablePlayer, solve
+from game.tictactoe import TicTacToe, TicTacToeGB
+from tests.mock_players import free_cell_player
+# pylint: disable=unused-variable
+
+@pytest.fixture(scope='module')
+def i_build_table(tmp_path_factory): 
+	path = str(tmp_path_factory.mktemp('solver') / '3x3k3.ttt')
+	counts = solve(3, 3, path, workers=2)
+	return path, counts
+
+def test_solves_3x3(i_build_table): 
+	path, counts = i_build_table
+	assert sum(counts.values()) == 5478, "Every reachable 3x3 position"
+	with SolvedTable(path) as table: 
+		assert table.value(0) == DRAW, "Tic tac toe is a draw"
+		# X in a corner with O on an adjacent edge loses for O 
+		assert table.value(table.index_of(0b000_000_001, 0b000_000_010)) == WIN
+		# X holds the top row, O to move has lost 
+		assert table.value(table.index_of(0b000_000_111, 0b000_011_000)) == LOSS
+
+def test_best_move_blocks(i_build_table): 
+	path, _ = i_build_table
+	with SolvedTable(path) as table: 
+		# X threatens cell 2, O must block 
+		assert table.best_move(0b000_000_011, 0b000_010_000) == 2
+
+def test_rejects_other_files(tmp_path): 
+	path = tmp_path / 'junk.ttt'
+	path.write_bytes(b'\0' * 64)
+	with pytest.raises(ValueError): 
+		SolvedTable(str(path))
+
+def test_table_player_never_loses(i_build_table): 
+	path, _ = i_build_table
+	with SolvedTable(path) as table: 
+		gb = TicTacToeGB()
+		runner = TicTacToe([TablePlayer('Table', gb, table), free_cell_player('Random', gb, 3)], gb)
+		runner.setup()
+		result = runner.run_batch(50)
+		assert result.wins.get('Random', 0) == 0
+		assert result.forfeits == 0
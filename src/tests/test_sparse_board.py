@@ -0,0 +1,72 @@
+import itertools
+import pytest
+from game.sequence_searcher import SequenceSearcher
+from game.sparse_board import SparseGB
+from game.tictactoe import TicTacToeMove
+# pylint: disable=unused-variable
+
+def i_build(**kwargs) -> SparseGB: 
+	gb = SparseGB(**kwargs)
+	gb.initialize()
+	return gb
+
+def test_far_apart_moves_use_no_dense_storage(): 
+	gb = i_build()
+	for x, y in [(0, 0), (10**9, -10**9), (-5, 3)]: 
+		assert gb.update_board_with_move(TicTacToeMove(x, y, 'X')).was_move_applied()
+	assert gb.get_occupied_count() == 3, "Incorrect occupied count"
+	assert gb.get_bounds() == (-5, -10**9, 10**9, 3), "Incorrect bounds"
+	assert len(list(gb)) == 3, "Iteration should only visit occupied cells"
+
+def test_occupied_cell_rejected(): 
+	gb = i_build()
+	assert gb.update_board_with_move(TicTacToeMove(-2, 4, 'X')).was_move_applied()
+	assert not gb.update_board_with_move(TicTacToeMove(-2, 4, 'O')).was_move_applied()
+	assert gb.get_occupant(-2, 4) == 'X'
+
+def test_five_in_a_row_across_origin(): 
+	gb = i_build()
+	for x in (-2, -1, 1, 2): 
+		assert not gb.update_board_with_move(TicTacToeMove(x, -x, 'X')).game_has_winner()
+	res = gb.update_board_with_move(TicTacToeMove(0, 0, 'X'))
+	assert res.game_has_winner() and gb.is_game_complete(), "Anti-diagonal win missed"
+
+def test_board_hash_ignores_move_order(): 
+	a = i_build()
+	b = i_build()
+	for x, y, name in [(0, 0, 'X'), (5, -3, 'O'), (1, 1, 'X')]: 
+		a.update_board_with_move(TicTacToeMove(x, y, name))
+	for x, y, name in [(1, 1, 'X'), (0, 0, 'X'), (5, -3, 'O')]: 
+		b.update_board_with_move(TicTacToeMove(x, y, name))
+	assert a.board_hash() == b.board_hash(), "Same pieces, same hash"
+	b.update_board_with_move(TicTacToeMove(2, 2, 'O'))
+	assert a.board_hash() != b.board_hash()
+
+def test_full_search_visits_occupied_cells(): 
+	searcher = SequenceSearcher(3, **{SequenceSearcher.LOCAL_SEARCH_ONLY: False})
+	gb = i_build(**{SparseGB.SEQUENCE_NUM: 3, SparseGB.SEQUENCE_SEARCH_TOOL: searcher})
+	for y in (7, 8): 
+		assert not gb.update_board_with_move(TicTacToeMove(100, y, 'O')).game_has_winner()
+	assert gb.update_board_with_move(TicTacToeMove(100, 9, 'O')).game_has_winner()
+
+def test_frontier(): 
+	gb = i_build()
+	gb.update_board_with_move(TicTacToeMove(0, 0, 'X'))
+	assert len(gb.get_frontier()) == 8, "Single piece has 8 empty neighbours"
+	gb.update_board_with_move(TicTacToeMove(1, 0, 'O'))
+	assert (1, 0) not in gb.get_frontier() and len(gb.get_frontier()) == 10
+
+def test_candidate_moves_follow_the_frontier(): 
+	gb = i_build()
+	assert [(m.get_x(), m.get_y()) for m in gb.iter_candidate_moves('X')] == [(0, 0)], "Empty board starts at the origin"
+	gb.update_board_with_move(TicTacToeMove(0, 0, 'X'))
+	assert {(m.get_x(), m.get_y()) for m in gb.iter_candidate_moves('O')} == gb.get_frontier()
+
+def test_legal_moves_cover_every_empty_cell(): 
+	gb = i_build()
+	gb.update_board_with_move(TicTacToeMove(0, 0, 'X'))
+	gb.update_board_with_move(TicTacToeMove(2, -1, 'O'))
+	first = [(m.get_x(), m.get_y()) for m in itertools.islice(gb.iter_legal_moves('X'), 23)]
+	assert set(first) == {(x, y) for x in range(-2, 3) for y in range(-2, 3)} - {(0, 0), (2, -1)}
+	with pytest.raises(ValueError): 
+		gb.get_board_ruleset().get_legal_moves(gb, 'X')
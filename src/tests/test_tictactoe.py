@@ -0,0 +1,221 @@
+import random
+import pytest
+from game.move_support import Move
+from game.gameboard import GameBoard
+from game.interfaces import Player
+from game.tictactoe import StupidAI, TicTacToe, TicTacToeGB, TicTacToeMove, TicTacToeRuleset, ValidatedMove
+# pylint: disable=unused-variable
+
+class DictMove(Move): 
+	pass
+
+def i_build_board(**kwargs): 
+	gb = TicTacToeGB(**kwargs)
+	gb.initialize()
+	return gb
+
+def i_play(gb, moves): 
+	for x, y, name in moves: 
+		gb.update_board_with_move(TicTacToeMove(x, y, name))
+
+def test_move_is_slot_based(): 
+	m = TicTacToeMove(1, 2, 'X')
+	assert not hasattr(m, '__dict__'), "TicTacToeMove should not carry a dict"
+	assert m.raw() == {TicTacToeMove.X_POS: 1, TicTacToeMove.Y_POS: 2, TicTacToeMove.NAME: 'X'}
+
+def test_from_raw_does_not_rewrap(): 
+	m = TicTacToeMove(0, 1, 'O')
+	assert TicTacToeMove.from_raw(m) is m, "TicTacToeMove should be returned as is"
+	other = DictMove(**m.raw())
+	converted = TicTacToeMove.from_raw(other)
+	assert (converted.get_x(), converted.get_y(), converted.get_name()) == (0, 1, 'O')
+
+def test_move_add(): 
+	m = TicTacToeMove(0, 0, 'O')
+	m.add(TicTacToeMove.Y_POS, 2)
+	assert m.get_y() == 2
+	with pytest.raises(KeyError): 
+		m.add('Unknown', 1)
+
+def test_ruleset_accepts_generic_moves(): 
+	rules = TicTacToeRuleset(3)
+	assert rules.is_legal_move(DictMove(**TicTacToeMove(2, 2, 'X').raw()))
+	assert not rules.is_legal_move(TicTacToeMove(3, 0, 'X')), "Out of bounds move"
+	assert not rules.is_legal_move(TicTacToeMove(0, 0, '')), "Missing name"
+
+def test_board_hash_depends_on_position_not_order(): 
+	a = i_build_board()
+	b = i_build_board()
+	empty = a.board_hash()
+	i_play(a, [(0, 0, 'X'), (1, 1, 'O'), (2, 2, 'X')])
+	i_play(b, [(2, 2, 'X'), (1, 1, 'O'), (0, 0, 'X')])
+	assert a.board_hash() == b.board_hash(), "Same pieces, same hash"
+	assert a.board_hash() != empty
+	i_play(b, [(0, 1, 'O')])
+	assert a.board_hash() != b.board_hash()
+	b.reset()
+	assert b.board_hash() == empty, "Reset clears the hash"
+
+def test_board_hash_seeded(): 
+	a = i_build_board()
+	b = i_build_board(**{TicTacToeGB.ZOBRIST_SEED: 7})
+	i_play(a, [(0, 0, 'X')])
+	i_play(b, [(0, 0, 'X')])
+	assert a.board_hash() != b.board_hash(), "Different seeds, different keys"
+
+def test_default_board_hash_walks_the_board(): 
+	a = i_build_board()
+	b = i_build_board()
+	i_play(a, [(0, 0, 'X'), (1, 1, 'O')])
+	i_play(b, [(1, 1, 'O'), (0, 0, 'X')])
+	assert GameBoard.board_hash(a) == GameBoard.board_hash(b)
+	i_play(b, [(2, 1, 'X')])
+	assert GameBoard.board_hash(a) != GameBoard.board_hash(b)
+
+def test_stupid_ai_without_board_never_repeats(): 
+	ai = StupidAI(**{StupidAI.BOARD_SIZE: 5, StupidAI.SEED: 1})
+	assert ai.get_name().startswith('Ai-Player-')
+	cells = {(m.get_x(), m.get_y()) for m in (ai.get_move() for _ in range(25))}
+	assert len(cells) == 25, "Every cell exactly once"
+	with pytest.raises(RuntimeError): 
+		ai.get_move()
+	ai.initialize()
+	assert ai.get_move() is not None
+
+def test_stupid_ai_skips_opponent_cells(): 
+	gb = i_build_board(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: 4})
+	i_play(gb, [(x, 0, 'O') for x in range(4)] + [(x, 1, 'O') for x in range(3)])
+	ai = StupidAI(**{Player.NAME: 'X', StupidAI.GAME_BOARD: gb, StupidAI.SEED: 2})
+	for _ in range(20): 
+		m = ai.get_move()
+		assert m.get_name() == 'X'
+		assert (m.get_x(), m.get_y()) not in {(x, 0) for x in range(4)} | {(x, 1) for x in range(3)}
+
+def test_stupid_ai_games_finish(): 
+	gb = i_build_board(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: 6, TicTacToeGB.SEQUENCE_NUM: 4})
+	players = [StupidAI(**{Player.NAME: name, StupidAI.GAME_BOARD: gb, StupidAI.SEED: seed}) 
+		for seed, name in enumerate('XO')]
+	runner = TicTacToe(players, gb)
+	runner.setup()
+	result = runner.run_batch(20)
+	assert result.forfeits == 0
+	assert result.games == 20
+
+def test_legal_moves_skip_occupied_cells(): 
+	gb = i_build_board()
+	i_play(gb, [(0, 0, 'X'), (1, 1, 'O')])
+	moves = gb.iter_legal_moves('X')
+	assert not isinstance(moves, list), "Moves should be generated lazily"
+	cells = {(m.get_x(), m.get_y()) for m in moves}
+	assert len(cells) == 7 and (0, 0) not in cells and (1, 1) not in cells
+	rules = gb.get_board_ruleset()
+	assert {(m.get_x(), m.get_y()) for m in rules.get_legal_moves(gb, 'X')} == cells, "Bulk answer should match"
+	assert not rules.get_legal_moves(gb, '')
+
+def test_no_legal_moves_after_a_win(): 
+	gb = i_build_board()
+	i_play(gb, [(0, 0, 'X'), (0, 1, 'O'), (1, 0, 'X'), (1, 1, 'O'), (2, 0, 'X')])
+	assert gb.is_game_complete()
+	assert not list(gb.iter_legal_moves('O'))
+
+@pytest.mark.parametrize('bitboard', [False, True])
+def test_undo_restores_the_position(bitboard): 
+	gb = i_build_board(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: 5, TicTacToeGB.SEQUENCE_NUM: 4, 
+		TicTacToeGB.BITBOARD_MODE: bitboard})
+	rng = random.Random(4)
+	snapshots = []
+	names = 'XO'
+	while not gb.is_game_complete(): 
+		snapshots.append((gb.get_cells(), gb.board_hash(), gb.free_cell_count(), gb.get_player_bitboard('X')))
+		x, y = gb.sample_free_cell(rng)
+		assert gb.apply(TicTacToeMove(x, y, names[len(snapshots) % 2])).was_move_applied()
+	assert gb.undo_depth() == len(snapshots)
+	while snapshots: 
+		gb.undo()
+		assert not gb.is_game_complete(), "Undo should reopen the game"
+		assert (gb.get_cells(), gb.board_hash(), gb.free_cell_count(), gb.get_player_bitboard('X')) == snapshots.pop()
+	with pytest.raises(IndexError): 
+		gb.undo()
+
+def test_undo_inside_legal_move_loop(): 
+	gb = i_build_board()
+	i_play(gb, [(1, 1, 'X')])
+	seen = []
+	for move in gb.iter_legal_moves('O'): 
+		seen.append((move.get_x(), move.get_y()))
+		gb.apply(move)
+		for reply in list(gb.iter_legal_moves('X'))[:2]: 
+			gb.apply(reply)
+			gb.undo()
+		gb.undo()
+	assert len(seen) == 8 and len(set(seen)) == 8, "Every free cell should be yielded exactly once"
+
+def test_undo_then_replay_finds_the_win(): 
+	gb = i_build_board(**{TicTacToeGB.BITBOARD_MODE: True})
+	i_play(gb, [(0, 0, 'X'), (0, 1, 'O'), (1, 0, 'X'), (1, 1, 'O')])
+	assert gb.apply(TicTacToeMove(2, 0, 'X')).game_has_winner()
+	gb.undo()
+	assert not gb.apply(TicTacToeMove(2, 2, 'X')).game_has_winner()
+	gb.undo()
+	assert gb.apply(TicTacToeMove(2, 1, 'O')).game_has_winner()
+
+def test_validated_moves_are_not_checked_again(): 
+	gb = i_build_board()
+	rules = gb.get_board_ruleset()
+	checked = rules.validate(DictMove(**TicTacToeMove(1, 2, 'X').raw()))
+	assert isinstance(checked, ValidatedMove) and checked.get_checker() is rules
+	assert rules.validate(TicTacToeMove(3, 0, 'X')) is None
+	assert rules.validate(TicTacToeMove(0, 0, '')) is None
+	def fail(move): 
+		raise AssertionError('Validated move was checked again')
+	rules.is_legal_move = fail
+	assert gb.update_board_with_move(checked).was_move_applied()
+	# A move checked by another ruleset is checked by the board 
+	with pytest.raises(AssertionError): 
+		gb.update_board_with_move(TicTacToeRuleset(3).validate(TicTacToeMove(0, 0, 'O')))
+
+def test_validate_marks_moves_in_place(): 
+	gb = i_build_board()
+	rules = gb.get_board_ruleset()
+	move = TicTacToeMove(1, 1, 'X')
+	assert rules.validate(move) is move, "TicTacToeMoves should not be copied"
+	assert move.get_checker() is rules
+	move.add(TicTacToeMove.X_POS, -1)
+	assert move.get_checker() is None, "Changing a checked move should clear the mark"
+	with pytest.raises(AssertionError): 
+		gb.update_board_with_move(move)
+	copied = rules.validate(DictMove(**TicTacToeMove(0, 0, 'O').raw()))
+	with pytest.raises(TypeError): 
+		copied.add(TicTacToeMove.X_POS, -1)
+
+def test_is_legal_batch(): 
+	gb = i_build_board(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: 4})
+	i_play(gb, [(1, 1, 'X'), (3, 0, 'O')])
+	rules = gb.get_board_ruleset()
+	xs = [0, 1, 3, 4, -1, 3]
+	ys = [0, 1, 0, 0, 2, 3]
+	assert rules.is_legal_batch(xs, ys).tolist() == [True, True, True, False, False, True]
+	assert rules.is_legal_batch(xs, ys, gb).tolist() == [True, False, False, False, False, True]
+
+def test_iteration_is_reentrant(): 
+	gb = i_build_board()
+	pairs = [(a.get_x(), b.get_x()) for a in gb for b in gb]
+	assert len(pairs) == 81, "Nested iteration should visit every pair of cells"
+
+def test_line_views_track_the_board(): 
+	gb = i_build_board(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: 4})
+	row = gb.row_view(1)
+	i_play(gb, [(0, 1, 'X'), (2, 1, 'O'), (3, 0, 'X'), (1, 2, 'O')])
+	x, o = gb.get_player_id('X'), gb.get_player_id('O')
+	assert gb.get_player_name(x) == 'X' and gb.get_player_id('Nobody') == 0
+	assert list(row) == [x, 0, o, 0], "Views are live, not copies"
+	assert list(gb.column_view(1)) == [0, 0, o, 0]
+	assert list(gb.diagonal_view(1, 2)) == [x, o, 0]
+	assert list(gb.anti_diagonal_view(2, 1)) == [x, o, o, 0]
+	assert list(gb.anti_diagonal_view(0, 0)) == [0]
+	with pytest.raises(TypeError): 
+		row[0] = o
+	gb.reset()
+	assert list(row) == [0, 0, 0, 0]
+	assert len(list(gb.iter_line_views())) == 4 + 4 + 7 + 7
+	assert sum(1 for _ in gb.iter_line_views(3)) == 4 + 4 + 3 + 3
@@ -0,0 +1,111 @@
+import pytest
+from game.mcts_player import MCTSAI
+from game.sequence_searcher import SequenceSearcher
+from game.tictactoe import TicTacToeGB, TicTacToeLocation, TicTacToeMove
+from game.topology import Topology, _cached_topology
+from game.vectorized_searcher import NumpySequenceSearcher
+# pylint: disable=unused-variable
+
+def i_build_board(size, seq, topology, **kwargs) -> TicTacToeGB:
+	gb = TicTacToeGB(**{
+		TicTacToeGB.BOARD_SIZE_OVERRIDE: size,
+		TicTacToeGB.SEQUENCE_NUM: seq,
+		TicTacToeGB.TOPOLOGY: topology,
+	}, **kwargs)
+	gb.initialize()
+	return gb
+
+def i_play(gb, moves):
+	res = None
+	for x, y, name in moves:
+		res = gb.update_board_with_move(TicTacToeMove(x, y, name))
+	return res
+
+def test_topology_shared_per_shape():
+	assert Topology.for_shape(Topology.HEX, 4, 3) is Topology.for_shape(Topology.HEX, 4, 3), "Index should be cached"
+	assert Topology.for_shape(Topology.HEX, 4, 3) is not Topology.for_shape(Topology.TOROIDAL, 4, 3)
+	with pytest.raises(ValueError):
+		Topology('Moebius', 3, 3)
+
+def test_topology_cache_is_bounded():
+	limit = _cached_topology.cache_info().maxsize
+	assert limit is not None, "Indexes of every shape ever used should not be kept"
+	for size in range(1, limit + 5):
+		Topology.for_shape(Topology.RECTANGULAR, size, size)
+	assert _cached_topology.cache_info().currsize == limit
+
+def test_topology_neighbour_counts():
+	rectangle = Topology(Topology.RECTANGULAR, 4, 3)
+	assert [rectangle.neighbour_count(cell) for cell in (0, 1, 5)] == [3, 5, 8], "Corner, edge, inner"
+	assert sorted(rectangle.neighbours(0)) == [1, 4, 5]
+	torus = Topology(Topology.TOROIDAL, 4, 3)
+	assert all(torus.neighbour_count(cell) == 8 for cell in range(12)), "Torus cells all have 8 neighbours"
+	assert sorted(torus.neighbours(0)) == [1, 3, 4, 5, 7, 8, 9, 11]
+	hexagon = Topology(Topology.HEX, 3, 3)
+	assert hexagon.neighbour_count(4) == 6 and len(hexagon.axes()) == 3
+	assert sorted(hexagon.neighbours(0)) == [1, 3], "Axial corner (0, 0)"
+	assert sorted(hexagon.neighbours(2)) == [1, 4, 5], "Axial corner (2, 0) touches (1, 1)"
+	assert sorted(Topology(Topology.TOROIDAL, 2, 1).neighbours(0)) == [1], "Wrapped duplicates dropped"
+
+def test_topology_step_tables():
+	rectangle = Topology(Topology.RECTANGULAR, 3, 3)
+	right = rectangle.directions().index((1, 0))
+	assert list(rectangle.step_table(right)) == [1, 2, -1, 4, 5, -1, 7, 8, -1]
+	torus = Topology(Topology.TOROIDAL, 3, 3)
+	assert list(torus.step_table(right)) == [1, 2, 0, 4, 5, 3, 7, 8, 6]
+	for forward, backward in torus.axes():
+		dx, dy = torus.directions()[forward]
+		assert torus.directions()[backward] == (-dx, -dy), "Axis directions should be opposite"
+
+def test_board_surrounding_locations_from_index():
+	gb = i_build_board(3, 3, Topology.TOROIDAL)
+	i_play(gb, [(2, 2, 'X')])
+	around = gb._get_surrounding_locations(TicTacToeLocation(0, 0, None))
+	assert len(around) == 8, "Corner wraps to all 8 neighbours"
+	assert {(spot.get_x(), spot.get_y()): spot.get_occupant() for spot in around}[(2, 2)] == 'X'
+	corner = i_build_board(3, 3, Topology.RECTANGULAR)._get_surrounding_locations(TicTacToeLocation(0, 0, None))
+	assert sorted((spot.get_x(), spot.get_y()) for spot in corner) == [(0, 1), (1, 0), (1, 1)]
+
+def test_toroidal_board_wins_across_the_edge():
+	gb = i_build_board(4, 3, Topology.TOROIDAL)
+	res = i_play(gb, [(3, 1, 'X'), (1, 3, 'O'), (0, 1, 'X'), (2, 3, 'O'), (1, 1, 'X')])
+	assert res.game_has_winner(), "Row wrapping from x = 3 to x = 1 should win"
+	flat = i_build_board(4, 3, Topology.RECTANGULAR)
+	res = i_play(flat, [(3, 1, 'X'), (1, 3, 'O'), (0, 1, 'X'), (2, 3, 'O'), (1, 1, 'X')])
+	assert not res.game_has_winner(), "Rectangular boards do not wrap"
+
+def test_hex_board_lines():
+	gb = i_build_board(4, 3, Topology.HEX)
+	res = i_play(gb, [(0, 0, 'X'), (3, 3, 'O'), (1, 1, 'X'), (3, 2, 'O'), (2, 2, 'X')])
+	assert not res.game_has_winner(), "(1, 1) is not a hex axis"
+	res = i_play(gb, [(1, 3, 'O'), (3, 0, 'X'), (2, 3, 'O'), (2, 1, 'X'), (0, 2, 'O'), (1, 2, 'X')])
+	assert res.game_has_winner(), "(3, 0) (2, 1) (1, 2) lie on the (-1, 1) hex axis"
+
+def test_full_search_uses_topology():
+	gb = i_build_board(4, 5, Topology.HEX)
+	i_play(gb, [(3, 0, 'X'), (2, 1, 'X'), (1, 2, 'X')])
+	searcher = SequenceSearcher(3)
+	assert searcher.search(**{SequenceSearcher.SEARCH_GAME_BOARD: gb}), "Hex (-1, 1) line not found"
+	no_diagonals = SequenceSearcher(3, **{SequenceSearcher.SETTING_DIAGONALS: False})
+	assert not no_diagonals.search(**{SequenceSearcher.SEARCH_GAME_BOARD: gb})
+
+def test_board_topology_limits():
+	with pytest.raises(ValueError):
+		TicTacToeGB(**{TicTacToeGB.TOPOLOGY: Topology.HEX, TicTacToeGB.BITBOARD_MODE: True})
+	with pytest.raises(ValueError):
+		TicTacToeGB(**{TicTacToeGB.TOPOLOGY: Topology.TOROIDAL, TicTacToeGB.BOARD_SIZE_OVERRIDE: 3,
+					   TicTacToeGB.SEQUENCE_NUM: 4})
+
+def test_numpy_searcher_follows_topology():
+	hexagon = i_build_board(4, 3, Topology.HEX, **{TicTacToeGB.SEQUENCE_SEARCH_TOOL: NumpySequenceSearcher(3)})
+	res = i_play(hexagon, [(0, 0, 'X'), (1, 1, 'X'), (2, 2, 'X')])
+	assert not res.game_has_winner(), "(1, 1) is not a hex axis"
+	res = i_play(hexagon, [(3, 0, 'X'), (2, 1, 'X'), (1, 2, 'X')])
+	assert res.game_has_winner(), "Hex (-1, 1) line not found"
+	torus = i_build_board(4, 3, Topology.TOROIDAL, **{TicTacToeGB.SEQUENCE_SEARCH_TOOL: NumpySequenceSearcher(3)})
+	res = i_play(torus, [(3, 1, 'X'), (0, 1, 'X'), (1, 1, 'X')])
+	assert res.game_has_winner(), "Row wrapping from x = 3 to x = 1 should win"
+
+def test_mcts_rejects_other_topologies():
+	with pytest.raises(ValueError):
+		MCTSAI('X', i_build_board(3, 3, Topology.HEX))
@@ -0,0 +1,66 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from game.interfaces import Player
+from game.tictactoe import StupidAI, TicTacToeGB, TicTacToeMove
+from game.tournament import Tournament, PlayerSpec, BoardConfig, play_task
+from tests.mock_players import free_cell_player
+# pylint: disable=unused-variable
+
+class CenterFirstPlayer(StupidAI): 
+	def __init__(self, name, gb, seed): 
+		super().__init__(**{Player.NAME: name, StupidAI.GAME_BOARD: gb, StupidAI.SEED: seed})
+		self.gb = gb
+
+	def get_move(self): 
+		center = self.gb.get_board_size() // 2
+		if (center, center) in set(self.gb.iter_free_cells()): 
+			return TicTacToeMove(center, center, self.get_name())
+		return super().get_move()
+
+def broken_factory(name, gb, seed): 
+	raise ValueError('Cannot build player')
+
+def crashing_factory(name, gb, seed): 
+	os._exit(1)
+
+BOARDS = [BoardConfig('3x3'), BoardConfig('4x4k3', {TicTacToeGB.BOARD_SIZE_OVERRIDE: 4})]
+
+def i_build(players, games=20, **kwargs): 
+	return Tournament(players, BOARDS, games, **{Tournament.MAX_WORKERS: 2, **kwargs})
+
+def test_schedule_covers_pairings_and_seats(): 
+	players = [PlayerSpec(l, free_cell_player) for l in ('a', 'b', 'c')]
+	tasks = i_build(players, games=25, **{Tournament.CHUNK_SIZE: 10}).tasks()
+	assert len(tasks) == 2 * 6 * 3, "boards * ordered pairings * chunks"
+	assert sum(t.num_games for t in tasks) == 2 * 6 * 25
+	again = i_build(players, games=25, **{Tournament.CHUNK_SIZE: 10}).tasks()
+	assert [t.seed for t in tasks] == [t.seed for t in again], "Seeds must be deterministic"
+	assert len({t.seed for t in tasks}) == len(tasks)
+
+def test_deterministic_task_result(): 
+	task = i_build([PlayerSpec('a', free_cell_player), PlayerSpec('b', free_cell_player)]).tasks()[0]
+	first, second = play_task(task), play_task(task)
+	assert first.error is None and first.result.as_dict()['wins'] == second.result.as_dict()['wins']
+
+def test_process_pool_standings(): 
+	players = [PlayerSpec('random', free_cell_player), PlayerSpec('center', CenterFirstPlayer)]
+	standings = i_build(players, games=100, **{Tournament.CHUNK_SIZE: 30}).run()
+	rows = standings.rows()
+	assert not standings.errors
+	assert [r['games'] for r in rows] == [400, 400], "2 boards * 2 seat orders * 100 games"
+	assert rows[0]['label'] == 'center', "Center first should outscore random"
+	assert 'center' in standings.format_table()
+
+def test_errors_are_isolated(): 
+	players = [PlayerSpec('ok', free_cell_player), PlayerSpec('broken', broken_factory)]
+	standings = i_build(players, **{Tournament.EXECUTOR_FACTORY: ThreadPoolExecutor}).run()
+	assert len(standings.errors) == 4 and 'Cannot build player' in standings.errors[0].error
+
+def test_crashed_worker_is_isolated(): 
+	players = [PlayerSpec('ok', free_cell_player), PlayerSpec('other', free_cell_player), 
+			   PlayerSpec('crash', crashing_factory)]
+	standings = i_build(players, games=5).run()
+	crashed = {tuple(s.label for s in e.task.seats) for e in standings.errors}
+	assert len(standings.errors) == 2 * 4, "Every task seating the crashing player fails"
+	assert all('crash' in labels for labels in crashed), "Only tasks with the crashing player fail"
+	assert {r['label']: r['games'] for r in standings.rows()}['ok'] == 2 * 2 * 5
@@ -0,0 +1,87 @@
+import numpy as np
+from game.sequence_searcher import SequenceSearcher
+from game.tictactoe import TicTacToeGB, TicTacToeMove
+from game.vectorized_searcher import NumpySequenceSearcher, board_to_array, sequence_starts, \
+	batch_find_winners, stack_boards, \
+	STEP_HORIZONTAL, STEP_ANTI_DIAGONAL
+# pylint: disable=unused-variable
+
+def i_build(size, **kwargs) -> NumpySequenceSearcher: 
+	return NumpySequenceSearcher(size, **kwargs)
+
+def i_search(searcher, array) -> bool: 
+	return searcher.search(**{NumpySequenceSearcher.SEARCH_ARRAY: np.asarray(array)})
+
+def test_board_to_array(): 
+	array, ids = board_to_array([['X', None], [None, 'O']], {'O': 7})
+	assert ids == {'O': 7, 'X': 8}, "Incorrect id assignment"
+	assert array.tolist() == [[8, 0], [0, 7]], "Incorrect conversion"
+
+def test_sequence_starts(): 
+	array = np.array([[1, 1, 1, 0], [2, 2, 0, 2], [0, 0, 0, 0]])
+	starts = sequence_starts(array, 3, STEP_HORIZONTAL)
+	assert starts.tolist()[0] == [True, False, False, False], "Run start not found"
+	assert not starts[1:].any(), "Broken or empty run counted"
+
+def test_all_directions(): 
+	searcher = i_build(3)
+	empty = np.zeros((5, 5), dtype=np.int32)
+	assert not i_search(searcher, empty), "Empty board has no sequence"
+	for cells in ([(0, 1), (0, 2), (0, 3)], [(1, 4), (2, 4), (3, 4)], 
+				  [(2, 2), (3, 3), (4, 4)], [(0, 4), (1, 3), (2, 2)]): 
+		array = empty.copy()
+		for y, x in cells: 
+			array[y, x] = 1
+		assert i_search(searcher, array), f"Sequence {cells} missed"
+		array[cells[1]] = 2
+		assert not i_search(searcher, array), f"Mixed sequence {cells} counted"
+
+def test_disabled_directions(): 
+	searcher = i_build(3, **{SequenceSearcher.SETTING_DIAGONALS: False})
+	assert STEP_ANTI_DIAGONAL not in searcher.search_steps()
+	assert not i_search(searcher, np.eye(3, dtype=np.int32)), "Diagonal should be skipped"
+
+def test_find_winners(): 
+	array = np.array([[1, 1, 1, 1], [2, 0, 0, 0], [2, 0, 0, 0], [2, 0, 0, 0]])
+	assert i_build(3).find_winners(array) == {1, 2}
+	assert i_build(4).find_winners(array) == {1}
+
+def test_matches_scalar_on_board(): 
+	gb = TicTacToeGB(**{TicTacToeGB.BOARD_SIZE_OVERRIDE: 6, TicTacToeGB.SEQUENCE_NUM: 7})
+	gb.initialize()
+	board_kwargs = {SequenceSearcher.SEARCH_GAME_BOARD: gb}
+	for x, y in [(5, 0), (4, 1), (3, 2)]: 
+		gb.update_board_with_move(TicTacToeMove(x, y, 'X'))
+	for length, expected in [(3, True), (4, False)]: 
+		scalar = SequenceSearcher(length).search(**board_kwargs)
+		vectorized = i_build(length).search(**board_kwargs)
+		assert scalar == vectorized == expected, f"Engines disagree for length {length}"
+
+def test_batch_find_winners(): 
+	boards = np.zeros((4, 3, 3), dtype=np.int32)
+	boards[0, 1, :] = 2
+	boards[1] = [[1, 2, 1], [1, 2, 2], [2, 1, 1]]
+	boards[2, :, 0] = 1
+	boards[3, 0, 0] = 1
+	winners, ties = batch_find_winners(boards, 3)
+	assert winners.tolist() == [2, 0, 1, 0], "Incorrect winners"
+	assert ties.tolist() == [False, True, False, False], "Incorrect ties"
+
+def test_batch_matches_single_board_search(): 
+	rng = np.random.default_rng(5)
+	boards = rng.integers(0, 3, size=(200, 5, 5), dtype=np.int32)
+	searcher = i_build(4)
+	winners, _ = searcher.find_batch_winners(boards)
+	for board, winner in zip(boards, winners): 
+		assert (winner != 0) == i_search(searcher, board), "Batch disagrees with search"
+
+def test_stack_boards(): 
+	boards = []
+	for name in ('X', 'O'): 
+		gb = TicTacToeGB()
+		gb.initialize()
+		gb.update_board_with_move(TicTacToeMove(1, 2, name))
+		boards.append(gb)
+	stacked, ids = stack_boards(boards)
+	assert stacked.shape == (2, 3, 3), "Incorrect stack shape"
+	assert stacked[0, 2, 1] == ids['X'] and stacked[1, 2, 1] == ids['O'], "Incorrect stack ids"